@@ -1,5 +1,7 @@
 import re
-from typing import List, Dict, Optional, Set
+import sys
+from functools import lru_cache
+from typing import Any, List, Dict, FrozenSet, Optional, Set, Tuple
 from difflib import SequenceMatcher
 
 
@@ -88,6 +90,14 @@ KEYWORD_CONTEXT_SIGNALS = {
 # Token cache for performance
 _token_cache: Dict[str, Set[str]] = {}
 
+# Precompiled normalization patterns (_normalize runs per keyword and per bullet)
+_JS_SUFFIX_RE = re.compile(r"([a-z]+)\.js")
+_NET_SUFFIX_RE = re.compile(r"([a-z]+)\.net")
+_PY_SUFFIX_RE = re.compile(r"([a-z]+)\.py")
+_NORM_NONWORD_RE = re.compile(r"[^a-z0-9+.#]")
+_NORM_WS_RE = re.compile(r"\s+")
+
+
 def _normalize(text: str) -> str:
     """
     Normalize text for matching:
@@ -99,15 +109,15 @@ def _normalize(text: str) -> str:
     text = text.lower()
     
     # Handle common framework/library variations
-    text = re.sub(r"([a-z]+)\.js", r"\1js", text)  # react.js → reactjs
-    text = re.sub(r"([a-z]+)\.net", r"\1net", text)  # asp.net → aspnet
-    text = re.sub(r"([a-z]+)\.py", r"\1py", text)  # django.py → djangopy (edge case)
+    text = _JS_SUFFIX_RE.sub(r"\1js", text)  # react.js → reactjs
+    text = _NET_SUFFIX_RE.sub(r"\1net", text)  # asp.net → aspnet
+    text = _PY_SUFFIX_RE.sub(r"\1py", text)  # django.py → djangopy (edge case)
     
     # Remove special chars except alphanumeric, +, #, .
-    text = re.sub(r"[^a-z0-9+.#]", " ", text)
+    text = _NORM_NONWORD_RE.sub(" ", text)
     
     # Normalize whitespace
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _NORM_WS_RE.sub(" ", text).strip()
     
     return text
 
@@ -126,7 +136,7 @@ def _tokenize(text: str, use_cache: bool = True) -> Set[str]:
         from core.cache import get_cached_tokens, set_cached_tokens
         cached_tokens = get_cached_tokens(text)
         if cached_tokens:
-            tokens = set(cached_tokens)
+            tokens = set(map(sys.intern, cached_tokens))
             # Also store in memory cache for quick access
             if len(text) < 1000:
                 _token_cache[text] = tokens
@@ -134,7 +144,8 @@ def _tokenize(text: str, use_cache: bool = True) -> Set[str]:
     
     # Tokenize the text
     normalized = _normalize(text)
-    tokens = set(normalized.split())
+    # Interned so keyword/resume token comparisons hit the identity fast path
+    tokens = set(map(sys.intern, normalized.split()))
     
     # Cache the result
     if use_cache:
@@ -151,11 +162,52 @@ def _tokenize(text: str, use_cache: bool = True) -> Set[str]:
     return tokens
 
 
+@lru_cache(maxsize=4096)
+def _phrase_tokens(phrase: str) -> FrozenSet[str]:
+    """
+    Tokenize a short keyword/alias phrase.
+
+    Memoized: the same JD keywords and alias constants are matched against
+    every resume and every bullet, so the regex work is paid once per phrase.
+    """
+    return frozenset(map(sys.intern, _normalize(phrase).split()))
+
+
+# Token sets for the constant alias/context/composite tables, built once at import
+_ALIAS_TOKENS: Dict[str, Tuple[FrozenSet[str], ...]] = {
+    kw: tuple(_phrase_tokens(a) for a in aliases)
+    for kw, aliases in KEYWORD_ALIASES.items()
+}
+_CONTEXT_TOKENS: Dict[str, Tuple[FrozenSet[str], ...]] = {
+    kw: tuple(_phrase_tokens(p) for p in phrases)
+    for kw, phrases in KEYWORD_CONTEXT_SIGNALS.items()
+}
+_COMPOSITE_TOKENS: Dict[str, Tuple[FrozenSet[str], ...]] = {
+    kw: tuple(_phrase_tokens(p) for p in parts)
+    for kw, parts in COMPOSITE_SKILLS.items()
+}
+
+
 def _fuzzy_ratio(str1: str, str2: str) -> float:
     """Calculate similarity ratio between two strings (0.0 to 1.0)."""
     return SequenceMatcher(None, str1.lower(), str2.lower()).ratio()
 
 
+def _is_similar(str1: str, str2: str, threshold: float) -> bool:
+    """
+    Check _fuzzy_ratio(str1, str2) >= threshold.
+
+    SequenceMatcher's length bound and character-count bound are cheap upper
+    limits on ratio(), so most token pairs are rejected without running the
+    full matching-blocks computation.
+    """
+    total = len(str1) + len(str2)
+    if total and 2.0 * min(len(str1), len(str2)) / total < threshold:
+        return False
+    matcher = SequenceMatcher(None, str1.lower(), str2.lower())
+    return matcher.quick_ratio() >= threshold and matcher.ratio() >= threshold
+
+
 def _find_fuzzy_match(keyword: str, tokens: Set[str], threshold: float = 0.85) -> Optional[str]:
     """
     Find fuzzy matches for a keyword in tokens.
@@ -176,15 +228,14 @@ def _find_fuzzy_match(keyword: str, tokens: Set[str], threshold: float = 0.85) -
         # Check if all tokens are present (exact match already handled)
         # For fuzzy, check if most tokens match
         matches = sum(1 for kw_t in kw_tokens if any(
-            _fuzzy_ratio(kw_t, token) >= threshold for token in tokens
+            _is_similar(kw_t, token, threshold) for token in tokens
         ))
         if matches >= max(1, len(kw_tokens) * 0.7):  # 70% of tokens match
             return "fuzzy"
     
     # For single-word keywords, check direct fuzzy match
     for token in tokens:
-        ratio = _fuzzy_ratio(kw_normalized, token)
-        if ratio >= threshold:
+        if _is_similar(kw_normalized, token, threshold):
             return "fuzzy"
     
     # Also check if keyword is substring or token is substring (for abbreviations)
@@ -195,7 +246,7 @@ def _find_fuzzy_match(keyword: str, tokens: Set[str], threshold: float = 0.85) -
         if len(kw_normalized_no_space) >= 3 and len(token_no_space) >= 3:
             if kw_normalized_no_space in token_no_space or token_no_space in kw_normalized_no_space:
                 # Verify they're similar enough
-                if _fuzzy_ratio(kw_normalized_no_space, token_no_space) >= 0.75:
+                if _is_similar(kw_normalized_no_space, token_no_space, 0.75):
                     return "fuzzy"
     
     return None
@@ -215,21 +266,22 @@ def _match_composite(keyword: str, tokens: Set[str]) -> bool:
     - Otherwise ≥50% signal coverage
     """
 
-    parts = COMPOSITE_SKILLS.get(keyword.lower())
+    parts = _COMPOSITE_TOKENS.get(keyword.lower())
     if not parts:
         return False
 
+    # Strong-signal shortcut (e.g. Spring → Java): one hit for ≤2 parts,
+    # otherwise ≥50% coverage — both reduce to this threshold
+    threshold = max(1, len(parts) // 2)
+
     hits = 0
-    for p in parts:
-        p_tokens = set(_tokenize(p))
-        if tokens & p_tokens:
+    for p_tokens in parts:
+        if not p_tokens.isdisjoint(tokens):
             hits += 1
+            if hits >= threshold:
+                return True
 
-    # Strong-signal shortcut (e.g. Spring → Java)
-    if hits >= 1 and len(parts) <= 2:
-        return True
-
-    return hits >= max(1, len(parts) // 2)
+    return False
 
 
 # ---------------------------------------------------------
@@ -251,26 +303,30 @@ def _match_keyword(keyword: str, tokens: Set[str], enable_fuzzy: bool = True) ->
     5. Fuzzy match (typos/variations, if enabled)
     """
     kw = keyword.lower()
-    kw_tokens = _tokenize(kw, use_cache=False)
+    kw_tokens = _phrase_tokens(kw)
 
     # 1️⃣ Exact (highest confidence)
     if kw_tokens and kw_tokens.issubset(tokens):
         return "exact"
 
     # 2️⃣ Alias (high confidence)
-    for alias in KEYWORD_ALIASES.get(kw, []):
-        alias_tokens = _tokenize(alias, use_cache=False)
+    for alias_tokens in _ALIAS_TOKENS.get(kw, ()):
         if alias_tokens.issubset(tokens):
             return "alias"
 
     # 3️⃣ Context (medium-high confidence)
-    for phrase in KEYWORD_CONTEXT_SIGNALS.get(kw, []):
-        phrase_tokens = _tokenize(phrase, use_cache=False)
+    for phrase_tokens in _CONTEXT_TOKENS.get(kw, ()):
         if phrase_tokens.issubset(tokens):
             return "context"
 
+    # 4️⃣ Composite / 5️⃣ Fuzzy
+    return _match_inferred(keyword, tokens, enable_fuzzy)
+
+
+def _match_inferred(keyword: str, tokens: Set[str], enable_fuzzy: bool = True) -> Optional[str]:
+    """Lower-confidence strategies: composite inference, then fuzzy matching."""
     # 4️⃣ Composite (medium confidence, safe inference)
-    if _match_composite(kw, tokens):
+    if _match_composite(keyword.lower(), tokens):
         return "composite"
 
     # 5️⃣ Fuzzy (lower confidence, handles typos/variations)
@@ -282,14 +338,99 @@ def _match_keyword(keyword: str, tokens: Set[str], enable_fuzzy: bool = True) ->
     return None
 
 
+# ---------------------------------------------------------
+# Multi-keyword matcher
+# ---------------------------------------------------------
+
+# Strategies resolvable by token-set lookup, most confident first
+_DIRECT_MATCH_RANK = {"exact": 0, "alias": 1, "context": 2}
+
+
+@lru_cache(maxsize=256)
+def _keyword_index(
+    keywords: Tuple[str, ...]
+) -> Tuple[Dict[str, List[Tuple[int, str, int]]], Dict[str, int]]:
+    """
+    Build a token → candidate-form index for a JD keyword list.
+
+    Every token used by any exact/alias/context form gets one bit, and each
+    form is stored as the bitmask of its tokens, filed under one anchor
+    token. Matching a resume then needs one set intersection to find the
+    tokens present, an OR of their bits, and a single integer AND per
+    candidate form instead of string set lookups. Cached per keyword tuple
+    so batch runs and per-bullet loops reuse the same index.
+
+    Returns:
+        (anchor token → [(keyword position, match type, form mask)],
+         token → bit)
+    """
+    index: Dict[str, List[Tuple[int, str, int]]] = {}
+    bits: Dict[str, int] = {}
+    for pos, keyword in enumerate(keywords):
+        kw = keyword.lower()
+        forms = (
+            ("exact", (_phrase_tokens(kw),)),
+            ("alias", _ALIAS_TOKENS.get(kw, ())),
+            ("context", _CONTEXT_TOKENS.get(kw, ())),
+        )
+        for kind, token_sets in forms:
+            for form in token_sets:
+                if not form:
+                    continue
+                mask = 0
+                for token in form:
+                    bit = bits.get(token)
+                    if bit is None:
+                        bit = bits[token] = 1 << len(bits)
+                    mask |= bit
+                index.setdefault(min(form), []).append((pos, kind, mask))
+    return index, bits
+
+
+def _match_keywords(keywords: List[str], tokens: Set[str], enable_fuzzy: bool = True) -> List[Optional[str]]:
+    """
+    Match many keywords against one token set.
+
+    Same result as calling _match_keyword per keyword, but exact/alias/context
+    hits for the whole list come from one pass over the cached keyword index;
+    only keywords left unresolved fall through to composite/fuzzy matching.
+
+    Returns:
+        Match types aligned with ``keywords``
+    """
+    keywords = tuple(keywords)
+    index, bits = _keyword_index(keywords)
+    results: List[Optional[str]] = [None] * len(keywords)
+
+    present = bits.keys() & tokens
+    resume_mask = 0
+    for token in present:
+        resume_mask |= bits[token]
+
+    for token in present:
+        for pos, kind, mask in index.get(token, ()):
+            current = results[pos]
+            if current is not None and _DIRECT_MATCH_RANK[current] <= _DIRECT_MATCH_RANK[kind]:
+                continue
+            if resume_mask & mask == mask:
+                results[pos] = kind
+
+    for pos, keyword in enumerate(keywords):
+        if results[pos] is None:
+            results[pos] = _match_inferred(keyword, tokens, enable_fuzzy)
+
+    return results
+
+
 # =========================================================
 # Simple scorer (debug only)
 # =========================================================
 
 def score(keywords: list[str], resume_text: str) -> dict:
     tokens = _tokenize(resume_text)
-    matched = [kw for kw in keywords if _match_keyword(kw, tokens)]
-    missing = list(set(keywords) - set(matched))
+    matched, missing = [], []
+    for kw, match_type in zip(keywords, _match_keywords(keywords, tokens)):
+        (matched if match_type else missing).append(kw)
 
     return {
         "score": int((len(matched) / max(len(keywords), 1)) * 100),
@@ -302,16 +443,28 @@ def score(keywords: list[str], resume_text: str) -> dict:
 # Recruiter-grade ATS scorer (PRODUCTION)
 # =========================================================
 
+# Match type weights (fuzzy matches get reduced weight)
+_MATCH_TYPE_WEIGHTS = {
+    "exact": 1.0,
+    "alias": 1.0,
+    "context": 0.9,
+    "composite": 0.85,
+    "fuzzy": 0.75,  # Lower confidence for fuzzy matches
+}
+
 def score_detailed(
     jd_keywords: Dict[str, List[str]],
     resume_text: str,
     inferred_skills: Optional[List[Dict]] = None,
     parsed_resume_data: Optional[Dict[str, Any]] = None,
+    resume_tokens: Optional[Set[str]] = None,
 ) -> dict:
     """
     Calculate detailed ATS score with caching.
     
     Caches results for identical resume+JD keyword pairs to avoid redundant computation.
+    Callers scoring one resume against many JDs can pass ``resume_tokens``
+    (from ``_tokenize(resume_text)``) to skip re-tokenizing the resume.
     """
     from core.cache import (
         get_cached_ats_score,
@@ -323,16 +476,20 @@ def score_detailed(
     
     logger = logging.getLogger(__name__)
     
-    # Generate cache key (note: inferred_skills not included in cache key for simplicity)
-    # If inferred_skills are important, they should be included in the hash
+    # Cache key covers every scoring input: evidence-gated inferred skills
+    # and parsed structured data both change the score
     jd_keywords_hash = hash_jd_keywords(jd_keywords)
+    if inferred_skills or parsed_resume_data:
+        jd_keywords_hash = hash_jd_keywords({
+            "jd_keywords": jd_keywords_hash,
+            "inferred_skills": inferred_skills or [],
+            "parsed_resume_data": parsed_resume_data or {},
+        })
     
-    # Check cache first (only if no inferred_skills, as they affect the score)
-    if not inferred_skills:
-        cached_result = get_cached_ats_score(resume_text, jd_keywords_hash)
-        if cached_result:
-            logger.info("ATS score cache hit")
-            return cached_result
+    cached_result = get_cached_ats_score(resume_text, jd_keywords_hash)
+    if cached_result:
+        logger.info("ATS score cache hit")
+        return cached_result
     
     logger.info("ATS score cache miss, computing score")
     
@@ -340,26 +497,23 @@ def score_detailed(
     if parsed_resume_data:
         from agents.resume_structured import create_enhanced_resume_text, extract_skills_from_structured
         enhanced_text = create_enhanced_resume_text(parsed_resume_data, resume_text)
-        tokens = _tokenize(enhanced_text)
+        # Copy: _tokenize results are shared via the token cache
+        tokens = set(_tokenize(enhanced_text))
         # Also add structured skills directly to tokens
         structured_skills = extract_skills_from_structured(parsed_resume_data)
         for skill in structured_skills:
-            tokens.update(_tokenize(skill))
+            tokens.update(_phrase_tokens(skill))
+    elif resume_tokens is not None:
+        tokens = resume_tokens
     else:
         tokens = _tokenize(resume_text)
 
     # 🔥 Evidence-gated inference (NO JD mutation)
     if inferred_skills:
+        tokens = set(tokens)
         for s in inferred_skills:
             if s.get("confidence", 0) >= 0.8:
-                tokens.update(_tokenize(s["skill"]))
-    
-    # Add structured skills to tokens if available
-    if parsed_resume_data:
-        from agents.resume_structured import extract_skills_from_structured
-        structured_skills = extract_skills_from_structured(parsed_resume_data)
-        for skill in structured_skills:
-            tokens.update(_tokenize(skill))
+                tokens.update(_phrase_tokens(s["skill"]))
 
     # Normalize jd_keywords - handle both dict and list formats
     if isinstance(jd_keywords, list):
@@ -393,30 +547,24 @@ def score_detailed(
     score = 0.0
     matched = {k: [] for k in weights}
     missing_required = []
-    
-    # Match type weights (fuzzy matches get reduced weight)
-    match_weights = {
-        "exact": 1.0,
-        "alias": 1.0,
-        "context": 0.9,
-        "composite": 0.85,
-        "fuzzy": 0.75,  # Lower confidence for fuzzy matches
-    }
 
     for category, weight in weights.items():
-        for kw in jd_keywords.get(category, []):
-            match_type = _match_keyword(kw, tokens)
-
+        keywords = jd_keywords.get(category, [])
+        # Match types aligned with keywords (None = missing); lists built once from them
+        match_types = _match_keywords(keywords, tokens)
+        matched[category] = [kw for kw, match_type in zip(keywords, match_types) if match_type]
+        for match_type in match_types:
             if match_type:
-                matched[category].append(kw)
-                # Apply match type weight (fuzzy gets less credit)
-                match_weight = match_weights.get(match_type, 1.0)
-                score += weight * match_weight
+                # Apply match type weight (fuzzy gets less credit); added per
+                # keyword so float rounding of the final score is unchanged
+                score += weight * _MATCH_TYPE_WEIGHTS.get(match_type, 1.0)
 
-            elif category == "required_skills":
-                # 🚫 Do not hard-block composite / architecture skills
-                if kw.lower() not in COMPOSITE_SKILLS:
-                    missing_required.append(kw)
+        if category == "required_skills":
+            # 🚫 Do not hard-block composite / architecture skills
+            missing_required = [
+                kw for kw, match_type in zip(keywords, match_types)
+                if not match_type and kw.lower() not in COMPOSITE_SKILLS
+            ]
 
     percentage = int((score / total_possible) * 100)
 
@@ -444,9 +592,7 @@ def score_detailed(
         ),
     }
     
-    # Cache the result (only if no inferred_skills)
-    if not inferred_skills:
-        set_cached_ats_score(resume_text, jd_keywords_hash, result, ttl=CACHE_ATS_TTL)
+    set_cached_ats_score(resume_text, jd_keywords_hash, result, ttl=CACHE_ATS_TTL)
     
     return result
 
@@ -455,13 +601,30 @@ def score_detailed(
 # Bullet → Keyword attribution
 # =========================================================
 
+@lru_cache(maxsize=2048)
+def _bullet_matches(keywords: Tuple[str, ...], bullet: str) -> Tuple[Tuple[str, str], ...]:
+    """
+    (keyword, match_type) hits for one bullet.
+
+    Memoized per JD keyword list and bullet text, so re-scoring unchanged
+    bullets (UI refreshes, batch reruns) is a lookup. Bypasses the token
+    cache: bullets are short and the LRU already covers reuse.
+    """
+    tokens = _tokenize(bullet, use_cache=False)
+    return tuple(
+        (kw, match_type)
+        for kw, match_type in zip(keywords, _match_keywords(keywords, tokens))
+        if match_type
+    )
+
+
 def attribute_keywords_to_bullets(
     jd_keywords: Dict[str, List[str]],
     experience: list[dict],
 ) -> list[dict]:
     attributed = []
 
-    all_keywords = (
+    all_keywords = tuple(
         jd_keywords.get("required_skills", [])
         + jd_keywords.get("optional_skills", [])
         + jd_keywords.get("tools", [])
@@ -471,16 +634,13 @@ def attribute_keywords_to_bullets(
         bullets = []
 
         for bullet in exp.get("bullets", []):
-            tokens = _tokenize(bullet)
-            matches = []
-
-            for kw in all_keywords:
-                match_type = _match_keyword(kw, tokens)
-                if match_type:
-                    matches.append({
-                        "keyword": kw,
-                        "match_type": match_type,
-                    })
+            matches = [
+                {
+                    "keyword": kw,
+                    "match_type": match_type,
+                }
+                for kw, match_type in _bullet_matches(all_keywords, bullet)
+            ]
 
             bullets.append({
                 "text": bullet,
@@ -5,12 +5,21 @@ Processes one resume against multiple JDs simultaneously.
 
 Optimized with parallel processing using asyncio for 5-10x faster batch operations.
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import asyncio
 
 logger = logging.getLogger(__name__)
 
+# Thread pool for the synchronous scoring stage of each JD
+_scoring_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="batch_score")
+
+
+def shutdown_scoring_executor() -> None:
+    """Stop the batch scoring thread pool (app shutdown)."""
+    _scoring_executor.shutdown(wait=True, cancel_futures=True)
+
 
 async def process_batch_jds_async(
     resume_text: str,
@@ -35,12 +44,7 @@ async def process_batch_jds_async(
         Batch processing results with scores and recommendations for each JD
     """
     from agents.jd_analyzer import analyze_jd_async
-    from agents.ats_scorer import score_detailed
-    from agents.role_detector import detect_role
-    from agents.jd_normalizer import normalize_jd_keywords
-    from agents.skill_gap_analyzer import analyze_skill_gap
-    from agents.skill_inference import infer_skills_from_resume
-    from agents.role_confidence import tune_confidence_by_role
+    from agents.ats_scorer import _tokenize
     
     summary = {
         "total_jds": len(jd_list),
@@ -53,6 +57,9 @@ async def process_batch_jds_async(
     
     scores = []
     
+    # Tokenize the resume once; every JD is scored against the same tokens
+    resume_tokens = _tokenize(resume_text)
+    
     # Process each JD in parallel
     async def process_single_jd(jd_data: Dict[str, str], index: int) -> Optional[Dict[str, Any]]:
         """Process a single JD asynchronously."""
@@ -68,72 +75,20 @@ async def process_batch_jds_async(
             # Analyze JD (async - this is the main bottleneck)
             jd_analysis = await analyze_jd_async(jd_text)
             
-            # Normalize keywords (sync - fast)
-            raw_keywords = {
-                "required_skills": jd_analysis.get("required_skills", []),
-                "optional_skills": jd_analysis.get("optional_skills", []),
-                "tools": jd_analysis.get("tools", []),
-            }
-            jd_keywords = normalize_jd_keywords(raw_keywords)
-            
-            # Detect role (sync - fast)
-            role_info = detect_role(jd_text, resume_text)
-            
-            # Infer skills (sync - fast)
-            inferred_skills = infer_skills_from_resume(
-                resume_text=resume_text,
-                explicit_skills=(
-                    jd_keywords["required_skills"] +
-                    jd_keywords["optional_skills"] +
-                    jd_keywords["tools"]
-                ),
-            )
-            
-            # Tune confidence by role (sync - fast)
-            inferred_skills = tune_confidence_by_role(
-                inferred_skills,
-                role=role_info["role"],
-            )
-            
-            # Score resume (sync - fast)
-            ats_score = score_detailed(
-                jd_keywords,
-                resume_text,
-                inferred_skills=inferred_skills,
-            )
-            
-            # Skill gap analysis (sync - fast)
-            skill_gap = analyze_skill_gap(
-                jd_keywords,
+            # Score against the resume off the event loop so other JDs'
+            # analyses keep progressing while this one is scored
+            loop = asyncio.get_event_loop()
+            result = await loop.run_in_executor(
+                _scoring_executor,
+                _score_single_jd,
+                jd_id,
+                jd_title,
+                jd_text,
+                jd_analysis,
                 resume_text,
-                inferred_skills
+                resume_tokens,
             )
             
-            # Calculate fit score (sync - fast)
-            fit_score = _calculate_fit_score(ats_score, skill_gap)
-            
-            result = {
-                "jd_id": jd_id,
-                "title": jd_title,
-                "role": jd_analysis.get("role", ""),
-                "seniority": jd_analysis.get("seniority", ""),
-                "ats_score": ats_score["score"],
-                "fit_score": fit_score,
-                "skill_gap": {
-                    "severity": skill_gap["gap_severity"],
-                    "required_coverage": skill_gap["summary"]["required_coverage"],
-                    "missing_required_count": len(skill_gap["missing_skills"]["required_skills"]),
-                },
-                "keywords": {
-                    "required_matched": len(ats_score["matched_keywords"]["required_skills"]),
-                    "required_total": len(jd_keywords["required_skills"]),
-                    "tools_matched": len(ats_score["matched_keywords"]["tools"]),
-                    "tools_total": len(jd_keywords["tools"]),
-                },
-                "recommendations": skill_gap["recommendations"][:3],  # Top 3
-                "role_match": role_info["confidence"],
-            }
-            
             return result
             
         except Exception as e:
@@ -250,6 +205,96 @@ def process_batch_jds(
     )
 
 
+def _score_single_jd(
+    jd_id: str,
+    jd_title: str,
+    jd_text: str,
+    jd_analysis: Dict[str, Any],
+    resume_text: str,
+    resume_tokens: Set[str],
+) -> Dict[str, Any]:
+    """
+    Synchronous scoring stage for one analyzed JD.
+    Runs in the batch scoring thread pool.
+    """
+    from agents.ats_scorer import score_detailed
+    from agents.role_detector import detect_role
+    from agents.jd_normalizer import normalize_jd_keywords
+    from agents.skill_gap_analyzer import analyze_skill_gap
+    from agents.skill_inference import infer_skills_from_resume
+    from agents.role_confidence import tune_confidence_by_role
+    
+    # Normalize keywords (sync - fast)
+    raw_keywords = {
+        "required_skills": jd_analysis.get("required_skills", []),
+        "optional_skills": jd_analysis.get("optional_skills", []),
+        "tools": jd_analysis.get("tools", []),
+    }
+    jd_keywords = normalize_jd_keywords(raw_keywords)
+
+    # Detect role (sync - fast)
+    role_info = detect_role(jd_text, resume_text)
+
+    # Infer skills (sync - fast)
+    inferred_skills = infer_skills_from_resume(
+        resume_text=resume_text,
+        explicit_skills=(
+            jd_keywords["required_skills"] +
+            jd_keywords["optional_skills"] +
+            jd_keywords["tools"]
+        ),
+    )
+
+    # Tune confidence by role (sync - fast)
+    inferred_skills = tune_confidence_by_role(
+        inferred_skills,
+        role=role_info["role"],
+    )
+
+    # Score resume (sync - fast)
+    ats_score = score_detailed(
+        jd_keywords,
+        resume_text,
+        inferred_skills=inferred_skills,
+        resume_tokens=resume_tokens,
+    )
+
+    # Skill gap analysis (sync - fast)
+    skill_gap = analyze_skill_gap(
+        jd_keywords,
+        resume_text,
+        inferred_skills,
+        resume_tokens=resume_tokens,
+    )
+
+    # Calculate fit score (sync - fast)
+    fit_score = _calculate_fit_score(ats_score, skill_gap)
+
+    result = {
+        "jd_id": jd_id,
+        "title": jd_title,
+        "role": jd_analysis.get("role", ""),
+        "seniority": jd_analysis.get("seniority", ""),
+        "ats_score": ats_score["score"],
+        "fit_score": fit_score,
+        "skill_gap": {
+            "severity": skill_gap["gap_severity"],
+            "required_coverage": skill_gap["summary"]["required_coverage"],
+            "missing_required_count": len(skill_gap["missing_skills"]["required_skills"]),
+        },
+        "keywords": {
+            "required_matched": len(ats_score["matched_keywords"]["required_skills"]),
+            "required_total": len(jd_keywords["required_skills"]),
+            "tools_matched": len(ats_score["matched_keywords"]["tools"]),
+            "tools_total": len(jd_keywords["tools"]),
+        },
+        "recommendations": skill_gap["recommendations"][:3],  # Top 3
+        "role_match": role_info["confidence"],
+    }
+
+    return result
+
+
 def _calculate_fit_score(ats_result: Dict[str, Any], skill_gap: Dict[str, Any]) -> float:
     """
     Calculate overall fit score combining ATS score and skill coverage.
@@ -1,22 +1,40 @@
-from collections import defaultdict
-
-# resume_id -> chat history
-_chat_memory = defaultdict(list)
+import threading
+from collections import OrderedDict, deque
 
 MAX_MESSAGES = 20
 
+# Resumes with chat history kept per process; least recently used are dropped
+MAX_CHAT_SESSIONS = 1000
+
+# resume_id -> chat history (last MAX_MESSAGES messages), in LRU order
+_chat_memory: "OrderedDict[str, deque]" = OrderedDict()
+_chat_memory_lock = threading.Lock()
+
 
 def add_chat_message(resume_id: str, role: str, content: str):
-    _chat_memory[resume_id].append({
-        "role": role,
-        "content": content,
-    })
-    _chat_memory[resume_id] = _chat_memory[resume_id][-MAX_MESSAGES:]
+    with _chat_memory_lock:
+        history = _chat_memory.get(resume_id)
+        if history is None:
+            history = _chat_memory[resume_id] = deque(maxlen=MAX_MESSAGES)
+            while len(_chat_memory) > MAX_CHAT_SESSIONS:
+                _chat_memory.popitem(last=False)
+        else:
+            _chat_memory.move_to_end(resume_id)
+        history.append({
+            "role": role,
+            "content": content,
+        })
 
 
 def get_chat_memory(resume_id: str) -> list[dict]:
-    return _chat_memory[resume_id]
+    with _chat_memory_lock:
+        history = _chat_memory.get(resume_id)
+        if history is None:
+            return []
+        _chat_memory.move_to_end(resume_id)
+        return list(history)
 
 
 def clear_chat_memory(resume_id: str):
-    _chat_memory[resume_id].clear()
+    with _chat_memory_lock:
+        _chat_memory.pop(resume_id, None)
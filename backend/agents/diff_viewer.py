@@ -75,11 +75,17 @@ def diff_resume_structured(
             before_resume.get("contact", {}) or {},
             after_resume.get("contact", {}) or {}
         ),
-        "text_diff": _create_text_diff(before_text, after_text),
+        "text_diff": _create_text_diff(before_text.splitlines(), after_text.splitlines()),
     }
     
-    # Calculate statistics
-    statistics = calculate_change_statistics(before_resume, after_resume, comparison)
+    # Calculate statistics (reusing the formatted text)
+    statistics = calculate_change_statistics(
+        before_resume,
+        after_resume,
+        comparison,
+        before_text=before_text,
+        after_text=after_text,
+    )
     
     result = {
         "comparison": comparison,
@@ -137,6 +143,14 @@ def _diff_experience(
                 "before": before_exp,
                 "after": None
             })
+        elif before_exp is after_exp or before_exp == after_exp:
+            # Untouched entry: nothing to tokenize or compare
+            changes.append({
+                "index": i,
+                "action": "unchanged",
+                "before": before_exp,
+                "after": after_exp
+            })
         else:
             # Compare title
             title_changed = before_exp.get("title") != after_exp.get("title")
@@ -167,23 +181,49 @@ def _diff_experience(
 
 
 def _diff_bullets(before: List[str], after: List[str]) -> Dict[str, Any]:
-    """Diff bullet points."""
-    added = [b for b in after if b not in before]
-    removed = [b for b in before if b not in after]
+    """
+    Diff bullet points.
+
+    Bullets missing from the other side are added/removed. A bullet kept on
+    both sides is reported as modified against the first other kept bullet
+    (in ``after`` order) sharing its first three words. Linear: set
+    membership plus a prefix index instead of comparing every pair.
+    """
+    if before == after:
+        return {
+            "changed": False,
+            "added": [],
+            "removed": [],
+            "modified": [],
+            "before_count": len(before),
+            "after_count": len(after)
+        }
+    
+    before_set = set(before)
+    after_set = set(after)
+    added = [a for a in after if a not in before_set]
+    removed = [b for b in before if b not in after_set]
     modified = []
     
+    # First two distinct kept bullets per opening words, in ``after`` order;
+    # at least one of them differs from any given bullet
+    kept_by_prefix: Dict[Tuple[str, ...], List[str]] = {}
+    for a_bullet in after:
+        if a_bullet in before_set:
+            firsts = kept_by_prefix.setdefault(tuple(a_bullet.split()[0:3]), [])
+            if len(firsts) < 2 and a_bullet not in firsts:
+                firsts.append(a_bullet)
+    
     # Find modified bullets (similar but changed)
     for b_bullet in before:
-        if b_bullet not in removed:
-            for a_bullet in after:
-                if a_bullet not in added and b_bullet != a_bullet:
-                    # Check if they're similar (same start, different content)
-                    if b_bullet.split()[0:3] == a_bullet.split()[0:3]:
-                        modified.append({
-                            "before": b_bullet,
-                            "after": a_bullet
-                        })
-                        break
+        if b_bullet in after_set:
+            for a_bullet in kept_by_prefix.get(tuple(b_bullet.split()[0:3]), ()):
+                if a_bullet != b_bullet:
+                    modified.append({
+                        "before": b_bullet,
+                        "after": a_bullet
+                    })
+                    break
     
     return {
         "changed": len(added) > 0 or len(removed) > 0 or len(modified) > 0,
@@ -195,13 +235,19 @@ def _diff_bullets(before: List[str], after: List[str]) -> Dict[str, Any]:
     }
 
 
-def _diff_skills(before: List[str], after: List[str]) -> Dict[str, Any]:
-    """Diff skills list."""
+def _ordered_difference(items: List[str], exclude: set) -> List[str]:
+    """Items not in ``exclude``, de-duplicated, in their original order."""
+    return list(dict.fromkeys(item for item in items if item not in exclude))
+
+
+def _diff_string_list(before: List[str], after: List[str]) -> Dict[str, Any]:
+    """Diff a flat list of strings (skills, languages, awards)."""
     before_set = set(before)
     after_set = set(after)
     
-    added = list(after_set - before_set)
-    removed = list(before_set - after_set)
+    # Keep list order so the diff is stable across calls
+    added = _ordered_difference(after, before_set)
+    removed = _ordered_difference(before, after_set)
     
     return {
         "changed": len(added) > 0 or len(removed) > 0,
@@ -214,6 +260,11 @@ def _diff_skills(before: List[str], after: List[str]) -> Dict[str, Any]:
     }
 
 
+def _diff_skills(before: List[str], after: List[str]) -> Dict[str, Any]:
+    """Diff skills list."""
+    return _diff_string_list(before, after)
+
+
 def _diff_education(
     before: List[Dict[str, Any]],
     after: List[Dict[str, Any]]
@@ -362,40 +413,12 @@ def _diff_projects(
 
 def _diff_languages(before: List[str], after: List[str]) -> Dict[str, Any]:
     """Diff languages list."""
-    before_set = set(before)
-    after_set = set(after)
-    
-    added = list(after_set - before_set)
-    removed = list(before_set - after_set)
-    
-    return {
-        "changed": len(added) > 0 or len(removed) > 0,
-        "added": added,
-        "removed": removed,
-        "before": before,
-        "after": after,
-        "before_count": len(before),
-        "after_count": len(after)
-    }
+    return _diff_string_list(before, after)
 
 
 def _diff_awards(before: List[str], after: List[str]) -> Dict[str, Any]:
     """Diff awards list."""
-    before_set = set(before)
-    after_set = set(after)
-    
-    added = list(after_set - before_set)
-    removed = list(before_set - after_set)
-    
-    return {
-        "changed": len(added) > 0 or len(removed) > 0,
-        "added": added,
-        "removed": removed,
-        "before": before,
-        "after": after,
-        "before_count": len(before),
-        "after_count": len(after)
-    }
+    return _diff_string_list(before, after)
 
 
 def _diff_contact(
@@ -431,13 +454,11 @@ def _diff_contact(
     }
 
 
-def _create_text_diff(before: str, after: str) -> Dict[str, Any]:
+def _create_text_diff(before_lines: List[str], after_lines: List[str]) -> Dict[str, Any]:
     """Create HTML-friendly diff with line-by-line changes."""
-    before_lines = before.splitlines()
-    after_lines = after.splitlines()
-    
     differ = difflib.SequenceMatcher(None, before_lines, after_lines)
     diff_lines = []
+    added_count = removed_count = unchanged_count = 0
     
     for tag, i1, i2, j1, j2 in differ.get_opcodes():
         if tag == "equal":
@@ -446,19 +467,9 @@ def _create_text_diff(before: str, after: str) -> Dict[str, Any]:
                     "type": "unchanged",
                     "content": line
                 })
-        elif tag == "delete":
-            for line in before_lines[i1:i2]:
-                diff_lines.append({
-                    "type": "removed",
-                    "content": line
-                })
-        elif tag == "insert":
-            for line in after_lines[j1:j2]:
-                diff_lines.append({
-                    "type": "added",
-                    "content": line
-                })
-        elif tag == "replace":
+            unchanged_count += i2 - i1
+        else:
+            # delete / replace remove lines, insert / replace add lines
             for line in before_lines[i1:i2]:
                 diff_lines.append({
                     "type": "removed",
@@ -469,12 +480,14 @@ def _create_text_diff(before: str, after: str) -> Dict[str, Any]:
                     "type": "added",
                     "content": line
                 })
+            removed_count += i2 - i1
+            added_count += j2 - j1
     
     return {
         "lines": diff_lines,
-        "added_count": sum(1 for l in diff_lines if l["type"] == "added"),
-        "removed_count": sum(1 for l in diff_lines if l["type"] == "removed"),
-        "unchanged_count": sum(1 for l in diff_lines if l["type"] == "unchanged")
+        "added_count": added_count,
+        "removed_count": removed_count,
+        "unchanged_count": unchanged_count
     }
 
 
@@ -713,13 +726,13 @@ def _create_side_by_side_skills(
     if side == "left":
         skills = before
         added = []
-        removed = list(before_set - after_set)
-        unchanged = list(before_set & after_set)
+        removed = _ordered_difference(before, after_set)
+        unchanged = list(dict.fromkeys(s for s in before if s in after_set))
     else:
         skills = after
-        added = list(after_set - before_set)
+        added = _ordered_difference(after, before_set)
         removed = []
-        unchanged = list(before_set & after_set)
+        unchanged = list(dict.fromkeys(s for s in after if s in before_set))
     
     return {
         "skills": skills,
@@ -871,13 +884,22 @@ def _create_side_by_side_projects(
 def calculate_change_statistics(
     before_resume: Dict[str, Any],
     after_resume: Dict[str, Any],
-    comparison: Dict[str, Any]
+    comparison: Dict[str, Any],
+    before_text: Optional[str] = None,
+    after_text: Optional[str] = None,
 ) -> Dict[str, Any]:
-    """Calculate comprehensive change statistics."""
+    """
+    Calculate comprehensive change statistics.
+    
+    ``before_text``/``after_text`` are the formatted resumes; pass them when
+    already available to avoid formatting both resumes again.
+    """
     from agents.resume_formatter import format_resume_text
     
-    before_text = format_resume_text(before_resume)
-    after_text = format_resume_text(after_resume)
+    if before_text is None:
+        before_text = format_resume_text(before_resume)
+    if after_text is None:
+        after_text = format_resume_text(after_resume)
     
     before_words = before_text.split()
     after_words = after_text.split()
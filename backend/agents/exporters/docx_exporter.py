@@ -1,15 +1,59 @@
-from docx import Document
+from functools import lru_cache
+from io import BytesIO
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from docx.document import Document
+
+
+@lru_cache(maxsize=1)
+def _blank_template_bytes() -> bytes:
+    """Saved default template; bytes, so no export can modify the cached copy."""
+    # python-docx is imported on first export, not at app startup
+    from docx import Document
+
+    buffer = BytesIO()
+    Document().save(buffer)
+    return buffer.getvalue()
+
+
+def new_document() -> "Document":
+    """
+    Fresh empty Document.
+
+    Document() reads python-docx's bundled template from disk on every call;
+    each export instead opens its own Document from in-memory template bytes.
+    """
+    from docx import Document
+
+    return Document(BytesIO(_blank_template_bytes()))
+
+
+def add_paragraph_with_style_id(doc: "Document", text: str, style_id: str):
+    """
+    Append a paragraph in the style with the given id
+    (from ``doc.styles[name].style_id``, resolved once per document).
+
+    add_paragraph(text, style=name) re-resolves the style by name on every
+    call (a scan of the styles part plus a default-style lookup), which
+    dominated exports with many bullets.
+    """
+    paragraph = doc.add_paragraph(text)
+    paragraph._p.style = style_id
+    return paragraph
+
 
 def export_docx(resume: dict, path: str):
-    doc = Document()
+    doc = new_document()
 
     if resume.get("summary"):
         doc.add_paragraph(resume["summary"])
 
+    bullet_style_id = doc.styles["List Bullet"].style_id
     for exp in resume.get("experience", []):
         doc.add_heading(exp["title"], level=2)
         for b in exp.get("bullets", []):
-            doc.add_paragraph(b, style="List Bullet")
+            add_paragraph_with_style_id(doc, b, bullet_style_id)
 
     if resume.get("skills"):
         doc.add_heading("Skills", level=2)
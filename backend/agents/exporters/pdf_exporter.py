@@ -1,7 +1,8 @@
-from reportlab.lib.pagesizes import A4
-from reportlab.pdfgen import canvas
-
 def export_pdf(resume: dict, path: str):
+    # reportlab is imported on first export, not at app startup
+    from reportlab.lib.pagesizes import A4
+    from reportlab.pdfgen import canvas
+
     c = canvas.Canvas(path, pagesize=A4)
     y = 800
 
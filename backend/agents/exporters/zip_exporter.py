@@ -1,18 +1,37 @@
 import zipfile
 import tempfile
+from concurrent.futures import ThreadPoolExecutor, wait
 from .txt_exporter import export_txt
 from .docx_exporter import export_docx
 from .pdf_exporter import export_pdf
 
+# DOCX and PDF renders are independent, so a bundle renders them side by side
+_export_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="zip_export")
+
+
+def shutdown_export_executor() -> None:
+    """Stop the bundle export thread pool (app shutdown)."""
+    _export_executor.shutdown(wait=True, cancel_futures=True)
+
+
 def export_zip(resume: dict, zip_path: str):
     with tempfile.TemporaryDirectory() as tmp:
-        txt = export_txt(resume)
         docx_path = f"{tmp}/resume.docx"
         pdf_path = f"{tmp}/resume.pdf"
 
-        export_docx(resume, docx_path)
-        export_pdf(resume, pdf_path)
+        renders = [
+            _export_executor.submit(export_docx, resume, docx_path),
+            _export_executor.submit(export_pdf, resume, pdf_path),
+        ]
+        txt = export_txt(resume)
+
+        # Let both renders finish before surfacing errors, so neither is
+        # still writing when the temp dir is removed
+        wait(renders)
+        for render in renders:
+            render.result()
 
+        # PDF/DOCX are already compressed archives: store them as-is
         with zipfile.ZipFile(zip_path, "w") as z:
             z.writestr("resume.txt", txt)
             z.write(docx_path, "resume.docx")
@@ -1,14 +1,41 @@
 # agents/jd_analyzer.py
 import json
-import re
-import core.llm
+import logging
+from core import json_codec
+from core.memory_cache import MemoryCache
+from core.singleflight import run_once, run_once_async
+from itertools import chain
 from typing import Dict, Any
 
+logger = logging.getLogger(__name__)
+
 
 # ------------------------
 # LLM wrapper (mockable, with validation)
 # ------------------------
 
+_JD_EXPECTED_KEYS = ("role", "seniority", "required_skills", "optional_skills", "tools")
+
+_JD_FALLBACK_JSON = '{"role": "", "seniority": "", "required_skills": [], "optional_skills": [], "tools": [], "responsibilities": [], "ats_keywords": {"required_skills": [], "optional_skills": [], "tools": []}}'
+
+
+def _validate_jd_response(response: str) -> bool:
+    """
+    Validate that response contains valid JSON with expected JD analysis structure.
+    """
+    if not response or not response.strip():
+        return False
+
+    try:
+        # Try to extract and parse JSON
+        data = json_codec.extract_object(response)
+    except (ValueError, AttributeError, TypeError):
+        return False
+
+    # Validate it's an object (not array) with at least one expected key
+    return isinstance(data, dict) and any(key in data for key in _JD_EXPECTED_KEYS)
+
+
 def _llm_call(prompt: str) -> str:
     """
     Safe LLM call wrapper with JSON validation for JD analysis.
@@ -21,42 +48,12 @@ def _llm_call(prompt: str) -> str:
         LLM response string (should be JSON)
     """
     from core.llm_safe import safe_llm_call
-    import json
-    import re
-    
-    def validate_jd_response(response: str) -> bool:
-        """
-        Validate that response contains valid JSON with expected JD analysis structure.
-        """
-        if not response or not response.strip():
-            return False
-        
-        try:
-            # Try to extract and parse JSON
-            match = re.search(r"\{[\s\S]*\}", response)
-            if not match:
-                return False
-            
-            data = json.loads(match.group())
-            
-            # Validate it's an object (not array)
-            if not isinstance(data, dict):
-                return False
-            
-            # Should have at least one expected key
-            expected_keys = ["role", "seniority", "required_skills", "optional_skills", "tools"]
-            if not any(key in data for key in expected_keys):
-                return False
-            
-            return True
-            
-        except (json.JSONDecodeError, AttributeError, TypeError):
-            return False
-    
+
     result = safe_llm_call(
         prompt=prompt,
-        validation_fn=validate_jd_response,
-        fallback_value='{"role": "", "seniority": "", "required_skills": [], "optional_skills": [], "tools": [], "responsibilities": [], "ats_keywords": {"required_skills": [], "optional_skills": [], "tools": []}}',
+        system=JD_SYSTEM,
+        validation_fn=_validate_jd_response,
+        fallback_value=_JD_FALLBACK_JSON,
         max_retries=3,
     )
     
@@ -80,50 +77,23 @@ async def _llm_call_async(prompt: str) -> str:
         LLM response string (should be JSON)
     """
     from core.llm_safe_async import safe_llm_call_async
-    import json
-    
-    def validate_jd_response(response: str) -> bool:
-        """
-        Validate that response contains valid JSON with expected JD analysis structure.
-        """
-        if not response or not response.strip():
-            return False
-        
-        try:
-            # Try to extract and parse JSON
-            match = re.search(r"\{[\s\S]*\}", response)
-            if not match:
-                return False
-            
-            data = json.loads(match.group())
-            
-            # Validate it's an object (not array)
-            if not isinstance(data, dict):
-                return False
-            
-            # Should have at least one expected key
-            expected_keys = ["role", "seniority", "required_skills", "optional_skills", "tools"]
-            if not any(key in data for key in expected_keys):
-                return False
-            
-            return True
-            
-        except (json.JSONDecodeError, AttributeError, TypeError):
-            return False
-    
+
     return await safe_llm_call_async(
         prompt=prompt,
-        validation_fn=validate_jd_response,
-        fallback_value='{"role": "", "seniority": "", "required_skills": [], "optional_skills": [], "tools": [], "responsibilities": [], "ats_keywords": {"required_skills": [], "optional_skills": [], "tools": []}}',
+        system=JD_SYSTEM,
+        validation_fn=_validate_jd_response,
+        fallback_value=_JD_FALLBACK_JSON,
         max_retries=3,
     )
 
 
 # ------------------------
-# PROMPT (AS-IS, UNCHANGED)
+# PROMPT
 # ------------------------
 
-JD_PROMPT = """
+# Static instructions, sent as the system message: identical on every call,
+# so the provider can serve them from its prompt cache
+JD_SYSTEM = """
 You are a senior technical recruiter and ATS optimization expert.
 
 TASK:
@@ -148,43 +118,71 @@ ATS KEYWORDS:
 OUTPUT FORMAT:
 Return VALID JSON ONLY with the following keys:
 role, seniority, required_skills, optional_skills, tools, responsibilities, ats_keywords
+"""
 
+JD_PROMPT = """
 JOB DESCRIPTION:
 {jd}
 """
 
+# Bump whenever JD_SYSTEM or JD_PROMPT changes so cached analyses from the old prompt are ignored
+JD_PROMPT_VERSION = "2"
+
 
 # ------------------------
-# Ultra-defensive JSON parser
+# Analysis cache (in-process tier in front of Redis)
 # ------------------------
 
-def _safe_json(text: str) -> Dict[str, Any]:
-    if not text or not isinstance(text, str):
-        raise ValueError("Empty or invalid LLM response")
+_JD_MEMORY_CACHE_SIZE = 256
 
-    # Extract first JSON object
-    match = re.search(r"\{[\s\S]*\}", text)
-    if not match:
-        raise ValueError("No JSON object found in LLM output")
+# Cleaned JDs shorter than this (same floor as the API schemas) carry nothing
+# to analyze; they get the empty result without a cache or LLM round trip
+_MIN_JD_LENGTH = 10
+_jd_memory_cache = MemoryCache(_JD_MEMORY_CACHE_SIZE)
 
-    raw = match.group()
 
-    # Fix common LLM formatting errors
-    raw = raw.replace("\n", " ")
-    raw = re.sub(r",\s*}", "}", raw)
-    raw = re.sub(r",\s*]", "]", raw)
+def _clean_jd(jd: str) -> str:
+    """Strip every line and drop blank/near-empty ones (stripping each line once)."""
+    return "\n".join(
+        stripped
+        for line in jd.splitlines()
+        if len(stripped := line.strip()) > 2
+    )
 
-    data = json.loads(raw)
 
-    if isinstance(data, list):
-        if not data:
-            raise ValueError("Empty JSON list returned")
-        data = data[0]
+def _empty_jd_analysis(error: str) -> dict:
+    """Empty analysis structure returned when a JD cannot be analyzed."""
+    return {
+        "role": "",
+        "seniority": "",
+        "required_skills": [],
+        "optional_skills": [],
+        "tools": [],
+        "responsibilities": [],
+        "ats_keywords": {
+            "required_skills": [],
+            "optional_skills": [],
+            "tools": [],
+        },
+        "error": error,
+    }
 
-    if not isinstance(data, dict):
-        raise ValueError("Parsed JSON is not an object")
 
-    return data
+def _jd_cache_text(jd: str) -> str:
+    """
+    Cache identity for a cleaned JD: prompt version plus the JD with case
+    and whitespace normalized, so trivially reformatted copies of the same
+    posting share one LLM analysis.
+    """
+    return f"{JD_PROMPT_VERSION}|{' '.join(jd.split()).lower()}"
+
+
+# ------------------------
+# Ultra-defensive JSON parser
+# ------------------------
+
+def _safe_json(text: str) -> Dict[str, Any]:
+    return json_codec.parse_llm_object(text)
 
 
 # ------------------------
@@ -219,6 +217,13 @@ def _normalize_schema(data: Dict[str, Any]) -> Dict[str, list]:
     return normalized
 
 
+def _as_keyword_list(value) -> list:
+    """A skills field as a list; a bare string from the LLM is one keyword, not its characters."""
+    if isinstance(value, list):
+        return value
+    return [value] if value else []
+
+
 # ------------------------
 # Public API
 # ------------------------
@@ -229,38 +234,45 @@ async def analyze_jd_async(jd: str) -> dict:
     """
     from core.cache_async import get_cached_jd_async, set_cached_jd_async
     from core.settings import CACHE_JD_TTL
-    import logging
-    
-    logger = logging.getLogger(__name__)
-    
+
     try:
         # Clean JD input
-        jd = "\n".join(
-            line.strip()
-            for line in jd.splitlines()
-            if len(line.strip()) > 2
-        )
-
-        # Check cache first
-        cached_result = await get_cached_jd_async(jd)
+        jd = _clean_jd(jd)
+        if len(jd) < _MIN_JD_LENGTH:
+            logger.info("JD empty or too short, skipping analysis (async)")
+            return _empty_jd_analysis("Job description is empty or too short")
+
+        # Check cache first (in-process, then Redis)
+        cache_text = _jd_cache_text(jd)
+        cached_result = _jd_memory_cache.get(cache_text)
+        if cached_result:
+            logger.info("JD analysis memory cache hit (async)")
+            return cached_result
+
+        cached_result = await get_cached_jd_async(cache_text)
         if cached_result:
             logger.info("JD analysis cache hit (async)")
+            _jd_memory_cache.set(cache_text, cached_result)
             return cached_result
 
         logger.info("JD analysis cache miss, calling LLM (async)")
         
-        # Call LLM async
-        raw = await _llm_call_async(JD_PROMPT.format(jd=jd))
+        # Call LLM async (concurrent requests for the same JD share one call)
+        prompt = JD_PROMPT.format(jd=jd)
+        raw = await run_once_async(("jd_analysis", prompt), lambda: _llm_call_async(prompt))
         parsed = _safe_json(raw)
         data = _normalize_schema(parsed)
 
-        # Auto-build ATS keywords if missing
+        # Auto-build ATS keywords if missing (deduplicated, in JD order so
+        # results and downstream cache keys are reproducible)
         if not data["ats_keywords"]:
             data["ats_keywords"] = list(
-                set(
-                    data["required_skills"]
-                    + data["optional_skills"]
-                    + data["tools"]
+                dict.fromkeys(
+                    chain(
+                        _as_keyword_list(data["required_skills"]),
+                        _as_keyword_list(data["optional_skills"]),
+                        _as_keyword_list(data["tools"]),
+                    )
                 )
             )
 
@@ -275,31 +287,17 @@ async def analyze_jd_async(jd: str) -> dict:
         }
         
         # Cache the result
-        await set_cached_jd_async(jd, result, ttl=CACHE_JD_TTL)
+        _jd_memory_cache.set(cache_text, result)
+        await set_cached_jd_async(cache_text, result, ttl=CACHE_JD_TTL)
         
         return result
 
     except Exception as e:
         # Log error with context
-        import logging
-        logger = logging.getLogger(__name__)
         logger.error(f"JD analysis failed: {e}", exc_info=True)
         
         # Hard fail-safe - return empty structure but log the error
-        return {
-            "role": "",
-            "seniority": "",
-            "required_skills": [],
-            "optional_skills": [],
-            "tools": [],
-            "responsibilities": [],
-            "ats_keywords": {
-                "required_skills": [],
-                "optional_skills": [],
-                "tools": [],
-            },
-            "error": str(e),
-        }
+        return _empty_jd_analysis(str(e))
 
 
 def analyze_jd(jd: str) -> dict:
@@ -310,28 +308,33 @@ def analyze_jd(jd: str) -> dict:
     """
     from core.cache import get_cached_jd, set_cached_jd
     from core.settings import CACHE_JD_TTL
-    import logging
-    
-    logger = logging.getLogger(__name__)
-    
+
     try:
         # Clean JD input
-        jd = "\n".join(
-            line.strip()
-            for line in jd.splitlines()
-            if len(line.strip()) > 2
-        )
-
-        # Check cache first
-        cached_result = get_cached_jd(jd)
+        jd = _clean_jd(jd)
+        if len(jd) < _MIN_JD_LENGTH:
+            logger.info("JD empty or too short, skipping analysis")
+            return _empty_jd_analysis("Job description is empty or too short")
+
+        # Check cache first (in-process, then Redis)
+        cache_text = _jd_cache_text(jd)
+        cached_result = _jd_memory_cache.get(cache_text)
+        if cached_result:
+            logger.info("JD analysis memory cache hit")
+            return cached_result
+
+        cached_result = get_cached_jd(cache_text)
         if cached_result:
             logger.info("JD analysis cache hit")
+            _jd_memory_cache.set(cache_text, cached_result)
             return cached_result
 
         logger.info("JD analysis cache miss, calling LLM")
         
-        # Call LLM (synchronous for now, can be made async later)
-        raw = _llm_call(JD_PROMPT.format(jd=jd))
+        # Call LLM (synchronous for now, can be made async later;
+        # concurrent requests for the same JD share one call)
+        prompt = JD_PROMPT.format(jd=jd)
+        raw = run_once(("jd_analysis", prompt), lambda: _llm_call(prompt))
         parsed = _safe_json(raw)
         data = _normalize_schema(parsed)
 
@@ -364,28 +367,20 @@ def analyze_jd(jd: str) -> dict:
         }
         
         # Cache the result
-        set_cached_jd(jd, result, ttl=CACHE_JD_TTL)
+        _jd_memory_cache.set(cache_text, result)
+        set_cached_jd(cache_text, result, ttl=CACHE_JD_TTL)
         
         return result
 
     except Exception as e:
         # Log error with context
-        import logging
-        logger = logging.getLogger(__name__)
         logger.error(f"JD analysis failed: {e}", exc_info=True)
         
         # Hard fail-safe - return empty structure but log the error
-        return {
-            "role": "",
-            "seniority": "",
-            "required_skills": [],
-            "optional_skills": [],
-            "tools": [],
-            "responsibilities": [],
-            "ats_keywords": {
-                "required_skills": [],
-                "optional_skills": [],
-                "tools": [],
-            },
-            "error": str(e),
-        }
+        return _empty_jd_analysis(str(e))
+
+
+__all__ = [
+    "analyze_jd",
+    "analyze_jd_async",
+]
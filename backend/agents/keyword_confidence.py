@@ -1,16 +1,18 @@
 # agents/keyword_confidence.py
-from typing import Dict, List
+from typing import Dict, List, Optional, Set
 from agents.ats_scorer import _tokenize, _match_keyword
 
 
 def keyword_confidence(
     jd_keywords: Dict[str, List[str]],
     resume_text: str,
+    resume_tokens: Optional[Set[str]] = None,
 ) -> Dict[str, Dict[str, List[str]]]:
     """
-    Returns keywords grouped by confidence level
+    Returns keywords grouped by confidence level.
+    Pass ``resume_tokens`` to reuse an already tokenized resume.
     """
-    tokens = _tokenize(resume_text)
+    tokens = resume_tokens if resume_tokens is not None else _tokenize(resume_text)
 
     high = {"required_skills": [], "optional_skills": [], "tools": []}
     medium = {"required_skills": [], "optional_skills": [], "tools": []}
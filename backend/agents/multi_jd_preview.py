@@ -1,14 +1,30 @@
-from agents.ats_scorer import score_detailed
+from concurrent.futures import ThreadPoolExecutor
+from agents.ats_scorer import score_detailed, _tokenize
 from agents.resume_formatter import format_resume_text
 
+# Per-JD scores are independent; each does its own ATS cache round trips,
+# which overlap when scored side by side
+_preview_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="jd_preview")
+
+
+def shutdown_preview_executor() -> None:
+    """Stop the JD preview thread pool (app shutdown)."""
+    _preview_executor.shutdown(wait=True, cancel_futures=True)
+
 
 def multi_jd_preview(jds: dict, resume: dict):
-    results = {}
+    # Same resume for every JD: format and tokenize it once
+    resume_text = format_resume_text(resume)
+    resume_tokens = _tokenize(resume_text)
 
-    for jd_id, jd_keywords in jds.items():
-        results[jd_id] = score_detailed(
+    def _score(jd_keywords):
+        return score_detailed(
             jd_keywords,
-            format_resume_text(resume),
+            resume_text,
+            resume_tokens=resume_tokens,
         )
 
-    return results
+    if len(jds) <= 1:
+        return {jd_id: _score(jd_keywords) for jd_id, jd_keywords in jds.items()}
+
+    return dict(zip(jds.keys(), _preview_executor.map(_score, jds.values())))
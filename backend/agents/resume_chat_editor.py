@@ -1,5 +1,6 @@
 import json
 import core.llm
+from core.singleflight import run_once
 
 
 INTENT_PROMPT = """
@@ -90,10 +91,9 @@ def apply_chat_edit(resume: dict, intent: dict) -> dict:
     """
     from agents.resume_formatter import format_resume_text
     
+    # Shallow copy; each action replaces only the lists/dicts it changes, so
+    # the caller's resume is never mutated (preview_chat_edit relies on this)
     resume = resume.copy()
-    
-    # Get original resume text for validation
-    original_resume_text = format_resume_text(resume)
 
     action = intent["action"]
 
@@ -101,7 +101,7 @@ def apply_chat_edit(resume: dict, intent: dict) -> dict:
         skill = intent["skill"]
         # Validate skill is not hallucinated (should be in allowed list or user explicitly added)
         if skill not in resume["skills"]:
-            resume["skills"].append(skill)
+            resume["skills"] = [*resume["skills"], skill]
 
     elif action == "remove_skill":
         resume["skills"] = [
@@ -111,7 +111,14 @@ def apply_chat_edit(resume: dict, intent: dict) -> dict:
 
     elif action == "rewrite_bullet":
         idx = intent["index"]
-        original_bullet = resume["experience"][intent["exp_index"]]["bullets"][idx]
+        exp_index = intent["exp_index"]
+        experience = list(resume["experience"])
+        exp = dict(experience[exp_index])
+        bullets = list(exp["bullets"])
+        original_bullet = bullets[idx]
+        
+        # Original resume text for validation (only this action needs it)
+        original_resume_text = format_resume_text(resume)
         
         # Use safe rewrite with original resume for validation
         rewritten = _rewrite_text(
@@ -119,7 +126,10 @@ def apply_chat_edit(resume: dict, intent: dict) -> dict:
             original_resume=original_resume_text
         )
         
-        resume["experience"][intent["exp_index"]]["bullets"][idx] = rewritten
+        bullets[idx] = rewritten
+        exp["bullets"] = bullets
+        experience[exp_index] = exp
+        resume["experience"] = experience
 
     return resume
 
@@ -164,12 +174,16 @@ def _rewrite_text(text: str, original_resume: str = "") -> str:
             min_similarity=0.3,  # At least 30% word overlap
         )
     
-    # Call LLM with validation
-    rewritten = safe_llm_call(
-        prompt=prompt,
-        validation_fn=validate_response,
-        fallback_value=text,  # Return original if validation fails
-        max_retries=2,
+    # Call LLM with validation (identical concurrent rewrites share one call;
+    # keyed on text too since the fallback and validation depend on it)
+    rewritten = run_once(
+        ("rewrite_text", prompt, text),
+        lambda: safe_llm_call(
+            prompt=prompt,
+            validation_fn=validate_response,
+            fallback_value=text,  # Return original if validation fails
+            max_retries=2,
+        ),
     )
     
     return rewritten.strip() if rewritten else text.strip()
@@ -1,7 +1,4 @@
 from io import BytesIO
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.lib.pagesizes import A4
 from agents.resume_formatter import format_resume_text
 
 
@@ -11,6 +8,11 @@ def export_pdf(resume_text: str) -> BytesIO:
     Note: This function takes resume_text (string), not resume dict.
     For resume dict, use exporters/pdf_exporter.py
     """
+    # reportlab is imported on first export, not at app startup
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.lib.pagesizes import A4
+
     buffer = BytesIO()
 
     doc = SimpleDocTemplate(
@@ -44,18 +46,20 @@ def export_docx(resume_text: str) -> BytesIO:
     Note: This function takes resume_text (string), not resume dict.
     For resume dict, use exporters/docx_exporter.py
     """
-    from docx import Document
+    from agents.exporters.docx_exporter import new_document, add_paragraph_with_style_id
     
-    doc = Document()
+    doc = new_document()
+    bullet_style_id = doc.styles["List Bullet"].style_id
     
     for line in resume_text.split("\n"):
-        if line.strip():
-            if line.strip().upper() in ["SUMMARY", "SKILLS", "EXPERIENCE"]:
-                doc.add_heading(line.strip(), level=1)
-            elif line.strip().startswith("- "):
-                doc.add_paragraph(line.strip()[2:], style="List Bullet")
+        stripped = line.strip()
+        if stripped:
+            if stripped.upper() in ["SUMMARY", "SKILLS", "EXPERIENCE"]:
+                doc.add_heading(stripped, level=1)
+            elif stripped.startswith("- "):
+                add_paragraph_with_style_id(doc, stripped[2:], bullet_style_id)
             else:
-                doc.add_paragraph(line.strip())
+                doc.add_paragraph(stripped)
     
     buffer = BytesIO()
     doc.save(buffer)
@@ -2,17 +2,11 @@
 """
 Resume management - track multiple resumes, applications, and performance.
 """
-import json
 import uuid
 import logging
-import redis
 from typing import Dict, List, Optional, Any
 from datetime import datetime
-from core.settings import (
-    REDIS_HOST,
-    REDIS_PORT,
-    REDIS_DB,
-)
+from core import json_codec
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +18,7 @@ if not is_sync_available():
     logger.warning("Redis connection pool not available for resume management")
 
 RESUME_TTL = 86400 * 90  # 90 days
+DASHBOARD_CACHE_TTL = 300  # 5 minutes; writes below invalidate it sooner
 
 
 def _resume_key(resume_id: str) -> str:
@@ -42,6 +37,24 @@ def _application_list_key(resume_id: str) -> str:
     return f"application:list:{resume_id}"
 
 
+def _dashboard_key(user_id: str = "default") -> str:
+    return f"resume:dashboard:{user_id}"
+
+
+def _dashboard_generation_key(user_id: str = "default") -> str:
+    return f"resume:dashboard:gen:{user_id}"
+
+
+def _invalidate_dashboard(client, user_id: str) -> None:
+    """
+    Drop the user's cached dashboard and bump its generation, so stats
+    computed before this write are never cached (client may be a pipeline).
+    """
+    client.incr(_dashboard_generation_key(user_id))
+    client.expire(_dashboard_generation_key(user_id), RESUME_TTL)
+    client.delete(_dashboard_key(user_id))
+
+
 def create_resume(
     resume_data: Dict[str, Any],
     user_id: str = "default",
@@ -86,17 +99,34 @@ def create_resume(
     redis_client.setex(
         _resume_key(resume_id),
         RESUME_TTL,
-        json.dumps(resume_meta)
+        json_codec.dumps(resume_meta)
     )
     
     # Add to user's resume list
     redis_client.sadd(_resume_list_key(user_id), resume_id)
     redis_client.expire(_resume_list_key(user_id), RESUME_TTL)
+    _invalidate_dashboard(redis_client, user_id)
     
     logger.info(f"Created resume {resume_id} for user {user_id}")
     return resume_id
 
 
+def _get_many(keys: List[str]) -> List[Dict[str, Any]]:
+    """Fetch and decode several records in one MGET round trip, skipping missing/corrupt ones."""
+    if not keys:
+        return []
+    
+    records = []
+    for key, data in zip(keys, redis_client.mget(keys)):
+        if not data:
+            continue
+        try:
+            records.append(json_codec.loads(data))
+        except ValueError as e:
+            logger.error(f"Error decoding {key}: {e}")
+    return records
+
+
 def get_resume(resume_id: str) -> Optional[Dict[str, Any]]:
     """Get resume metadata."""
     if not redis_client:
@@ -105,7 +135,7 @@ def get_resume(resume_id: str) -> Optional[Dict[str, Any]]:
     try:
         data = redis_client.get(_resume_key(resume_id))
         if data:
-            return json.loads(data)
+            return json_codec.loads(data)
     except Exception as e:
         logger.error(f"Error getting resume {resume_id}: {e}")
     
@@ -119,17 +149,14 @@ def list_resumes(user_id: str = "default", tags: List[str] = None) -> List[Dict[
     
     try:
         resume_ids = redis_client.smembers(_resume_list_key(user_id))
-        resumes = []
+        resumes = _get_many([_resume_key(resume_id) for resume_id in resume_ids])
         
-        for resume_id in resume_ids:
-            resume = get_resume(resume_id)
-            if resume:
-                # Filter by tags if provided
-                if tags:
-                    resume_tags = resume.get("tags", [])
-                    if not any(tag in resume_tags for tag in tags):
-                        continue
-                resumes.append(resume)
+        # Filter by tags if provided
+        if tags:
+            resumes = [
+                resume for resume in resumes
+                if any(tag in resume.get("tags", []) for tag in tags)
+            ]
         
         # Sort by updated_at (most recent first)
         resumes.sort(key=lambda x: x.get("updated_at", ""), reverse=True)
@@ -165,8 +192,9 @@ def update_resume(
     redis_client.setex(
         _resume_key(resume_id),
         RESUME_TTL,
-        json.dumps(resume)
+        json_codec.dumps(resume)
     )
+    _invalidate_dashboard(redis_client, resume.get("user_id", "default"))
 
 
 def create_application(
@@ -211,40 +239,43 @@ def create_application(
         "updated_at": datetime.now().isoformat(),
     }
     
-    # Store application
-    redis_client.setex(
-        _application_key(application_id),
-        RESUME_TTL,
-        json.dumps(application)
-    )
-    
-    # Add to resume's application list
-    redis_client.sadd(_application_list_key(resume_id), application_id)
-    redis_client.expire(_application_list_key(resume_id), RESUME_TTL)
+    app_key = _application_key(application_id)
+    list_key = _application_list_key(resume_id)
+    resume_key = _resume_key(resume_id)
     
-    # Update resume stats
-    resume = get_resume(resume_id)
-    if resume:
-        stats = resume.get("stats", {})
-        stats["total_applications"] = stats.get("total_applications", 0) + 1
-        
-        if ats_score:
-            current_avg = stats.get("average_ats_score", 0)
-            total = stats.get("total_applications", 1)
-            stats["average_ats_score"] = ((current_avg * (total - 1)) + ats_score) / total
+    def _record(pipe):
+        # Read the resume under WATCH; the writes below go out as one MULTI/EXEC,
+        # retried by transaction() if the resume changed in between
+        data = pipe.get(resume_key)
+        resume = json_codec.loads(data) if data else None
         
-        if status == "interview":
-            stats["interviews"] = stats.get("interviews", 0) + 1
-        elif status == "rejected":
-            stats["rejections"] = stats.get("rejections", 0) + 1
+        pipe.multi()
+        # Store application and add to resume's application list
+        pipe.setex(app_key, RESUME_TTL, json_codec.dumps(application))
+        pipe.sadd(list_key, application_id)
+        pipe.expire(list_key, RESUME_TTL)
         
-        update_resume(resume_id, stats=stats)
-        resume["application_count"] = stats["total_applications"]
-        redis_client.setex(
-            _resume_key(resume_id),
-            RESUME_TTL,
-            json.dumps(resume)
-        )
+        # Update resume stats
+        if resume:
+            stats = resume.setdefault("stats", {})
+            stats["total_applications"] = stats.get("total_applications", 0) + 1
+            
+            if ats_score:
+                current_avg = stats.get("average_ats_score", 0)
+                total = stats.get("total_applications", 1)
+                stats["average_ats_score"] = ((current_avg * (total - 1)) + ats_score) / total
+            
+            if status == "interview":
+                stats["interviews"] = stats.get("interviews", 0) + 1
+            elif status == "rejected":
+                stats["rejections"] = stats.get("rejections", 0) + 1
+            
+            resume["application_count"] = stats["total_applications"]
+            resume["updated_at"] = datetime.now().isoformat()
+            pipe.setex(resume_key, RESUME_TTL, json_codec.dumps(resume))
+            _invalidate_dashboard(pipe, resume.get("user_id", "default"))
+    
+    redis_client.transaction(_record, resume_key)
     
     logger.info(f"Created application {application_id} for resume {resume_id}")
     return application_id
@@ -257,12 +288,7 @@ def list_applications(resume_id: str) -> List[Dict[str, Any]]:
     
     try:
         app_ids = redis_client.smembers(_application_list_key(resume_id))
-        applications = []
-        
-        for app_id in app_ids:
-            data = redis_client.get(_application_key(app_id))
-            if data:
-                applications.append(json.loads(data))
+        applications = _get_many([_application_key(app_id) for app_id in app_ids])
         
         # Sort by created_at (most recent first)
         applications.sort(key=lambda x: x.get("created_at", ""), reverse=True)
@@ -285,7 +311,7 @@ def update_application_status(
     if not data:
         raise ValueError(f"Application {application_id} not found")
     
-    application = json.loads(data)
+    application = json_codec.loads(data)
     old_status = application.get("status")
     application["status"] = status
     application["updated_at"] = datetime.now().isoformat()
@@ -296,7 +322,7 @@ def update_application_status(
     redis_client.setex(
         _application_key(application_id),
         RESUME_TTL,
-        json.dumps(application)
+        json_codec.dumps(application)
     )
     
     # Update resume stats if status changed
@@ -322,7 +348,29 @@ def update_application_status(
 
 
 def get_dashboard_stats(user_id: str = "default") -> Dict[str, Any]:
-    """Get dashboard statistics for a user."""
+    """
+    Get dashboard statistics for a user.
+    
+    The aggregate is cached per user and dropped whenever one of the user's
+    resumes or applications changes, so repeat page loads skip fetching and
+    decoding every resume. Cached stats carry the generation they were
+    computed at and are only served while it is current, so a write that
+    lands mid-computation cannot leave stale stats behind.
+    """
+    generation = None
+    if redis_client:
+        try:
+            cached, generation = redis_client.mget(
+                [_dashboard_key(user_id), _dashboard_generation_key(user_id)]
+            )
+            generation = int(generation or 0)
+            if cached:
+                cached = json_codec.loads(cached)
+                if cached.get("generation") == generation:
+                    return cached["stats"]
+        except Exception as e:
+            logger.warning(f"Error reading cached dashboard for {user_id}: {e}")
+    
     resumes = list_resumes(user_id)
     
     total_resumes = len(resumes)
@@ -341,7 +389,7 @@ def get_dashboard_stats(user_id: str = "default") -> Dict[str, Any]:
     # Calculate interview rate
     interview_rate = (total_interviews / total_applications * 100) if total_applications > 0 else 0
     
-    return {
+    stats = {
         "total_resumes": total_resumes,
         "total_applications": total_applications,
         "total_interviews": total_interviews,
@@ -360,4 +408,16 @@ def get_dashboard_stats(user_id: str = "default") -> Dict[str, Any]:
             for r in resumes[:10]  # Top 10 most recent
         ]
     }
+    
+    if generation is not None:
+        try:
+            redis_client.setex(
+                _dashboard_key(user_id),
+                DASHBOARD_CACHE_TTL,
+                json_codec.dumps({"generation": generation, "stats": stats}),
+            )
+        except Exception as e:
+            logger.warning(f"Error caching dashboard for {user_id}: {e}")
+    
+    return stats
 
@@ -3,6 +3,22 @@ import json
 import re
 import core.llm
 from typing import Dict, List
+from core import json_codec
+from core.memory_cache import MemoryCache
+from core.singleflight import run_once, run_once_async
+
+# Returned by the LLM wrappers when every attempt failed or was invalid;
+# rewrite() treats it as a failure rather than an (empty) rewrite
+_REWRITE_FALLBACK_JSON = '{"summary": "", "experience": [], "skills": []}'
+
+# Precompiled validate_rewrite patterns (run per summary/bullet)
+_WORD_RE = re.compile(r"\b\w+\b")
+_TECH_TERM_RE = re.compile(
+    r"\b(python|java|javascript|react|node|aws|docker|kubernetes|sql|mongodb|redis|postgresql|mysql|git|jenkins|terraform|ansible"
+    r"|api|rest|graphql|microservices|agile|scrum|devops|ci/cd)\b"
+)
+_SKILLS_SECTION_RE = re.compile(r"skills?[:\s]+([^\n]+(?:\n[^\n]+)*)")
+_SKILL_SPLIT_RE = re.compile(r"[,;|•\n]")
 
 
 # -------------------------------------------------
@@ -21,7 +37,6 @@ async def _llm_call_async(prompt: str, validate_json: bool = True) -> str:
         LLM response string
     """
     from core.llm_safe_async import safe_llm_call_async
-    import json
     
     if validate_json:
         def validate_response(response: str) -> bool:
@@ -29,19 +44,15 @@ async def _llm_call_async(prompt: str, validate_json: bool = True) -> str:
                 return False
             try:
                 # Try to find and parse JSON
-                import re
-                match = re.search(r"\{[\s\S]*\}", response)
-                if match:
-                    json.loads(match.group())
-                    return True
-                return False
-            except (json.JSONDecodeError, AttributeError):
+                json_codec.extract_object(response)
+                return True
+            except (ValueError, AttributeError):
                 return False
         
         return await safe_llm_call_async(
             prompt=prompt,
             validation_fn=validate_response,
-            fallback_value='{"summary": "", "experience": [], "skills": []}',
+            fallback_value=_REWRITE_FALLBACK_JSON,
             max_retries=3,
         )
     else:
@@ -66,7 +77,6 @@ def _llm_call(prompt: str, validate_json: bool = True) -> str:
         LLM response string
     """
     from core.llm_safe import safe_llm_call
-    import json
     
     if validate_json:
         def validate_response(response: str) -> bool:
@@ -74,19 +84,15 @@ def _llm_call(prompt: str, validate_json: bool = True) -> str:
                 return False
             try:
                 # Try to find and parse JSON
-                import re
-                match = re.search(r"\{[\s\S]*\}", response)
-                if match:
-                    json.loads(match.group())
-                    return True
-                return False
-            except (json.JSONDecodeError, AttributeError):
+                json_codec.extract_object(response)
+                return True
+            except (ValueError, AttributeError):
                 return False
         
         return safe_llm_call(
             prompt=prompt,
             validation_fn=validate_response,
-            fallback_value='{"summary": "", "experience": [], "skills": []}',
+            fallback_value=_REWRITE_FALLBACK_JSON,
             max_retries=3,
         )
     else:
@@ -167,16 +173,75 @@ ORIGINAL RESUME:
 {resume}
 """
 
+# Bump whenever REWRITE_PROMPT changes so cached rewrites from the old prompt are ignored
+REWRITE_PROMPT_VERSION = "1"
+
+# REWRITE_PROMPT split around its two placeholders once at import (formatting
+# with sentinels resolves the {{ }} escapes), so building a prompt is a join
+_REWRITE_PROMPT_HEAD, _REWRITE_PROMPT_MIDDLE, _REWRITE_PROMPT_TAIL = (
+    REWRITE_PROMPT.format(allowed_keywords="\0", resume="\0").split("\0")
+)
+
+
+def _build_rewrite_prompt(safe_keywords: dict, resume: str) -> str:
+    """
+    REWRITE_PROMPT filled in. Keywords go in as compact single-line JSON:
+    indentation only adds prompt tokens.
+    """
+    return "".join((
+        _REWRITE_PROMPT_HEAD,
+        json.dumps(safe_keywords),
+        _REWRITE_PROMPT_MIDDLE,
+        resume,
+        _REWRITE_PROMPT_TAIL,
+    ))
+
+
+def _rewrite_cache_text(resume: str) -> str:
+    """
+    Cache identity for a resume: prompt version plus the resume with
+    whitespace collapsed, so re-pasted or re-extracted copies that differ
+    only in spacing/line breaks share one LLM rewrite. Case is kept, since
+    the rewrite reproduces the resume's own wording.
+    """
+    return f"{REWRITE_PROMPT_VERSION}|{' '.join(resume.split())}"
+
+
+# In-process tier in front of the Redis rewrite cache: exact repeats on the
+# same worker (undo/redo, retries) skip the Redis round trip and JSON decode
+_REWRITE_MEMORY_CACHE_SIZE = 256
+_rewrite_memory_cache = MemoryCache(_REWRITE_MEMORY_CACHE_SIZE)
+
 
 # -------------------------------------------------
 # JSON safety
 # -------------------------------------------------
 
 def _safe_json(text: str) -> dict:
-    match = re.search(r"\{[\s\S]*\}", text)
-    if not match:
-        raise ValueError("No JSON found in LLM output")
-    return json.loads(match.group())
+    return json_codec.parse_llm_object(text)
+
+
+def _coerce_rewrite(data: dict) -> dict:
+    """
+    Normalize a parsed LLM rewrite to the shape validate_rewrite expects.
+
+    Non-dict experience entries and non-string bullets/skills are dropped
+    here once, so one malformed item doesn't fail the whole rewrite.
+    """
+    experience = []
+    for exp in data.get("experience") or []:
+        if not isinstance(exp, dict):
+            continue
+        exp = dict(exp)
+        exp["title"] = str(exp.get("title") or "")
+        exp["bullets"] = [b for b in exp.get("bullets") or [] if isinstance(b, str)]
+        experience.append(exp)
+
+    return {
+        "summary": str(data.get("summary") or ""),
+        "experience": experience,
+        "skills": [s for s in data.get("skills") or [] if isinstance(s, str)],
+    }
 
 
 # -------------------------------------------------
@@ -260,7 +325,7 @@ def validate_rewrite(
     
     logger = logging.getLogger(__name__)
     original_lower = original_resume.lower()
-    original_words = set(re.findall(r'\b\w+\b', original_lower))
+    original_words = set(_WORD_RE.findall(original_lower))
 
     allowed_flat = set(
         allowed_keywords.get("explicit", [])
@@ -272,6 +337,24 @@ def validate_rewrite(
         for v in baseline_keywords.values():
             baseline_flat.update(v)
 
+    # Lowercased once here rather than per bullet / per skill below
+    baseline_lower = frozenset(kw.lower() for kw in baseline_flat)
+    allowed_lower = frozenset(kw.lower() for kw in allowed_flat)
+
+    # Keywords that already appear in the original resume, combined into one
+    # alternation so each candidate text is scanned once instead of per keyword
+    grounded_keywords = {
+        kw for kw in baseline_lower | allowed_lower
+        if kw in original_lower
+    }
+    grounded_re = re.compile(
+        "|".join(map(re.escape, sorted(grounded_keywords, key=len, reverse=True)))
+    ) if grounded_keywords else None
+
+    # Tech term -> whether it occurs in the original; each distinct term scans
+    # the original resume once per call, not once per bullet it appears in
+    tech_in_original: Dict[str, bool] = {}
+
     def safe_text(text: str) -> bool:
         """
         Accept if:
@@ -287,7 +370,7 @@ def validate_rewrite(
             return False
             
         text_l = text.lower()
-        text_words = set(re.findall(r'\b\w+\b', text_l))
+        text_words = set(_WORD_RE.findall(text_l))
         
         # Check 1: Exact phrase match (allowing for minor rephrasing)
         # If 70% of words are from original, likely safe
@@ -295,35 +378,19 @@ def validate_rewrite(
         if len(text_words) > 0 and len(words_from_original) / len(text_words) >= 0.7:
             return True
         
-        # Check 2: Contains baseline keywords (already matched in original)
-        for kw in baseline_flat:
-            if kw.lower() in text_l:
-                # Verify this keyword was actually in original
-                if kw.lower() in original_lower:
-                    return True
-        
-        # Check 3: Contains allowed keywords that are in original
-        for kw in allowed_flat:
-            if kw.lower() in text_l:
-                # Only allow if keyword exists in original resume
-                if kw.lower() in original_lower:
-                    return True
+        # Check 2/3: Contains baseline or allowed keywords that exist in original
+        if grounded_re is not None and grounded_re.search(text_l):
+            return True
         
         # Check 4: Extract potential new skills/technologies and verify they're in original
-        # Common tech keywords pattern
-        tech_patterns = [
-            r'\b(python|java|javascript|react|node|aws|docker|kubernetes|sql|mongodb|redis|postgresql|mysql|git|jenkins|terraform|ansible)\b',
-            r'\b(api|rest|graphql|microservices|agile|scrum|devops|ci/cd)\b',
-        ]
-        
-        for pattern in tech_patterns:
-            matches = re.findall(pattern, text_l, re.IGNORECASE)
-            for match in matches:
-                if isinstance(match, tuple):
-                    match = match[0] if match else ""
-                if match and match.lower() not in original_lower:
-                    logger.warning(f"Rejecting text with new technology not in original: {match}")
-                    return False
+        # (common tech keywords, text_l is already lowercase)
+        for match in _TECH_TERM_RE.findall(text_l):
+            in_original = tech_in_original.get(match)
+            if in_original is None:
+                in_original = tech_in_original[match] = match in original_lower
+            if not in_original:
+                logger.warning(f"Rejecting text with new technology not in original: {match}")
+                return False
         
         # If we can't verify it's safe, reject it (conservative approach)
         logger.debug(f"Rejecting unverified text: {text[:50]}...")
@@ -348,36 +415,31 @@ def validate_rewrite(
     # Skills section validation - STRICT: only skills from original, baseline, or approved
     original_skills_lower = set()
     # Extract skills from original resume (look for skills section or common patterns)
-    skills_section_match = re.search(r'skills?[:\s]+([^\n]+(?:\n[^\n]+)*)', original_lower, re.IGNORECASE)
+    skills_section_match = _SKILLS_SECTION_RE.search(original_lower)
     if skills_section_match:
         skills_text = skills_section_match.group(1)
         # Split by common delimiters
-        for skill in re.split(r'[,;|•\n]', skills_text):
+        for skill in _SKILL_SPLIT_RE.split(skills_text):
             skill = skill.strip()
             if skill and len(skill) > 2:
                 original_skills_lower.add(skill.lower())
     
     # Also check baseline keywords (already matched skills)
-    for kw in baseline_flat:
-        original_skills_lower.add(kw.lower())
+    original_skills_lower |= baseline_lower
     
     # Approved skills (user-approved to add)
-    approved_skills_lower = set()
-    if approved_skills:
-        for skill in approved_skills:
-            approved_skills_lower.add(skill.lower())
+    approved_skills_lower = {skill.lower() for skill in approved_skills or ()}
     
     # Track rejected skills for user approval
     rejected_skills = []
     
-    # Filter skills: keep if in original, baseline, or approved
+    # Filter skills: keep if in original/baseline or approved. Duplicates are
+    # dropped up front so each distinct skill is checked (and logged) once
     validated_skills = []
-    for skill in rewritten.get("skills", []):
+    for skill in dict.fromkeys(rewritten.get("skills", [])):
         skill_lower = skill.lower()
         if skill_lower in original_skills_lower:
             validated_skills.append(skill)
-        elif skill_lower in [kw.lower() for kw in baseline_flat]:
-            validated_skills.append(skill)
         elif skill_lower in approved_skills_lower:
             # User approved this skill - allow it
             validated_skills.append(skill)
@@ -387,29 +449,24 @@ def validate_rewrite(
             rejected_skills.append(skill)
             logger.warning(f"Rejected skill not in original resume: {skill}")
     
-    rewritten["skills"] = list(dict.fromkeys(validated_skills))  # Remove duplicates
+    rewritten["skills"] = validated_skills
     
     # IMPORTANT: Explicitly add approved skills if they're not already in the list
     # This ensures approved skills are added even if LLM didn't include them
     if approved_skills:
+        present_skills_lower = {skill.lower() for skill in rewritten["skills"]}
         for approved_skill in approved_skills:
             approved_skill_lower = approved_skill.lower()
             # Check if this skill is already in the validated skills (case-insensitive)
-            already_present = any(
-                existing_skill.lower() == approved_skill_lower 
-                for existing_skill in rewritten["skills"]
-            )
-            if not already_present:
+            if approved_skill_lower not in present_skills_lower:
                 # Add the approved skill
                 rewritten["skills"].append(approved_skill)
+                present_skills_lower.add(approved_skill_lower)
                 logger.info(f"Explicitly added approved skill: {approved_skill}")
     
-    # Remove duplicates again after adding approved skills
-    rewritten["skills"] = list(dict.fromkeys(rewritten["skills"]))
-    
     # Add rejected_skills to return value for user approval (only if not already approved)
     if rejected_skills:
-        rewritten["_rejected_skills"] = list(dict.fromkeys(rejected_skills))
+        rewritten["_rejected_skills"] = rejected_skills
 
     return rewritten
 
@@ -441,9 +498,15 @@ async def rewrite_async(
     try:
         # Generate cache key from resume and JD keywords
         jd_keywords_hash = hash_jd_keywords(jd_keywords)
+        cache_text = _rewrite_cache_text(resume)
         
-        # Check cache first
-        cached_result = await get_cached_rewrite_async(resume, jd_keywords_hash)
+        # Check cache first (in-process, then Redis)
+        memory_key = (cache_text, jd_keywords_hash)
+        cached_result = _rewrite_memory_cache.get(memory_key)
+        if cached_result is None:
+            cached_result = await get_cached_rewrite_async(cache_text, jd_keywords_hash)
+            if cached_result:
+                _rewrite_memory_cache.set(memory_key, cached_result)
         if cached_result:
             logger.info("Resume rewrite cache hit (async)")
             # Still validate cached result (safety check)
@@ -459,23 +522,15 @@ async def rewrite_async(
         
         safe_keywords = format_allowed_keywords(jd_keywords)
 
-        raw = await _llm_call_async(
-            REWRITE_PROMPT.format(
-                allowed_keywords=json.dumps(
-                    safe_keywords,
-                    indent=2,
-                ),
-                resume=resume,
-            )
-        )
+        prompt = _build_rewrite_prompt(safe_keywords, resume)
+        # Concurrent requests for the same rewrite (double submits, retries)
+        # share one LLM call
+        raw = await run_once_async(("rewrite", prompt), lambda: _llm_call_async(prompt))
+        if raw == _REWRITE_FALLBACK_JSON:
+            # Not cached, so the next request retries the LLM
+            raise ValueError("LLM returned no valid rewrite after retries")
 
-        data = _safe_json(raw)
-
-        rewritten = {
-            "summary": str(data.get("summary", "")),
-            "experience": list(data.get("experience", [])),
-            "skills": list(data.get("skills", [])),
-        }
+        rewritten = _coerce_rewrite(_safe_json(raw))
 
         # 🔒 Final validation
         rewritten = validate_rewrite(
@@ -489,14 +544,14 @@ async def rewrite_async(
         # Cache the result (but don't cache user-approved skills - they're job-specific)
         # Remove _rejected_skills from cached version
         cached_version = {k: v for k, v in rewritten.items() if not k.startswith("_")}
-        await set_cached_rewrite_async(resume, jd_keywords_hash, cached_version, ttl=CACHE_REWRITE_TTL)
+        _rewrite_memory_cache.set(memory_key, cached_version)
+        await set_cached_rewrite_async(cache_text, jd_keywords_hash, cached_version, ttl=CACHE_REWRITE_TTL)
 
         return rewritten
 
-    except Exception as e:
-        # Log error with context
-        import logging
-        logger = logging.getLogger(__name__)
+    except (ValueError, TypeError, KeyError, AttributeError) as e:
+        # Unusable LLM output or malformed input; anything else is a bug and
+        # propagates instead of being reported as an empty rewrite
         logger.error(f"Resume rewrite failed: {e}", exc_info=True)
         
         # Return safe fallback with error info
@@ -550,9 +605,15 @@ def rewrite(
     try:
         # Generate cache key from resume and JD keywords
         jd_keywords_hash = hash_jd_keywords(jd_keywords)
+        cache_text = _rewrite_cache_text(resume)
         
-        # Check cache first
-        cached_result = get_cached_rewrite(resume, jd_keywords_hash)
+        # Check cache first (in-process, then Redis)
+        memory_key = (cache_text, jd_keywords_hash)
+        cached_result = _rewrite_memory_cache.get(memory_key)
+        if cached_result is None:
+            cached_result = get_cached_rewrite(cache_text, jd_keywords_hash)
+            if cached_result:
+                _rewrite_memory_cache.set(memory_key, cached_result)
         if cached_result:
             logger.info("Resume rewrite cache hit")
             # Still validate cached result (safety check)
@@ -569,23 +630,15 @@ def rewrite(
         
         safe_keywords = format_allowed_keywords(jd_keywords)
 
-        raw = _llm_call(
-            REWRITE_PROMPT.format(
-                allowed_keywords=json.dumps(
-                    safe_keywords,
-                    indent=2,
-                ),
-                resume=resume,
-            )
-        )
+        prompt = _build_rewrite_prompt(safe_keywords, resume)
+        # Concurrent requests for the same rewrite (double submits, retries)
+        # share one LLM call
+        raw = run_once(("rewrite", prompt), lambda: _llm_call(prompt))
+        if raw == _REWRITE_FALLBACK_JSON:
+            # Not cached, so the next request retries the LLM
+            raise ValueError("LLM returned no valid rewrite after retries")
 
-        data = _safe_json(raw)
-
-        rewritten = {
-            "summary": str(data.get("summary", "")),
-            "experience": list(data.get("experience", [])),
-            "skills": list(data.get("skills", [])),
-        }
+        rewritten = _coerce_rewrite(_safe_json(raw))
 
         # 🔒 Final validation
         rewritten = validate_rewrite(
@@ -599,14 +652,14 @@ def rewrite(
         # Cache the result (but don't cache user-approved skills - they're job-specific)
         # Remove _rejected_skills from cached version
         cached_version = {k: v for k, v in rewritten.items() if not k.startswith("_")}
-        set_cached_rewrite(resume, jd_keywords_hash, cached_version, ttl=CACHE_REWRITE_TTL)
+        _rewrite_memory_cache.set(memory_key, cached_version)
+        set_cached_rewrite(cache_text, jd_keywords_hash, cached_version, ttl=CACHE_REWRITE_TTL)
 
         return rewritten
 
-    except Exception as e:
-        # Log error with context
-        import logging
-        logger = logging.getLogger(__name__)
+    except (ValueError, TypeError, KeyError, AttributeError) as e:
+        # Unusable LLM output or malformed input; anything else is a bug and
+        # propagates instead of being reported as an empty rewrite
         logger.error(f"Resume rewrite failed: {e}", exc_info=True)
         
         # Return safe fallback with error info
@@ -617,3 +670,27 @@ def rewrite(
             "error": str(e),
             "note": "Rewrite failed, returning empty result",
         }
+
+
+async def rewrite_many_async(
+    items: List[Dict],
+    max_concurrent: int = 10,
+) -> List[dict]:
+    """
+    Rewrite several resume/JD pairs concurrently.
+
+    Each item holds rewrite_async's keyword arguments (jd_keywords, resume,
+    and optionally baseline_keywords / approved_skills). Up to
+    max_concurrent LLM calls run at once, so N rewrites take roughly one
+    rewrite's latency instead of N. Results are returned in input order;
+    a failed rewrite yields rewrite_async's fallback dict, not an exception.
+    """
+    import asyncio
+
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def rewrite_with_limit(item: Dict) -> dict:
+        async with semaphore:
+            return await rewrite_async(**item)
+
+    return await asyncio.gather(*(rewrite_with_limit(item) for item in items))
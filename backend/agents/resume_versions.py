@@ -1,14 +1,15 @@
 # agents/resume_versions.py
-import json
 import uuid
 import logging
 import redis
 from typing import Dict, Optional
+from core import json_codec
 from core.settings import (
     REDIS_HOST,
     REDIS_PORT,
     REDIS_DB,
     VERSION_TTL_SECONDS,
+    MAX_VERSIONS_PER_RESUME,
 )
 
 logger = logging.getLogger(__name__)
@@ -60,8 +61,8 @@ def get_current_version(resume_id: str) -> Optional[Dict]:
         if not version_data:
             return None
         
-        return json.loads(version_data)
-    except (redis.RedisError, json.JSONDecodeError, ValueError) as e:
+        return json_codec.loads(version_data)
+    except (redis.RedisError, ValueError) as e:
         logger.error(f"Error getting current version for resume {resume_id}: {e}")
         return None
 
@@ -92,34 +93,38 @@ def save_new_version(resume_id: str, parent: str, resume: Dict, change_summary:
             "summary": change_summary,
         }
         
-        # Save version data
-        redis_client.setex(
-            _version_key(resume_id, version_id),
-            VERSION_TTL_SECONDS,
-            json.dumps(version_data),
-        )
-        
-        # Get current pointer
-        pointer = redis_client.get(_pointer_key(resume_id))
-        if pointer is not None:
-            pointer = int(pointer)
-            # Trim versions list after current pointer (for undo/redo)
-            versions_list = redis_client.lrange(_versions_list_key(resume_id), 0, pointer)
-            redis_client.delete(_versions_list_key(resume_id))
-            if versions_list:
-                redis_client.rpush(_versions_list_key(resume_id), *versions_list)
-        
-        # Add new version to list
-        redis_client.rpush(_versions_list_key(resume_id), version_id)
-        redis_client.expire(_versions_list_key(resume_id), VERSION_TTL_SECONDS)
-        
-        # Update pointer
-        new_pointer = redis_client.llen(_versions_list_key(resume_id)) - 1
-        redis_client.setex(_pointer_key(resume_id), VERSION_TTL_SECONDS, str(new_pointer))
+        version_key = _version_key(resume_id, version_id)
+        pointer_key = _pointer_key(resume_id)
+        list_key = _versions_list_key(resume_id)
+        payload = json_codec.dumps(version_data)
+        
+        def _save(pipe):
+            # Read pointer and list length under WATCH; the writes below go out
+            # as one MULTI/EXEC, retried by transaction() on a concurrent save/undo/redo
+            pointer = pipe.get(pointer_key)
+            length = pipe.llen(list_key)
+            if pointer is not None:
+                # Drop versions after the current pointer (redo history)
+                length = min(length, int(pointer) + 1)
+            
+            pipe.multi()
+            pipe.setex(version_key, VERSION_TTL_SECONDS, payload)
+            if pointer is not None:
+                pipe.ltrim(list_key, 0, length - 1)
+            pipe.rpush(list_key, version_id)
+            new_pointer = length
+            if length >= MAX_VERSIONS_PER_RESUME:
+                # Cap undo history; dropped versions' data expires with its TTL
+                pipe.ltrim(list_key, -MAX_VERSIONS_PER_RESUME, -1)
+                new_pointer = MAX_VERSIONS_PER_RESUME - 1
+            pipe.expire(list_key, VERSION_TTL_SECONDS)
+            pipe.setex(pointer_key, VERSION_TTL_SECONDS, str(new_pointer))
+        
+        redis_client.transaction(_save, pointer_key, list_key)
         
         logger.info(f"Saved new version {version_id} for resume {resume_id}")
         return version_id
-    except (redis.RedisError, json.JSONEncodeError) as e:
+    except (redis.RedisError, TypeError, ValueError) as e:
         logger.error(f"Error saving version for resume {resume_id}: {e}")
         return None
 
@@ -148,9 +153,11 @@ def undo_version(resume_id: str) -> Optional[Dict]:
             return None
         
         new_pointer = pointer - 1
-        redis_client.setex(_pointer_key(resume_id), VERSION_TTL_SECONDS, str(new_pointer))
-        
-        version_id = redis_client.lindex(_versions_list_key(resume_id), new_pointer)
+        # Move the pointer and read the version id in one round trip
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.setex(_pointer_key(resume_id), VERSION_TTL_SECONDS, str(new_pointer))
+        pipe.lindex(_versions_list_key(resume_id), new_pointer)
+        _, version_id = pipe.execute()
         if not version_id:
             return None
         
@@ -159,8 +166,8 @@ def undo_version(resume_id: str) -> Optional[Dict]:
             return None
         
         logger.info(f"Undone to version {version_id} for resume {resume_id}")
-        return json.loads(version_data)
-    except (redis.RedisError, json.JSONDecodeError, ValueError) as e:
+        return json_codec.loads(version_data)
+    except (redis.RedisError, ValueError) as e:
         logger.error(f"Error undoing version for resume {resume_id}: {e}")
         return None
 
@@ -180,20 +187,23 @@ def redo_version(resume_id: str) -> Optional[Dict]:
         return None
     
     try:
-        pointer = redis_client.get(_pointer_key(resume_id))
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.get(_pointer_key(resume_id))
+        pipe.llen(_versions_list_key(resume_id))
+        pointer, list_length = pipe.execute()
         if pointer is None:
             return None
         
         pointer = int(pointer)
-        list_length = redis_client.llen(_versions_list_key(resume_id))
-        
         if pointer >= list_length - 1:
             return None
         
         new_pointer = pointer + 1
-        redis_client.setex(_pointer_key(resume_id), VERSION_TTL_SECONDS, str(new_pointer))
-        
-        version_id = redis_client.lindex(_versions_list_key(resume_id), new_pointer)
+        # Move the pointer and read the version id in one round trip
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.setex(_pointer_key(resume_id), VERSION_TTL_SECONDS, str(new_pointer))
+        pipe.lindex(_versions_list_key(resume_id), new_pointer)
+        _, version_id = pipe.execute()
         if not version_id:
             return None
         
@@ -202,7 +212,7 @@ def redo_version(resume_id: str) -> Optional[Dict]:
             return None
         
         logger.info(f"Redone to version {version_id} for resume {resume_id}")
-        return json.loads(version_data)
-    except (redis.RedisError, json.JSONDecodeError, ValueError) as e:
+        return json_codec.loads(version_data)
+    except (redis.RedisError, ValueError) as e:
         logger.error(f"Error redoing version for resume {resume_id}: {e}")
         return None
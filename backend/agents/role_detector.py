@@ -20,8 +20,33 @@ ROLE_KEYWORDS = {
 }
 
 
-def _normalize(text: str) -> str:
-    return re.sub(r"[^a-z0-9]", " ", text.lower())
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def _words(text: str) -> list:
+    """Lowercase alphanumeric words (punctuation acts as a separator)."""
+    return _WORD_RE.findall(text.lower())
+
+
+# Keywords split into words the same way as the text, so multi-word and
+# punctuated ones ("spring boot", "ci/cd" -> "ci cd") match as word sequences
+_ROLE_TERMS = {
+    role: frozenset(" ".join(_words(kw)) for kw in keywords)
+    for role, keywords in ROLE_KEYWORDS.items()
+}
+_PHRASE_LENGTHS = sorted({
+    len(term.split())
+    for terms in _ROLE_TERMS.values()
+    for term in terms
+} - {1})
+
+
+def _terms(words: list) -> set:
+    """The words plus the word sequences keywords can span."""
+    terms = set(words)
+    for n in _PHRASE_LENGTHS:
+        terms.update(" ".join(words[i:i + n]) for i in range(len(words) - n + 1))
+    return terms
 
 
 def detect_role(jd_text: str, resume_text: str) -> Dict:
@@ -30,15 +55,10 @@ def detect_role(jd_text: str, resume_text: str) -> Dict:
     No LLM. No hallucination risk.
     """
 
-    text = _normalize(jd_text + " " + resume_text)
-    tokens = set(text.split())
-
-    signals = {role: 0 for role in ROLE_KEYWORDS}
+    # One regex pass per text, no normalized copy or concatenated string
+    terms = _terms(_words(jd_text) + _words(resume_text))
 
-    for role, keywords in ROLE_KEYWORDS.items():
-        for kw in keywords:
-            if kw in tokens:
-                signals[role] += 1
+    signals = {role: len(keywords & terms) for role, keywords in _ROLE_TERMS.items()}
 
     # Pick dominant role
     role = max(signals, key=signals.get)
@@ -2,14 +2,18 @@
 """
 Skill gap analysis - identifies missing skills and provides recommendations.
 """
-from typing import Dict, List, Any
-from agents.ats_scorer import _tokenize, _match_keyword
+from collections import Counter
+from itertools import chain
+from operator import itemgetter
+from typing import Dict, List, Any, Optional, Set
+from agents.ats_scorer import _tokenize, _match_keywords
 
 
 def analyze_skill_gap(
     jd_keywords: Dict[str, List[str]],
     resume_text: str,
-    inferred_skills: List[Dict[str, Any]] = None
+    inferred_skills: List[Dict[str, Any]] = None,
+    resume_tokens: Optional[Set[str]] = None,
 ) -> Dict[str, Any]:
     """
     Analyze skill gaps between JD requirements and resume.
@@ -18,11 +22,13 @@ def analyze_skill_gap(
         jd_keywords: JD keywords organized by category
         resume_text: Resume text
         inferred_skills: Skills inferred from resume (optional)
+        resume_tokens: Pre-tokenized resume text (optional, skips re-tokenizing)
     
     Returns:
         Skill gap analysis with missing skills, recommendations, etc.
     """
-    resume_tokens = _tokenize(resume_text)
+    if resume_tokens is None:
+        resume_tokens = _tokenize(resume_text)
     
     # Track which skills are present
     present_skills = {
@@ -37,22 +43,33 @@ def analyze_skill_gap(
         "tools": []
     }
     
-    # Check each category
-    for category in ["required_skills", "optional_skills", "tools"]:
-        for skill in jd_keywords.get(category, []):
-            if _match_keyword(skill, resume_tokens):
-                present_skills[category].append(skill)
-            else:
-                missing_skills[category].append(skill)
+    # Match every category's skills in one pass over one cached keyword index
+    categorized = [
+        (category, skill)
+        for category in ["required_skills", "optional_skills", "tools"]
+        for skill in jd_keywords.get(category, [])
+    ]
+    match_types = _match_keywords([skill for _, skill in categorized], resume_tokens)
+    for (category, skill), match_type in zip(categorized, match_types):
+        if match_type:
+            present_skills[category].append(skill)
+        else:
+            missing_skills[category].append(skill)
     
     # Add inferred skills to present skills
     if inferred_skills:
         inferred_skill_names = [s["skill"] for s in inferred_skills if s.get("confidence", 0) >= 0.8]
+        # Lowercase the JD skills once, not per inferred skill
+        jd_skills_lower = {
+            category: [jd_skill.lower() for jd_skill in jd_keywords.get(category, [])]
+            for category in ["required_skills", "optional_skills", "tools"]
+        }
         for skill_name in inferred_skill_names:
+            skill_lower = skill_name.lower()
             # Check if this inferred skill matches any JD requirement
-            for category in ["required_skills", "optional_skills", "tools"]:
-                for jd_skill in jd_keywords.get(category, []):
-                    if skill_name.lower() in jd_skill.lower() or jd_skill.lower() in skill_name.lower():
+            for category, jd_skills in jd_skills_lower.items():
+                for jd_skill in jd_skills:
+                    if skill_lower in jd_skill or jd_skill in skill_lower:
                         if skill_name not in present_skills[category]:
                             present_skills[category].append(skill_name)
                         # Remove from missing if it was there
@@ -160,17 +177,15 @@ def _prioritize_missing_skills(
 ) -> List[Dict[str, Any]]:
     """Prioritize missing skills by importance."""
     # Skills that appear in multiple categories are more important
-    all_jd_skills = (
-        jd_keywords.get("required_skills", []) +
-        jd_keywords.get("optional_skills", []) +
-        jd_keywords.get("tools", [])
+    skill_frequency = Counter(
+        skill.lower()
+        for skill in chain(
+            jd_keywords.get("required_skills", []),
+            jd_keywords.get("optional_skills", []),
+            jd_keywords.get("tools", []),
+        )
     )
     
-    skill_frequency = {}
-    for skill in all_jd_skills:
-        skill_lower = skill.lower()
-        skill_frequency[skill_lower] = skill_frequency.get(skill_lower, 0) + 1
-    
     prioritized = []
     for skill in missing_required:
         priority = "high"  # All required skills are high priority
@@ -184,7 +199,7 @@ def _prioritize_missing_skills(
         })
     
     # Sort by frequency (skills mentioned multiple times are more important)
-    prioritized.sort(key=lambda x: x["frequency"], reverse=True)
+    prioritized.sort(key=itemgetter("frequency"), reverse=True)
     
     return prioritized
 
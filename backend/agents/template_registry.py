@@ -1,4 +1,6 @@
-TEMPLATES = {
+from types import MappingProxyType
+
+TEMPLATES = MappingProxyType({
     "classic": {
         "tone": "formal",
         "bullet_style": "full sentences",
@@ -11,7 +13,7 @@ TEMPLATES = {
         "tone": "leadership-focused",
         "bullet_style": "results-first",
     },
-}
+})
 
 
 def get_template(template_id: str) -> dict:
@@ -1,20 +1,91 @@
 from io import BytesIO
 from typing import Optional, Dict, Any
-from reportlab.platypus import (
-    SimpleDocTemplate,
-    Paragraph,
-    Spacer,
-    Table,
-    TableStyle,
-)
-from reportlab.lib.styles import ParagraphStyle
+from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import A4
-from reportlab.lib.enums import TA_LEFT, TA_CENTER
+from reportlab.lib.utils import simpleSplit
+from reportlab.pdfbase.pdfmetrics import stringWidth
 from reportlab.lib import colors
-from reportlab.lib.units import inch
 
 from agents.templates.registry import TEMPLATES, get_template
 
+# Line height in points: ParagraphStyle's default leading, which the
+# platypus styles this replaced never overrode (so it is fixed, not per size)
+_LEADING = 12
+# Inset of the text area inside the margins (platypus Frame's default padding)
+_FRAME_PADDING = 6
+
+
+class _PdfWriter:
+    """
+    Minimal top-to-bottom text layout on a reportlab canvas: wrapped plain
+    text lines, vertical spacing and page breaks. Resume content is plain
+    text, so platypus' markup parsing and flowable layout are not needed
+    (and "&" / "<" in bullets no longer break rendering).
+    """
+
+    def __init__(self, buffer: BytesIO, margin: float):
+        self.canvas = canvas.Canvas(buffer, pagesize=A4)
+        self.page_width, self.page_height = A4
+        self.margin = margin + _FRAME_PADDING
+        self.max_width = self.page_width - 2 * self.margin
+        self.y = self.page_height - self.margin
+        # Layout page vs. page the canvas is on: showPage is deferred until
+        # something is drawn, so trailing space never adds an empty page
+        self.page = 0
+        self._canvas_page = 0
+
+    def paragraph(self, text: str, style: dict) -> None:
+        """Draw text wrapped to the frame width, then the style's space after."""
+        font, size = style["font"], style["size"]
+        self.canvas.setFont(font, size)
+        self.canvas.setFillColor(style["color"])
+        for line in self._wrap(text, font, size):
+            if self.y - _LEADING < self.margin:
+                self._next_page()
+            while self._canvas_page < self.page:
+                self.canvas.showPage()
+                self._canvas_page += 1
+                # showPage resets the graphics state
+                self.canvas.setFont(font, size)
+                self.canvas.setFillColor(style["color"])
+            baseline = self.y - size
+            if style["centered"]:
+                self.canvas.drawCentredString(self.page_width / 2, baseline, line)
+            else:
+                self.canvas.drawString(self.margin, baseline, line)
+            self.y -= _LEADING
+        self.y -= style["space_after"]
+
+    def _next_page(self) -> None:
+        self.page += 1
+        self.y = self.page_height - self.margin
+
+    def _wrap(self, text: str, font: str, size: float) -> list:
+        """
+        Wrap like platypus Paragraph did: whitespace (including embedded
+        newlines) collapses to single spaces and words wider than the frame
+        are split across lines instead of running off the page.
+        """
+        lines = []
+        for line in simpleSplit(" ".join(text.split()), font, size, self.max_width):
+            while len(line) > 1 and stringWidth(line, font, size) > self.max_width:
+                cut = len(line) - 1
+                while cut > 1 and stringWidth(line[:cut], font, size) > self.max_width:
+                    cut -= 1
+                lines.append(line[:cut])
+                line = line[cut:]
+            lines.append(line)
+        return lines
+
+    def space(self, height: float) -> None:
+        """Vertical gap; one that does not fit starts the next page (as a platypus Spacer did)."""
+        if self.y - height < self.margin:
+            self._next_page()
+        self.y -= height
+
+    def save(self) -> None:
+        self.canvas.save()
+
 
 def render_pdf(
     resume_sections: dict,
@@ -44,14 +115,7 @@ def render_pdf(
 
     # Set margins based on layout
     margins = 36 if t.get("layout") == "single-column" else 30
-    doc = SimpleDocTemplate(
-        buffer,
-        pagesize=A4,
-        rightMargin=margins,
-        leftMargin=margins,
-        topMargin=margins,
-        bottomMargin=margins,
-    )
+    pdf = _PdfWriter(buffer, margins)
 
     # Define color scheme
     color_scheme = t.get("color_scheme", "monochrome")
@@ -60,8 +124,6 @@ def render_pdf(
     # Create styles
     styles = _create_styles(t, accent_color)
 
-    story = []
-
     # Contact information (if available in resume_sections)
     if "contact" in resume_sections and resume_sections["contact"]:
         contact = resume_sections["contact"]
@@ -76,18 +138,18 @@ def render_pdf(
             contact_text.append(contact["location"])
         
         if contact_text:
-            story.append(Paragraph(" | ".join(contact_text), styles["contact"]))
-            story.append(Spacer(1, t["section_spacing"]))
+            pdf.paragraph(" | ".join(contact_text), styles["contact"])
+            pdf.space(t["section_spacing"])
 
     # Summary
     if resume_sections.get("summary"):
-        story.append(Paragraph("SUMMARY", styles["heading"]))
-        story.append(Paragraph(resume_sections["summary"], styles["body"]))
-        story.append(Spacer(1, t["section_spacing"]))
+        pdf.paragraph("SUMMARY", styles["heading"])
+        pdf.paragraph(resume_sections["summary"], styles["body"])
+        pdf.space(t["section_spacing"])
 
     # Experience
     if resume_sections.get("experience"):
-        story.append(Paragraph("EXPERIENCE", styles["heading"]))
+        pdf.paragraph("EXPERIENCE", styles["heading"])
 
         for exp in resume_sections["experience"]:
             # Company and title
@@ -102,19 +164,19 @@ def render_pdf(
                 end = exp.get("end_date", "Present")
                 dates = f" ({start} - {end})"
             
-            story.append(Paragraph(title_text + dates, styles["subheading"]))
+            pdf.paragraph(title_text + dates, styles["subheading"])
             
             # Bullets
             for bullet in exp.get("bullets", []):
-                story.append(Paragraph(f"• {bullet}", styles["body"]))
+                pdf.paragraph(f"• {bullet}", styles["body"])
             
-            story.append(Spacer(1, t["line_spacing"]))
+            pdf.space(t["line_spacing"])
 
-        story.append(Spacer(1, t["section_spacing"]))
+        pdf.space(t["section_spacing"])
 
     # Education
     if resume_sections.get("education"):
-        story.append(Paragraph("EDUCATION", styles["heading"]))
+        pdf.paragraph("EDUCATION", styles["heading"])
         for edu in resume_sections["education"]:
             edu_text = []
             if edu.get("degree"):
@@ -125,45 +187,45 @@ def render_pdf(
                 edu_text.append(f" - {edu['institution']}")
             
             if edu_text:
-                story.append(Paragraph("".join(edu_text), styles["body"]))
+                pdf.paragraph("".join(edu_text), styles["body"])
         
-        story.append(Spacer(1, t["section_spacing"]))
+        pdf.space(t["section_spacing"])
 
     # Skills
     if resume_sections.get("skills"):
-        story.append(Paragraph("SKILLS", styles["heading"]))
+        pdf.paragraph("SKILLS", styles["heading"])
         
         # For two-column layout, use table for skills
         if t.get("layout") == "two-column" and len(resume_sections["skills"]) > 5:
             skills_text = ", ".join(resume_sections["skills"])
-            story.append(Paragraph(skills_text, styles["body"]))
+            pdf.paragraph(skills_text, styles["body"])
         else:
             skills_text = ", ".join(resume_sections["skills"])
-            story.append(Paragraph(skills_text, styles["body"]))
+            pdf.paragraph(skills_text, styles["body"])
 
     # Certifications
     if resume_sections.get("certifications"):
-        story.append(Paragraph("CERTIFICATIONS", styles["heading"]))
+        pdf.paragraph("CERTIFICATIONS", styles["heading"])
         for cert in resume_sections["certifications"]:
             cert_text = cert.get("name", "")
             if cert.get("issuer"):
                 cert_text += f" - {cert['issuer']}"
             if cert.get("date"):
                 cert_text += f" ({cert['date']})"
-            story.append(Paragraph(cert_text, styles["body"]))
-        story.append(Spacer(1, t["section_spacing"]))
+            pdf.paragraph(cert_text, styles["body"])
+        pdf.space(t["section_spacing"])
 
     # Projects
     if resume_sections.get("projects"):
-        story.append(Paragraph("PROJECTS", styles["heading"]))
+        pdf.paragraph("PROJECTS", styles["heading"])
         for project in resume_sections["projects"]:
             project_text = project.get("name", "")
             if project.get("description"):
                 project_text += f": {project['description']}"
-            story.append(Paragraph(project_text, styles["body"]))
-        story.append(Spacer(1, t["section_spacing"]))
+            pdf.paragraph(project_text, styles["body"])
+        pdf.space(t["section_spacing"])
 
-    doc.build(story)
+    pdf.save()
     buffer.seek(0)
     return buffer
 
@@ -184,39 +246,37 @@ def _get_accent_color(color_scheme: str, has_accent: bool) -> Optional[colors.Co
 
 
 def _create_styles(template: dict, accent_color: Optional[colors.Color]) -> dict:
-    """Create paragraph styles for the template."""
+    """Create text styles for the template."""
+    heading_color = accent_color if accent_color else colors.black
     styles = {
-        "heading": ParagraphStyle(
-            "Heading",
-            fontName=template["font"],
-            fontSize=template["heading_size"],
-            spaceAfter=template["line_spacing"],
-            alignment=TA_LEFT,
-            textColor=accent_color if accent_color else colors.black,
-            fontStyle="Bold" if "Bold" in template["font"] else "Normal",
-        ),
-        "subheading": ParagraphStyle(
-            "Subheading",
-            fontName="Helvetica-Bold",
-            fontSize=template["body_size"] + 1,
-            spaceAfter=template["line_spacing"] // 2,
-            alignment=TA_LEFT,
-        ),
-        "body": ParagraphStyle(
-            "Body",
-            fontName="Helvetica",
-            fontSize=template["body_size"],
-            spaceAfter=template["line_spacing"],
-            alignment=TA_LEFT,
-        ),
-        "contact": ParagraphStyle(
-            "Contact",
-            fontName="Helvetica-Bold",
-            fontSize=template["heading_size"],
-            spaceAfter=template["line_spacing"],
-            alignment=TA_CENTER,
-            textColor=accent_color if accent_color else colors.black,
-        ),
+        "heading": {
+            "font": template["font"],
+            "size": template["heading_size"],
+            "space_after": template["line_spacing"],
+            "color": heading_color,
+            "centered": False,
+        },
+        "subheading": {
+            "font": "Helvetica-Bold",
+            "size": template["body_size"] + 1,
+            "space_after": template["line_spacing"] // 2,
+            "color": colors.black,
+            "centered": False,
+        },
+        "body": {
+            "font": "Helvetica",
+            "size": template["body_size"],
+            "space_after": template["line_spacing"],
+            "color": colors.black,
+            "centered": False,
+        },
+        "contact": {
+            "font": "Helvetica-Bold",
+            "size": template["heading_size"],
+            "space_after": template["line_spacing"],
+            "color": heading_color,
+            "centered": True,
+        },
     }
     
     return styles
@@ -1,38 +1,53 @@
-ROLE_TEMPLATE_MAP = {
-    "backend": ["technical", "classic", "modern"],
-    "frontend": ["modern", "technical", "creative"],
-    "infra": ["compact", "classic", "technical"],
-    "devops": ["technical", "compact", "classic"],
-    "sre": ["technical", "classic"],
-    "data": ["classic", "technical", "academic"],
-    "data-scientist": ["academic", "technical", "classic"],
-    "software-engineer": ["technical", "modern", "classic"],
-    "executive": ["executive", "classic"],
-    "c-suite": ["executive", "classic"],
-    "director": ["executive", "classic"],
-    "vp": ["executive", "classic"],
-    "senior-management": ["executive", "classic"],
-    "designer": ["creative", "modern"],
-    "artist": ["creative"],
-    "writer": ["creative", "modern"],
-    "photographer": ["creative"],
-    "creative-director": ["creative", "executive"],
-    "researcher": ["academic", "classic"],
-    "professor": ["academic"],
-    "scientist": ["academic", "technical"],
-    "phd": ["academic", "classic"],
-    "postdoc": ["academic"],
-    "entry-level": ["compact", "minimal", "classic"],
-    "career-change": ["compact", "classic"],
-    "students": ["compact", "minimal"],
-    "recent-graduates": ["compact", "minimal", "classic"],
-    "corporate": ["classic", "executive"],
-    "finance": ["classic", "executive"],
-    "legal": ["classic", "executive"],
-    "tech": ["modern", "technical", "classic"],
-    "startup": ["modern", "creative", "technical"],
-    "marketing": ["modern", "creative"],
-}
+from types import MappingProxyType
+
+# Read-only lookup tables: callers get list copies, so one request can't
+# change another's recommendations
+ROLE_TEMPLATE_MAP = MappingProxyType({
+    "backend": ("technical", "classic", "modern"),
+    "frontend": ("modern", "technical", "creative"),
+    "infra": ("compact", "classic", "technical"),
+    "devops": ("technical", "compact", "classic"),
+    "sre": ("technical", "classic"),
+    "data": ("classic", "technical", "academic"),
+    "data-scientist": ("academic", "technical", "classic"),
+    "software-engineer": ("technical", "modern", "classic"),
+    "executive": ("executive", "classic"),
+    "c-suite": ("executive", "classic"),
+    "director": ("executive", "classic"),
+    "vp": ("executive", "classic"),
+    "senior-management": ("executive", "classic"),
+    "designer": ("creative", "modern"),
+    "artist": ("creative",),
+    "writer": ("creative", "modern"),
+    "photographer": ("creative",),
+    "creative-director": ("creative", "executive"),
+    "researcher": ("academic", "classic"),
+    "professor": ("academic",),
+    "scientist": ("academic", "technical"),
+    "phd": ("academic", "classic"),
+    "postdoc": ("academic",),
+    "entry-level": ("compact", "minimal", "classic"),
+    "career-change": ("compact", "classic"),
+    "students": ("compact", "minimal"),
+    "recent-graduates": ("compact", "minimal", "classic"),
+    "corporate": ("classic", "executive"),
+    "finance": ("classic", "executive"),
+    "legal": ("classic", "executive"),
+    "tech": ("modern", "technical", "classic"),
+    "startup": ("modern", "creative", "technical"),
+    "marketing": ("modern", "creative"),
+})
+
+INDUSTRY_TEMPLATE_MAP = MappingProxyType({
+    "technology": ("modern", "technical", "classic"),
+    "finance": ("classic", "executive"),
+    "healthcare": ("classic", "academic"),
+    "education": ("academic", "classic"),
+    "creative": ("creative", "modern"),
+    "legal": ("classic", "executive"),
+    "consulting": ("executive", "classic"),
+    "nonprofit": ("classic", "modern"),
+})
 
 
 def recommend_templates(role_info: dict) -> list[str]:
@@ -53,7 +68,7 @@ def recommend_templates(role_info: dict) -> list[str]:
         return ["classic", "minimal"]
 
     # Get role-specific recommendations
-    recommendations = ROLE_TEMPLATE_MAP.get(role, ["classic"])
+    recommendations = list(ROLE_TEMPLATE_MAP.get(role, ("classic",)))
     
     # Always include classic as fallback
     if "classic" not in recommendations:
@@ -72,18 +87,7 @@ def recommend_templates_by_industry(industry: str) -> list[str]:
     Returns:
         List of recommended template IDs
     """
-    industry_map = {
-        "technology": ["modern", "technical", "classic"],
-        "finance": ["classic", "executive"],
-        "healthcare": ["classic", "academic"],
-        "education": ["academic", "classic"],
-        "creative": ["creative", "modern"],
-        "legal": ["classic", "executive"],
-        "consulting": ["executive", "classic"],
-        "nonprofit": ["classic", "modern"],
-    }
-    
-    return industry_map.get(industry.lower(), ["classic", "minimal"])
+    return list(INDUSTRY_TEMPLATE_MAP.get(industry.lower(), ("classic", "minimal")))
 
 
 def get_template_for_experience_level(years_of_experience: float) -> str:
@@ -1,4 +1,5 @@
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import List, Mapping, Optional
 
 # Template schema definition
 TEMPLATE_SCHEMA = {
@@ -17,7 +18,8 @@ TEMPLATE_SCHEMA = {
     "sections": List[str],  # Available sections
 }
 
-TEMPLATES: Dict[str, dict] = {
+# Read-only: custom templates are copies (see create_custom_template)
+TEMPLATES: Mapping[str, dict] = MappingProxyType({
     "classic": {
         "name": "Classic ATS",
         "description": "Traditional, highly ATS-friendly format. Best for all industries.",
@@ -138,7 +140,7 @@ TEMPLATES: Dict[str, dict] = {
         "best_for": ["all", "minimalist", "ats-focused"],
         "sections": ["summary", "experience", "education", "skills"],
     },
-}
+})
 
 
 def get_template(template_id: str) -> Optional[dict]:
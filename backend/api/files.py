@@ -1,13 +1,19 @@
 # api/files.py
 from fastapi import UploadFile
-import pdfplumber
-from docx import Document
+import io
 import re
 import os
+import hashlib
+import shutil
 import tempfile
-from typing import IO
-from concurrent.futures import ThreadPoolExecutor
+import threading
+import multiprocessing
+from typing import IO, List, Optional
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as PoolTimeoutError
+from concurrent.futures.process import BrokenProcessPool
 import asyncio
+from core.memory_cache import MemoryCache
 from core.security import (
     sanitize_filename,
     validate_file_content,
@@ -24,6 +30,15 @@ from core.file_security import (
 # File Type Detection (Magic Bytes)
 # ======================================================
 
+# File signatures (first 4 bytes) -> file type
+_MAGIC_FILE_TYPES = {
+    b'%PDF': 'pdf',
+    b'PK\x03\x04': 'docx',
+}
+# Bytes allowed at the start of a plain-text file: printable ASCII, tab, LF, CR
+_TEXT_BYTES = bytes(range(32, 127)) + b'\t\n\r'
+
+
 def _detect_file_type(file_obj: IO) -> str:
     """
     Detect file type by reading magic bytes (file signature).
@@ -43,25 +58,15 @@ def _detect_file_type(file_obj: IO) -> str:
         if not header:
             return 'unknown'
         
-        # PDF: starts with %PDF
-        if header.startswith(b'%PDF'):
-            return 'pdf'
+        # PDF (%PDF) or DOCX (a ZIP archive, PK\x03\x04); for DOCX we trust
+        # the PK header and validate when opening
+        file_type = _MAGIC_FILE_TYPES.get(header[:4])
+        if file_type:
+            return file_type
         
-        # DOCX: is a ZIP file (starts with PK\x03\x04)
-        # DOCX files are ZIP archives containing XML
-        if header.startswith(b'PK\x03\x04'):
-            # Check if it's actually a DOCX by looking for word/ in the ZIP
-            # For now, we'll trust the PK header and validate when opening
-            return 'docx'
-        
-        # TXT: try to decode as UTF-8 (heuristic)
-        try:
-            header.decode('utf-8')
-            # If it's mostly printable ASCII/UTF-8, likely text
-            if all(32 <= b <= 126 or b in [9, 10, 13] for b in header[:7]):
-                return 'txt'
-        except (UnicodeDecodeError, ValueError):
-            pass
+        # TXT heuristic: the leading bytes are all printable ASCII / whitespace
+        if not header[:7].translate(None, _TEXT_BYTES):
+            return 'txt'
         
         return 'unknown'
     except Exception:
@@ -106,10 +111,32 @@ def _validate_file_type(file_obj: IO, expected_type: str, filename: str) -> bool
 # Public API
 # ======================================================
 
+# Buffer size for streaming uploads to the security-scan temp file
+_COPY_CHUNK_SIZE = 64 * 1024
+
 # Thread pool for blocking I/O operations
 _file_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="file_extract")
 
 
+def _seek_size(file_obj: IO) -> int:
+    """Size of a seekable file object, leaving its position unchanged."""
+    current_pos = file_obj.tell()
+    file_obj.seek(0, 2)  # Seek to end
+    file_size = file_obj.tell()
+    file_obj.seek(current_pos)  # Reset position
+    return file_size
+
+
+def _sha256_file(file_obj: IO) -> str:
+    """SHA-256 hex digest of a seekable file, read in chunks and rewound."""
+    digest = hashlib.sha256()
+    file_obj.seek(0)
+    for chunk in iter(lambda: file_obj.read(_COPY_CHUNK_SIZE), b""):
+        digest.update(chunk)
+    file_obj.seek(0)
+    return digest.hexdigest()
+
+
 async def extract_text_async(file, max_size_bytes: int = None) -> str:
     """
     Async version of extract_text.
@@ -138,7 +165,6 @@ def extract_text(file, max_size_bytes: int = None) -> str:
     Uses caching to avoid re-extracting and re-normalizing the same file content.
     """
     import logging
-    import hashlib
     from core.settings import MAX_FILE_SIZE_BYTES, CACHE_NORMALIZED_TTL
     from core.cache import (
         get_cached_extracted_text,
@@ -158,19 +184,18 @@ def extract_text(file, max_size_bytes: int = None) -> str:
         if hasattr(file, "size") and file.size:
             file_size = file.size
         else:
-            # Read position to check size
-            current_pos = file_obj.tell()
-            file_obj.seek(0, 2)  # Seek to end
-            file_size = file_obj.tell()
-            file_obj.seek(current_pos)  # Reset position
+            # Not fstat: fileno() on the SpooledTemporaryFile behind an
+            # UploadFile would roll it over to disk
+            file_size = _seek_size(file_obj)
     else:
         filename = os.path.basename(file.name).lower()
         file_obj = file
         # Check file size for regular file
-        current_pos = file_obj.tell()
-        file_obj.seek(0, 2)
-        file_size = file_obj.tell()
-        file_obj.seek(current_pos)
+        try:
+            file_size = os.fstat(file_obj.fileno()).st_size
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            # In-memory file objects (BytesIO) have no descriptor
+            file_size = _seek_size(file_obj)
 
     # Determine user tier (default to 'free' if not provided)
     user_tier = getattr(file, 'user_tier', 'free') if hasattr(file, 'user_tier') else 'free'
@@ -196,6 +221,7 @@ def extract_text(file, max_size_bytes: int = None) -> str:
         expected_type = "txt"
     
     # Comprehensive security validation (if expected_type is known)
+    file_content = None
     if expected_type:
         # Read file content for security checks
         file_obj.seek(0)
@@ -210,7 +236,8 @@ def extract_text(file, max_size_bytes: int = None) -> str:
             if file_size < 10 * 1024 * 1024:  # Only for files < 10MB
                 with tempfile.NamedTemporaryFile(delete=False, suffix=f".{expected_type}") as tmp:
                     file_obj.seek(0)
-                    tmp.write(file_obj.read())
+                    # Chunked copy: never holds the whole upload in memory
+                    shutil.copyfileobj(file_obj, tmp, _COPY_CHUNK_SIZE)
                     temp_file_path = tmp.name
                     file_obj.seek(0)  # Reset again
             
@@ -265,14 +292,15 @@ def extract_text(file, max_size_bytes: int = None) -> str:
     except ValueError as e:
         raise ValueError(f"File content validation failed: {str(e)}")
 
-    # Generate file hash for caching (for files < 1MB)
-    # Larger files skip file-level cache but still use text-level normalization cache
+    # Content-addressed cache: identical uploads skip PDF/DOCX parsing and
+    # normalization. Small files reuse the bytes read for the security scan;
+    # larger ones are hashed in chunks so the whole upload is never in memory.
     file_hash = None
-    if file_size < 1024 * 1024:  # Files < 1MB: cache by file hash
-        file_obj.seek(0)
-        file_content = file_obj.read()
-        file_hash = hashlib.sha256(file_content).hexdigest()
-        file_obj.seek(0)  # Reset for extraction
+    if expected_type:
+        if file_content is not None and len(file_content) == file_size:
+            file_hash = hashlib.sha256(file_content).hexdigest()
+        else:
+            file_hash = _sha256_file(file_obj)
         
         # Check cache for extracted and normalized text
         cached_text = get_cached_extracted_text(file_hash)
@@ -281,8 +309,6 @@ def extract_text(file, max_size_bytes: int = None) -> str:
             return cached_text
         
         logger.info(f"Resume text cache miss for {filename}, extracting...")
-    else:
-        logger.info(f"Processing large file {filename} ({file_size / (1024*1024):.2f} MB), using text-level cache only")
 
     # Determine expected file type from extension
     try:
@@ -342,109 +368,156 @@ def extract_text(file, max_size_bytes: int = None) -> str:
 # PDF Extraction (ROBUST)
 # ======================================================
 
+# Page-parallel extraction for long PDFs (typical 1-3 page resumes stay
+# serial: spreading them over processes costs more than it saves)
+_PDF_PARALLEL_MIN_PAGES = 4
+_PDF_PROCESS_WORKERS = min(4, os.cpu_count() or 1)
+# Upper bound on one PDF's page-parallel extraction (seconds)
+_PDF_PROCESS_TIMEOUT = 60
+_pdf_process_pool: Optional[ProcessPoolExecutor] = None
+_pdf_process_pool_lock = threading.Lock()
+
+
+def _page_may_have_text(page) -> bool:
+    """
+    Whether a pypdf page can contain text: text needs a font, either in the
+    page resources or inside a form XObject. Scanned pages only reference
+    image XObjects, so their content streams need not be parsed at all.
+    """
+    resources = page.get("/Resources")
+    if resources is None:
+        return False
+    resources = resources.get_object()
+    if "/Font" in resources:
+        return True
+    xobjects = resources.get("/XObject")
+    if xobjects is None:
+        return False
+    return any(
+        xobject.get_object().get("/Subtype") == "/Form"
+        for xobject in xobjects.get_object().values()
+    )
+
+
+def _page_text(page) -> str:
+    """Text of one pypdf page ("" for image-only pages)."""
+    if not _page_may_have_text(page):
+        # Image-only (scanned) page: nothing for extract_text to find
+        return ""
+    return page.extract_text() or ""
+
+
+def _extract_pdf_page_range(data: bytes, start: int, stop: int) -> List[str]:
+    """Process-pool worker: texts of pages [start, stop) of the PDF in data."""
+    from pypdf import PdfReader
+
+    reader = PdfReader(io.BytesIO(data))
+    return [_page_text(reader.pages[i]) for i in range(start, stop)]
+
+
+def _get_pdf_process_pool() -> Optional[ProcessPoolExecutor]:
+    """Shared pool for page-parallel PDF extraction (None on single-core hosts)."""
+    global _pdf_process_pool
+    if _PDF_PROCESS_WORKERS < 2:
+        return None
+    with _pdf_process_pool_lock:
+        if _pdf_process_pool is None:
+            # Not fork: the pool is created from _file_executor threads of a
+            # threaded server, and forking a multi-threaded process can
+            # deadlock the child on locks held by other threads
+            start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            _pdf_process_pool = ProcessPoolExecutor(
+                max_workers=_PDF_PROCESS_WORKERS,
+                mp_context=multiprocessing.get_context(start_method),
+            )
+        return _pdf_process_pool
+
+
+def _discard_pdf_process_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken or hung pool so the next long PDF builds a fresh one."""
+    global _pdf_process_pool
+    with _pdf_process_pool_lock:
+        if _pdf_process_pool is pool:
+            _pdf_process_pool = None
+    # A timed-out worker may be stuck; shutdown() alone would leave it running
+    for process in list((getattr(pool, "_processes", None) or {}).values()):
+        process.terminate()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_pdf_process_pool() -> None:
+    """Stop the PDF process pool (app shutdown)."""
+    global _pdf_process_pool
+    with _pdf_process_pool_lock:
+        pool, _pdf_process_pool = _pdf_process_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _extract_pdf_pages_parallel(file_obj: IO, page_count: int) -> Optional[List[str]]:
+    """
+    Page texts extracted across the process pool, one contiguous page range
+    per worker (so each worker parses the PDF once). None if no pool is
+    available or it failed, in which case the caller extracts serially.
+    """
+    pool = _get_pdf_process_pool()
+    if pool is None:
+        return None
+
+    file_obj.seek(0)
+    data = file_obj.read()
+    step = -(-page_count // _PDF_PROCESS_WORKERS)  # ceil division
+    starts = range(0, page_count, step)
+    try:
+        chunks = pool.map(
+            _extract_pdf_page_range,
+            [data] * len(starts),
+            starts,
+            [min(start + step, page_count) for start in starts],
+            timeout=_PDF_PROCESS_TIMEOUT,
+        )
+        return [text for chunk in chunks for text in chunk]
+    except (BrokenProcessPool, PoolTimeoutError) as e:
+        import logging
+        logging.getLogger(__name__).warning(
+            f"PDF process pool failed, extracting serially: {e!r}"
+        )
+        _discard_pdf_process_pool(pool)
+        return None
+
+
 def _extract_pdf(file_obj: IO) -> str:
     """
-    Enhanced PDF extraction with:
-    - Table extraction
-    - Multi-column layout handling
-    - Fallback strategies
-    - Better error handling
+    PDF text extraction with pypdf.
+
+    Plain text extraction per page: the ATS normalization discards layout
+    afterwards, so pdfminer-style layout analysis would only add per-page
+    CPU. Text inside tables is extracted like any other page text. Long
+    PDFs are split across a process pool (extraction is CPU-bound, so
+    threads would serialize on the GIL).
     """
-    text_chunks = []
-    
     try:
-        # Primary method: pdfplumber (better for complex layouts)
-        with pdfplumber.open(file_obj) as pdf:
-            for page_num, page in enumerate(pdf.pages, 1):
-                page_text_parts = []
-                
-                # 1. Extract regular text with layout preservation
-                page_text = page.extract_text(
-                    x_tolerance=2,
-                    y_tolerance=2,
-                    layout=True,
-                )
-                if page_text:
-                    page_text_parts.append(page_text)
-                
-                # 2. Extract tables (common in resumes for skills, experience)
-                tables = page.extract_tables()
-                if tables:
-                    for table in tables:
-                        if table:
-                            # Convert table to readable text
-                            table_text = _format_table_text(table)
-                            if table_text:
-                                page_text_parts.append(f"\n{table_text}\n")
-                
-                # 3. Fallback: Try without layout if no text found
-                if not page_text_parts:
-                    page_text = page.extract_text()
-                    if page_text:
-                        page_text_parts.append(page_text)
-                
-                if page_text_parts:
-                    text_chunks.append("\n".join(page_text_parts))
-        
-        if text_chunks:
-            return "\n\n".join(text_chunks)
-    
+        # Imported on first PDF upload, not at app startup
+        from pypdf import PdfReader
+
+        reader = PdfReader(file_obj)
+        page_texts = None
+        if len(reader.pages) >= _PDF_PARALLEL_MIN_PAGES:
+            page_texts = _extract_pdf_pages_parallel(file_obj, len(reader.pages))
+        if page_texts is None:
+            page_texts = [_page_text(page) for page in reader.pages]
+        text_chunks = [text for text in page_texts if text.strip()]
     except Exception as e:
-        # Fallback to pypdf if pdfplumber fails
         import logging
         logger = logging.getLogger(__name__)
-        logger.warning(f"pdfplumber extraction failed, trying pypdf fallback: {e}")
-        
-        try:
-            from pypdf import PdfReader
-            file_obj.seek(0)  # Reset file pointer
-            reader = PdfReader(file_obj)
-            text_chunks = []
-            for page in reader.pages:
-                text = page.extract_text()
-                if text:
-                    text_chunks.append(text)
-            return "\n\n".join(text_chunks)
-        except Exception as e2:
-            logger.error(f"Both PDF extraction methods failed: {e2}")
-            raise ValueError(f"Failed to extract text from PDF: {str(e2)}")
-    
-    # If we get here, no text was extracted
-    raise ValueError("No text could be extracted from PDF. File may be image-based or corrupted.")
+        logger.error(f"PDF extraction failed: {e}")
+        raise ValueError(f"Failed to extract text from PDF: {str(e)}")
 
+    if text_chunks:
+        return "\n\n".join(text_chunks)
 
-def _format_table_text(table: list) -> str:
-    """
-    Convert a table (list of lists) to readable text format.
-    Formats tables in a way that preserves information for ATS parsing.
-    """
-    if not table or not table[0]:
-        return ""
-    
-    # Find max width for each column
-    max_widths = []
-    for row in table:
-        for i, cell in enumerate(row):
-            if cell:
-                cell_text = str(cell).strip()
-                if i >= len(max_widths):
-                    max_widths.append(len(cell_text))
-                else:
-                    max_widths[i] = max(max_widths[i], len(cell_text))
-    
-    # Format rows
-    formatted_rows = []
-    for row in table:
-        if not row:
-            continue
-        
-        # Join cells with separator, handling None values
-        cells = [str(cell).strip() if cell else "" for cell in row]
-        row_text = " | ".join(cells)
-        if row_text.strip():
-            formatted_rows.append(row_text)
-    
-    return "\n".join(formatted_rows)
+    # If we get here, no text was extracted
+    raise ValueError("No text could be extracted from PDF. File may be image-based or corrupted.")
 
 
 # ======================================================
@@ -462,13 +535,12 @@ def _extract_docx(file_obj: IO) -> str:
     text_parts = []
     
     try:
+        from docx import Document
+
         doc = Document(file_obj)
         
         # 1. Extract paragraphs (main content)
-        for para in doc.paragraphs:
-            text = para.text.strip()
-            if text:
-                text_parts.append(text)
+        text_parts.extend(_docx_paragraph_texts(doc.element.body))
         
         # 2. Extract tables (common in resumes for skills, experience)
         for table in doc.tables:
@@ -482,21 +554,13 @@ def _extract_docx(file_obj: IO) -> str:
         for section in doc.sections:
             # Headers
             if section.header:
-                header_text = "\n".join(
-                    para.text.strip() 
-                    for para in section.header.paragraphs 
-                    if para.text.strip()
-                )
+                header_text = "\n".join(_docx_paragraph_texts(section.header._element))
                 if header_text:
                     text_parts.insert(0, header_text)  # Add at beginning
             
             # Footers
             if section.footer:
-                footer_text = "\n".join(
-                    para.text.strip() 
-                    for para in section.footer.paragraphs 
-                    if para.text.strip()
-                )
+                footer_text = "\n".join(_docx_paragraph_texts(section.footer._element))
                 if footer_text:
                     text_parts.append(footer_text)
         
@@ -512,20 +576,36 @@ def _extract_docx(file_obj: IO) -> str:
         raise ValueError(f"Failed to extract text from DOCX: {str(e)}")
 
 
+def _docx_paragraph_texts(element) -> List[str]:
+    """
+    Stripped, non-empty texts of the paragraphs directly under an oxml
+    element (body, header/footer or table cell).
+
+    Reads CT_P.text on the XML elements (same text as Paragraph.text, tabs
+    and breaks included) without building a Paragraph wrapper per paragraph.
+    """
+    texts = []
+    for p in element.p_lst:
+        text = p.text.strip()
+        if text:
+            texts.append(text)
+    return texts
+
+
 def _extract_docx_table(table) -> str:
     """
     Extract text from a DOCX table in a readable format.
+
+    Walks the <w:tr>/<w:tc> elements directly: table.rows / row.cells
+    rebuild the cell grid for every row. A merged cell is read once (its
+    continuation cells are empty) rather than repeated per grid column/row.
     """
     rows_text = []
-    for row in table.rows:
+    for tr in table._tbl.tr_lst:
         cells_text = []
-        for cell in row.cells:
+        for tc in tr.tc_lst:
             # Get all text from cell (may have multiple paragraphs)
-            cell_text = "\n".join(
-                para.text.strip() 
-                for para in cell.paragraphs 
-                if para.text.strip()
-            )
+            cell_text = "\n".join(_docx_paragraph_texts(tc))
             if cell_text:
                 cells_text.append(cell_text)
         
@@ -547,6 +627,61 @@ def _extract_txt(file_obj: IO) -> str:
 # Resume Normalization (MANDATORY)
 # ======================================================
 
+# Patterns used by normalize_resume_text, compiled once at import
+_SPACED_LETTERS_RE = re.compile(r'(?<!\w)([a-z])\s+([a-z])')
+_SPACED_LETTERS_ANY_CASE_RE = re.compile(r'(?<!\w)([A-Za-z])\s+([A-Za-z])')
+
+# Common ATS term fragmentation (case-insensitive)
+_FRAGMENT_PATTERNS = [
+    (re.compile(pattern, re.I), replacement)
+    for pattern, replacement in {
+        r'r\s*e\s*s\s*t': 'rest',
+        r'a\s*p\s*i': 'api',
+        r'h\s*t\s*t\s*p': 'http',
+        r'j\s*s\s*o\s*n': 'json',
+        r's\s*q\s*l': 'sql',
+        r'k\s*u\s*b\s*e\s*r\s*n\s*e\s*t\s*e\s*s': 'kubernetes',
+        r'd\s*o\s*c\s*k\s*e\s*r': 'docker',
+    }.items()
+]
+
+# Known resume patterns
+_DIRECT_REPLACEMENTS = {
+    "ensuRESTability": "ensure rest stability",
+    "http s": "http",
+    "https": "http",
+    "data structure & algorithm": "data structures algorithms",
+    "data structure and algorithm": "data structures algorithms",
+    "distributed system": "distributed systems",
+    "highly available solutions": "high availability",
+    "code review & optimization": "code review optimization",
+}
+_DIRECT_REPLACEMENTS_LOWER = [(src.lower(), tgt) for src, tgt in _DIRECT_REPLACEMENTS.items()]
+_DIRECT_REPLACEMENT_PATTERNS = [
+    (re.compile(re.escape(src), re.I), tgt) for src, tgt in _DIRECT_REPLACEMENTS.items()
+]
+
+# Bullet glyphs -> space, applied in one translate pass
+_BULLET_TABLE = str.maketrans(dict.fromkeys("•●▪○■□", " "))
+
+_STANDALONE_PIPE_RE = re.compile(r'(?<!\w)\|(?!\w)')
+_REPEATED_PIPES_RE = re.compile(r'\|{2,}')
+_NON_RANGE_DASH_RE = re.compile(r'(?<!\d)-(?!\d)')
+# Space/tab runs that collapse to something different: a lone space between
+# words already is the result, so it isn't matched (and rewritten) at all
+_SPACES_RE = re.compile(r'[ \t]*\t[ \t]*| {2,}')
+_EXTRA_NEWLINES_RE = re.compile(r'\n{3,}')
+
+
+def _case_like(matched: str, replacement: str) -> str:
+    """replacement in the case style of matched (UPPER, Capitalized or lower)."""
+    if matched.isupper():
+        return replacement.upper()
+    elif matched[0].isupper():
+        return replacement.capitalize()
+    return replacement
+
+
 def normalize_resume_text(text: str, preserve_case: bool = False) -> str:
     """
     Repairs ATS-breaking artifacts introduced by PDF/DOCX extraction.
@@ -562,83 +697,55 @@ def normalize_resume_text(text: str, preserve_case: bool = False) -> str:
     if not text:
         return ""
 
-    original_text = text
     if not preserve_case:
         text = text.lower()
 
     # --- Fix spaced letters (J a v a → java or Java)
     if preserve_case:
         # Preserve case but fix spacing
-        text = re.sub(r'(?<!\w)([A-Za-z])\s+([A-Za-z])', lambda m: m.group(1) + m.group(2), text)
+        text = _SPACED_LETTERS_ANY_CASE_RE.sub(r'\1\2', text)
     else:
-        text = re.sub(r'(?<!\w)([a-z])\s+([a-z])', r'\1\2', text)
+        text = _SPACED_LETTERS_RE.sub(r'\1\2', text)
 
     # --- Fix common ATS term fragmentation (case-insensitive)
-    regex_replacements = {
-        r'r\s*e\s*s\s*t': 'rest',
-        r'a\s*p\s*i': 'api',
-        r'h\s*t\s*t\s*p': 'http',
-        r'j\s*s\s*o\s*n': 'json',
-        r's\s*q\s*l': 'sql',
-        r'k\s*u\s*b\s*e\s*r\s*n\s*e\s*t\s*e\s*s': 'kubernetes',
-        r'd\s*o\s*c\s*k\s*e\s*r': 'docker',
-    }
-
-    for pattern, replacement in regex_replacements.items():
+    for pattern, replacement in _FRAGMENT_PATTERNS:
         if preserve_case:
             # Preserve original case of the matched text
-            def replace_preserve_case(match):
-                matched = match.group(0)
-                if matched.isupper():
-                    return replacement.upper()
-                elif matched[0].isupper():
-                    return replacement.capitalize()
-                return replacement
-            text = re.sub(pattern, replace_preserve_case, text, flags=re.I)
+            text = pattern.sub(lambda m: _case_like(m.group(0), replacement), text)
         else:
-            text = re.sub(pattern, replacement, text, flags=re.I)
+            text = pattern.sub(replacement, text)
 
     # --- Normalize known resume patterns
-    direct_replacements = {
-        "ensuRESTability": "ensure rest stability",
-        "http s": "http",
-        "https": "http",
-        "data structure & algorithm": "data structures algorithms",
-        "data structure and algorithm": "data structures algorithms",
-        "distributed system": "distributed systems",
-        "highly available solutions": "high availability",
-        "code review & optimization": "code review optimization",
-    }
-
-    for src, tgt in direct_replacements.items():
-        if preserve_case:
-            # Case-insensitive replacement but preserve surrounding case
-            text = re.sub(re.escape(src), tgt, text, flags=re.I)
-        else:
-            text = text.replace(src.lower(), tgt)
+    if preserve_case:
+        # Case-insensitive replacement but preserve surrounding case
+        for pattern, tgt in _DIRECT_REPLACEMENT_PATTERNS:
+            text = pattern.sub(tgt, text)
+    else:
+        for src, tgt in _DIRECT_REPLACEMENTS_LOWER:
+            text = text.replace(src, tgt)
 
     # --- Normalize bullets & separators
     # Preserve table separators (|) but normalize bullets
-    text = text.replace("•", " ").replace("●", " ").replace("▪", " ")
-    text = text.replace("○", " ").replace("■", " ").replace("□", " ")
+    text = text.translate(_BULLET_TABLE)
     
     # Preserve table separators - don't replace | if it looks like a table
     # (tables typically have | with text on both sides)
     # Only replace standalone | or | at line boundaries
-    text = re.sub(r'(?<!\w)\|(?!\w)', ' ', text)  # Replace | not surrounded by word chars
-    text = re.sub(r'\|{2,}', ' ', text)  # Replace multiple ||
+    if "|" in text:
+        text = _STANDALONE_PIPE_RE.sub(' ', text)  # Replace | not surrounded by word chars
+        text = _REPEATED_PIPES_RE.sub(' ', text)  # Replace multiple ||
     
     # Normalize dashes but preserve ranges (e.g., "2019-2021")
-    text = re.sub(r'(?<!\d)-(?!\d)', ' ', text)  # Replace - not between digits
+    text = _NON_RANGE_DASH_RE.sub(' ', text)  # Replace - not between digits
 
     # --- Collapse whitespace (but preserve line breaks for structure)
     # First, normalize line breaks
-    text = re.sub(r'\r\n', '\n', text)  # Windows line breaks
-    text = re.sub(r'\r', '\n', text)  # Old Mac line breaks
+    text = text.replace('\r\n', '\n')  # Windows line breaks
+    text = text.replace('\r', '\n')  # Old Mac line breaks
     
     # Collapse multiple spaces but preserve single spaces and newlines
-    text = re.sub(r'[ \t]+', ' ', text)  # Collapse spaces/tabs
-    text = re.sub(r'\n{3,}', '\n\n', text)  # Max 2 consecutive newlines
+    text = _SPACES_RE.sub(' ', text)  # Collapse spaces/tabs
+    text = _EXTRA_NEWLINES_RE.sub('\n\n', text)  # Max 2 consecutive newlines
     
     # Final cleanup
     text = text.strip()
@@ -646,6 +753,9 @@ def normalize_resume_text(text: str, preserve_case: bool = False) -> str:
     return text
 
 
+_normalized_memory_cache = MemoryCache(256)
+
+
 def normalize_resume_text_for_ats(text: str) -> str:
     """
     Normalizes text specifically for ATS scoring (lowercase).
@@ -662,15 +772,24 @@ def normalize_resume_text_for_ats(text: str) -> str:
     if not text or not text.strip():
         return ""
     
+    # In-process tier first: the same resume is normalized again by later
+    # pipeline stages in this worker. Keyed by digest so full texts aren't held twice
+    memory_key = hashlib.blake2b(text.encode(), digest_size=16).digest()
+    cached = _normalized_memory_cache.get(memory_key)
+    if cached is not None:
+        return cached
+    
     # Check cache first (cache all texts for better performance)
     cached = get_cached_normalized_text(text)
     if cached:
+        _normalized_memory_cache.set(memory_key, cached)
         return cached
     
     # Normalize the text
     normalized = normalize_resume_text(text, preserve_case=False)
     
     # Cache the result (cache all normalized texts)
+    _normalized_memory_cache.set(memory_key, normalized)
     set_cached_normalized_text(text, normalized, ttl=CACHE_NORMALIZED_TTL)
     
     return normalized
@@ -2,13 +2,13 @@
 """
 Job management with PostgreSQL (primary) and Redis (fallback).
 """
-import json
 import uuid
 import logging
 from typing import Optional
 from uuid import UUID
 from datetime import datetime
 
+from core import json_codec
 from core.settings import JOB_TTL_SECONDS
 from core.redis_pool import get_sync_client, is_sync_available
 from db.database import get_async_session
@@ -25,6 +25,21 @@ def _job_key(job_id: str) -> str:
     return f"job:{job_id}"
 
 
+def _write_job_redis(job_id: str, status: str, result: Optional[dict] = None, error: Optional[str] = None):
+    """
+    Store a job's state in Redis, one SETEX round trip.
+    
+    Raises:
+        redis.RedisError, TypeError, ValueError: Redis failure or unserializable result
+    """
+    data = {
+        "status": status,
+        "result": result,
+        "error": error,
+    }
+    redis_client.setex(_job_key(job_id), JOB_TTL_SECONDS, json_codec.dumps(data))
+
+
 async def create_job_async(rq_job_id: Optional[str] = None) -> str:
     """Create a new job in PostgreSQL (async)."""
     try:
@@ -63,20 +78,11 @@ def create_job_redis() -> str:
         raise RuntimeError("Neither PostgreSQL nor Redis available for job creation")
     
     job_id = str(uuid.uuid4())
-    data = {
-        "status": "pending",
-        "result": None,
-        "error": None,
-    }
     try:
-        redis_client.setex(
-            _job_key(job_id),
-            JOB_TTL_SECONDS,
-            json.dumps(data),
-        )
+        _write_job_redis(job_id, "pending")
         logger.info(f"Job created in Redis: {job_id}")
         return job_id
-    except (redis.RedisError, json.JSONEncodeError) as e:
+    except (redis.RedisError, TypeError, ValueError) as e:
         logger.error(f"Failed to create job in Redis: {e}")
         raise RuntimeError(f"Failed to create job: {e}")
 
@@ -122,19 +128,10 @@ def update_job_redis(job_id: str, result: dict):
         logger.error("Redis not available, cannot update job")
         return
     
-    data = {
-        "status": "completed",
-        "result": result,
-        "error": None,
-    }
     try:
-        redis_client.setex(
-            _job_key(job_id),
-            JOB_TTL_SECONDS,
-            json.dumps(data),
-        )
+        _write_job_redis(job_id, "completed", result=result)
         logger.info(f"Job completed in Redis: {job_id}")
-    except (redis.RedisError, json.JSONEncodeError) as e:
+    except (redis.RedisError, TypeError, ValueError) as e:
         logger.error(f"Failed to update job {job_id} in Redis: {e}")
 
 
@@ -179,19 +176,10 @@ def fail_job_redis(job_id: str, error: str):
         logger.error("Redis not available, cannot fail job")
         return
     
-    data = {
-        "status": "failed",
-        "result": None,
-        "error": error,
-    }
     try:
-        redis_client.setex(
-            _job_key(job_id),
-            JOB_TTL_SECONDS,
-            json.dumps(data),
-        )
+        _write_job_redis(job_id, "failed", error=error)
         logger.error(f"Job failed in Redis: {job_id} | error={error}")
-    except (redis.RedisError, json.JSONEncodeError) as e:
+    except (redis.RedisError, TypeError, ValueError) as e:
         logger.error(f"Failed to mark job {job_id} as failed in Redis: {e}")
 
 
@@ -239,7 +227,7 @@ def get_job_redis(job_id: str) -> Optional[dict]:
         raw = redis_client.get(_job_key(job_id))
         if not raw:
             return None
-        return json.loads(raw)
-    except (redis.RedisError, json.JSONDecodeError) as e:
+        return json_codec.loads(raw)
+    except (redis.RedisError, ValueError) as e:
         logger.error(f"Failed to get job {job_id} from Redis: {e}")
         return None
@@ -1,14 +1,26 @@
 # api/main.py
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from api.routes import router
+from core import json_codec
 from core.logging import setup_logging, request_id_ctx
 from core.rate_limit import check_rate_limit
+import asyncio
+import sys
 import uuid
 
 setup_logging()
 
-app = FastAPI(title="AI Resume Tailor")
+
+class CodecJSONResponse(JSONResponse):
+    """JSONResponse rendered with json_codec (orjson when installed)."""
+
+    def render(self, content) -> bytes:
+        return json_codec.dumps_bytes(content)
+
+
+app = FastAPI(title="AI Resume Tailor", default_response_class=CodecJSONResponse)
 
 # Configure CORS
 app.add_middleware(
@@ -25,9 +37,16 @@ app.add_middleware(
 )
 
 
+def _warm_up_llm_clients():
+    from core import llm, llm_async
+
+    llm.warm_up_clients()
+    llm_async.warm_up_clients()
+
+
 @app.on_event("startup")
 async def startup_event():
-    """Initialize Redis connection pools and PostgreSQL database on startup."""
+    """Initialize Redis connection pools, PostgreSQL database and LLM clients on startup."""
     from core.redis_pool import initialize_redis_pools
     from db.database import init_db
     import logging
@@ -45,6 +64,14 @@ async def startup_event():
         logger.error(f"Failed to initialize PostgreSQL database: {e}", exc_info=True)
         # Don't fail startup if DB is unavailable (for backward compatibility)
         logger.warning("Continuing without PostgreSQL - some features may be unavailable")
+    
+    # Create LLM clients now so the first request doesn't pay for the SDK
+    # imports (several seconds for langchain_openai)
+    try:
+        await asyncio.get_running_loop().run_in_executor(None, _warm_up_llm_clients)
+        logger.info("LLM clients warmed up")
+    except Exception as e:
+        logger.warning(f"LLM client warm-up failed (clients will be created on first use): {e}")
 
 
 @app.on_event("shutdown")
@@ -77,6 +104,22 @@ async def shutdown_event():
     # Close async pool
     await close_async_client()
     logger.info("Async Redis connection pool closed")
+    
+    # Stop PDF extraction worker processes
+    from api.files import shutdown_pdf_process_pool
+    shutdown_pdf_process_pool()
+    logger.info("PDF process pool shut down")
+    
+    # Stop module-level thread pools; only modules already imported have one
+    for module_name, shutdown_name in (
+        ("agents.batch_processor", "shutdown_scoring_executor"),
+        ("agents.multi_jd_preview", "shutdown_preview_executor"),
+        ("agents.exporters.zip_exporter", "shutdown_export_executor"),
+    ):
+        module = sys.modules.get(module_name)
+        if module is not None:
+            getattr(module, shutdown_name)()
+    logger.info("Thread pools shut down")
 
 
 @app.middleware("http")
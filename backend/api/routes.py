@@ -7,11 +7,14 @@ from fastapi import (
     HTTPException,
     Body,
 )
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from pydantic import BaseModel
+from starlette.background import BackgroundTask
+from starlette.concurrency import run_in_threadpool
 
 import logging
 import asyncio
+import os
 
 from api.files import extract_text, extract_text_async
 from api.jobs import (
@@ -35,6 +38,7 @@ from agents.resume_rewriter import rewrite
 from agents.ats_scorer import (
     score_detailed,
     attribute_keywords_to_bullets,
+    _tokenize,
 )
 
 from core.cache import get_cached_jd, set_cached_jd
@@ -43,16 +47,16 @@ from agents.resume_risk import resume_risk_flags
 from agents.jd_fit import classify_jd_fit
 from agents.skill_inference import infer_skills_from_resume
 from agents.role_confidence import tune_confidence_by_role
+from agents.recruiter_persona import tune
+from agents.skill_gap_analyzer import analyze_skill_gap
 from agents.role_detector import detect_role
 from agents.role_rules import ROLE_CONFIDENCE_THRESHOLDS
 from agents.jd_normalizer import normalize_jd_keywords
-from fastapi.responses import StreamingResponse, FileResponse
+from fastapi.responses import FileResponse, Response
 from agents.resume_formatter import format_resume_text, format_resume_sections
 from agents.templates.registry import TEMPLATES
-from agents.templates.pdf_renderer import render_pdf
 from agents.templates.recommender import recommend_templates
 from agents.exporters.txt_exporter import export_txt
-from agents.exporters.zip_exporter import export_zip
 from agents.resume_versions import get_current_version
 from api.schemas import ParsedResumeResponse
 import tempfile
@@ -226,10 +230,6 @@ def process_resume_job(job_id: str, jd: str, resume: str, persona: str, parsed_r
     logger.info(f"Processing job {job_id}")
 
     try:
-        from agents.ats_scorer import score_detailed
-        from agents.recruiter_persona import tune
-        from typing import Dict, Any, Optional
-
         jd_data = analyze_jd(jd)
         
         # Convert JD data to format expected by rewrite() function
@@ -365,7 +365,6 @@ def process_resume_job(job_id: str, jd: str, resume: str, persona: str, parsed_r
         
         # Calculate AFTER score (on final tuned resume)
         # Format final resume to text for scoring
-        from agents.resume_formatter import format_resume_text
         rewritten_text = format_resume_text(final)
         
         after_ats = score_detailed(
@@ -438,9 +437,6 @@ def process_resume_job(job_id: str, jd: str, resume: str, persona: str, parsed_r
         # Calculate skill gap analysis
         skill_gap_analysis = None
         try:
-            from agents.skill_gap_analyzer import analyze_skill_gap
-            from agents.skill_inference import infer_skills_from_resume
-            
             # Infer skills from original resume
             inferred_skills = infer_skills_from_resume(
                 resume_text=resume,
@@ -514,8 +510,45 @@ def process_resume_files_job(
 # Primary Endpoint
 # ------------------------
 
+def _enqueue_tailor_job(job_func, jd_text: str, resume_text: str, *job_args) -> dict:
+    """
+    Create a job record and enqueue job_func on RQ.
+
+    Blocking (Redis round trips); async endpoints call it via run_in_threadpool.
+    """
+    from core.job_queue import enqueue_job
+
+    job_id = create_job()
+
+    # Enqueue job using RQ
+    rq_job = enqueue_job(
+        job_func,
+        job_id,
+        jd_text,
+        resume_text,
+        *job_args,
+        queue_name="default",
+        job_id=job_id,  # Use same job_id for tracking
+        job_timeout="15m",  # 15 minutes timeout for resume processing
+    )
+    
+    if not rq_job:
+        # Fallback: mark job as failed if queue unavailable
+        fail_job(job_id, "Job queue unavailable")
+        raise HTTPException(
+            status_code=503,
+            detail="Job queue service unavailable. Please try again later."
+        )
+
+    return {
+        "job_id": job_id,
+        "status": "queued",
+        "queue_position": rq_job.get_position() if rq_job else None,
+    }
+
+
 @router.post("/tailor")
-def tailor(
+async def tailor(
     job_description_text: str | None = Form(None),
     job_description_file: UploadFile | None = File(None),
     resume_file: UploadFile = File(...),
@@ -525,7 +558,6 @@ def tailor(
     Tailor resume to job description using background job queue.
     """
     logger = logging.getLogger(__name__)
-    from core.job_queue import enqueue_job
     
     # Sanitize inputs
     try:
@@ -546,29 +578,18 @@ def tailor(
         )
 
     try:
-        jd_text = (
-            extract_text(job_description_file)
-            if job_description_file
-            else sanitize_jd_text(job_description_text)  # Sanitize text input
-        )
-
-        resume_text = extract_text(resume_file)
+        if job_description_file:
+            # Extract JD and resume concurrently on the file executor
+            jd_text, resume_text = await asyncio.gather(
+                extract_text_async(job_description_file),
+                extract_text_async(resume_file),
+            )
+        else:
+            jd_text = sanitize_jd_text(job_description_text)  # Sanitize text input
+            resume_text = await extract_text_async(resume_file)
         
         # Sanitize extracted text
         resume_text = sanitize_resume_text(resume_text)
-        if jd_text and not job_description_file:
-            jd_text = sanitize_jd_text(jd_text)
-        
-        # Parse resume for structured data (async, non-blocking)
-        parsed_resume_data = None
-        try:
-            from agents.resume_parser import parse_resume
-            parsed_resume_data = parse_resume(resume_text, use_cache=True)
-            logger.info(f"Parsed resume: {len(parsed_resume_data.get('experience', []))} experiences, "
-                       f"{len(parsed_resume_data.get('skills', []))} skills")
-        except Exception as e:
-            logger.warning(f"Resume parsing failed (continuing without structured data): {e}")
-            parsed_resume_data = None
     except ValueError as e:
         # File size or type error
         raise HTTPException(
@@ -576,52 +597,31 @@ def tailor(
             detail=str(e)
         )
     except Exception as e:
-        logger = logging.getLogger(__name__)
         logger.error(f"Text extraction failed: {e}", exc_info=True)
         raise HTTPException(
             status_code=500,
             detail="Failed to extract text from files"
         )
 
-    job_id = create_job()
-
     # Parse resume for structured data (async, non-blocking)
     parsed_resume_data = None
     try:
-        from agents.resume_parser import parse_resume
-        parsed_resume_data = parse_resume(resume_text, use_cache=True)
+        from agents.resume_parser import parse_resume_async
+        parsed_resume_data = await parse_resume_async(resume_text, use_cache=True)
         logger.info(f"Parsed resume: {len(parsed_resume_data.get('experience', []))} experiences, "
                    f"{len(parsed_resume_data.get('skills', []))} skills")
     except Exception as e:
         logger.warning(f"Resume parsing failed (continuing without structured data): {e}")
         parsed_resume_data = None
 
-    # Enqueue job using RQ
-    rq_job = enqueue_job(
+    return await run_in_threadpool(
+        _enqueue_tailor_job,
         process_resume_job,
-        job_id,
         jd_text,
         resume_text,
         recruiter_persona,
         parsed_resume_data,  # Pass parsed data as positional argument
-        queue_name="default",
-        job_id=job_id,  # Use same job_id for tracking
-        job_timeout="15m",  # 15 minutes timeout for resume processing
     )
-    
-    if not rq_job:
-        # Fallback: mark job as failed if queue unavailable
-        fail_job(job_id, "Job queue unavailable")
-        raise HTTPException(
-            status_code=503,
-            detail="Job queue service unavailable. Please try again later."
-        )
-
-    return {
-        "job_id": job_id,
-        "status": "queued",
-        "queue_position": rq_job.get_position() if rq_job else None,
-    }
 
 
 # ------------------------
@@ -629,42 +629,23 @@ def tailor(
 # ------------------------
 
 @router.post("/tailor/files")
-def tailor_files(
+async def tailor_files(
     job_description: UploadFile = File(...),
     resume: UploadFile = File(...),
     recruiter_persona: str = Form("general"),
 ):
-    jd_text = extract_text(job_description)
-    resume_text = extract_text(resume)
-
-    from core.job_queue import enqueue_job
-    
-    job_id = create_job()
+    jd_text, resume_text = await asyncio.gather(
+        extract_text_async(job_description),
+        extract_text_async(resume),
+    )
 
-    # Enqueue job using RQ
-    rq_job = enqueue_job(
+    return await run_in_threadpool(
+        _enqueue_tailor_job,
         process_resume_files_job,
-        job_id,
         jd_text,
         resume_text,
         recruiter_persona,
-        queue_name="default",
-        job_id=job_id,
-        job_timeout="15m",
     )
-    
-    if not rq_job:
-        fail_job(job_id, "Job queue unavailable")
-        raise HTTPException(
-            status_code=503,
-            detail="Job queue service unavailable. Please try again later."
-        )
-
-    return {
-        "job_id": job_id,
-        "status": "queued",
-        "queue_position": rq_job.get_position() if rq_job else None,
-    }
 
 
 # ------------------------
@@ -979,7 +960,7 @@ def download_tailored_resume(
         format: Output format (docx, pdf, txt, or zip)
     
     Returns:
-        StreamingResponse with the resume file
+        Response with the resume file
     """
     from core.job_queue import get_job_status
     from agents.exporters.txt_exporter import export_txt
@@ -987,8 +968,6 @@ def download_tailored_resume(
     from agents.resume_exporter import export_pdf as export_pdf_stream, export_docx as export_docx_stream
     from agents.templates.pdf_renderer import render_pdf
     from agents.resume_formatter import format_resume_sections
-    from fastapi.responses import StreamingResponse, FileResponse
-    import tempfile
     
     # Validate job ID format
     try:
@@ -1036,13 +1015,11 @@ def download_tailored_resume(
             detail=f"Invalid format: {format}. Supported: docx, pdf, txt, zip"
         )
     
-    # Format resume text for export
-    resume_text = format_resume_text(tailored_resume)
-    
-    # Handle different formats
+    # Handle different formats (plain text is only formatted for the
+    # formats that use it; template PDF and ZIP render from the dict)
     if format == "txt":
-        return StreamingResponse(
-            iter([resume_text]),
+        return Response(
+            content=format_resume_text(tailored_resume),
             media_type="text/plain",
             headers={
                 "Content-Disposition": f'attachment; filename="tailored_resume_{job_id[:8]}.txt"'
@@ -1057,8 +1034,8 @@ def download_tailored_resume(
                 resume_sections=sections,
                 template_id="classic",
             )
-            return StreamingResponse(
-                buffer,
+            return Response(
+                content=buffer.getvalue(),
                 media_type="application/pdf",
                 headers={
                     "Content-Disposition": f'attachment; filename="tailored_resume_{job_id[:8]}.pdf"'
@@ -1066,9 +1043,9 @@ def download_tailored_resume(
             )
         except Exception:
             # Fallback to simple PDF export
-            buffer = export_pdf_stream(resume_text)
-            return StreamingResponse(
-                buffer,
+            buffer = export_pdf_stream(format_resume_text(tailored_resume))
+            return Response(
+                content=buffer.getvalue(),
                 media_type="application/pdf",
                 headers={
                     "Content-Disposition": f'attachment; filename="tailored_resume_{job_id[:8]}.pdf"'
@@ -1076,15 +1053,13 @@ def download_tailored_resume(
             )
     
     if format == "zip":
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".zip") as tmp:
-            zip_path = tmp.name
-        
         try:
-            export_zip(resume=tailored_resume, zip_path=zip_path)
-            return FileResponse(
-                zip_path,
+            return _temp_file_download(
+                export_zip,
+                tailored_resume,
+                ".zip",
+                f"tailored_resume_{job_id[:8]}.zip",
                 media_type="application/zip",
-                filename=f"tailored_resume_{job_id[:8]}.zip",
             )
         except Exception as e:
             raise HTTPException(
@@ -1093,9 +1068,9 @@ def download_tailored_resume(
             )
     
     # Default: DOCX
-    buffer = export_docx_stream(resume_text)
-    return StreamingResponse(
-        buffer,
+    buffer = export_docx_stream(format_resume_text(tailored_resume))
+    return Response(
+        content=buffer.getvalue(),
         media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
         headers={
             "Content-Disposition": f'attachment; filename="tailored_resume_{job_id[:8]}.docx"'
@@ -1147,6 +1122,7 @@ async def compare_ats(
     job_description: str = Form(None),
     jd_file: UploadFile | None = File(None),
     resume: UploadFile = File(...),
+    force_refresh: bool = Form(False),
 ):
     """
     Compare ATS scores before and after resume rewrite (async).
@@ -1155,6 +1131,7 @@ async def compare_ats(
         job_description: Job description text (optional if jd_file provided)
         jd_file: Job description file (optional if job_description provided)
         resume: Resume file (required)
+        force_refresh: Recompute even if a cached response exists
     
     Returns:
         Comparison results with before/after scores and analysis
@@ -1162,6 +1139,7 @@ async def compare_ats(
     from api.files import extract_text_async
     from agents.jd_analyzer import analyze_jd_async
     from agents.resume_rewriter import rewrite_async
+    from core.cache_async import get_cached_ats_compare_async, set_cached_ats_compare_async
     
     # -----------------------------
     # 1️⃣ Input validation
@@ -1177,27 +1155,18 @@ async def compare_ats(
     # -----------------------------
     try:
         if jd_file:
-            jd_text = await extract_text_async(jd_file)
+            # Extract JD and resume concurrently on the file executor
+            jd_text, resume_text = await asyncio.gather(
+                extract_text_async(jd_file),
+                extract_text_async(resume),
+            )
         else:
             # Sanitize text input
             jd_text = sanitize_jd_text(job_description)
-        
-        resume_text = await extract_text_async(resume)
+            resume_text = await extract_text_async(resume)
         
         # Sanitize extracted text
         resume_text = sanitize_resume_text(resume_text)
-        if jd_text and not jd_file:
-            jd_text = sanitize_jd_text(jd_text)
-        
-        # Parse resume for structured data (optional, for enhanced ATS scoring)
-        parsed_resume_data = None
-        try:
-            from agents.resume_parser import parse_resume_async
-            parsed_resume_data = await parse_resume_async(resume_text, use_cache=True)
-        except Exception as e:
-            logger = logging.getLogger(__name__)
-            logger.warning(f"Resume parsing failed (continuing without structured data): {e}")
-            parsed_resume_data = None
     except ValueError as e:
         # File size or type error
         raise HTTPException(
@@ -1226,6 +1195,22 @@ async def compare_ats(
                    "Please ensure your resume file is a valid PDF, DOCX, or TXT file with readable content."
         )
 
+    # Identical (JD, resume) pairs are common on refresh/retry
+    if not force_refresh:
+        cached_response = await get_cached_ats_compare_async(jd_text, resume_text)
+        if cached_response:
+            return cached_response
+
+    # Parse resume for structured data (optional, for enhanced ATS scoring)
+    parsed_resume_data = None
+    try:
+        from agents.resume_parser import parse_resume_async
+        parsed_resume_data = await parse_resume_async(resume_text, use_cache=True)
+    except Exception as e:
+        logger = logging.getLogger(__name__)
+        logger.warning(f"Resume parsing failed (continuing without structured data): {e}")
+        parsed_resume_data = None
+
     # -----------------------------
     # 3️⃣ JD analysis (LLM – structured, async)
     # -----------------------------
@@ -1246,12 +1231,16 @@ async def compare_ats(
     role_info = detect_role(jd_text, resume_text)
     role = role_info["role"]
 
+    # Tokenize the original resume once; scoring steps below reuse it
+    resume_tokens = _tokenize(resume_text)
+
     # -----------------------------
     # 5️⃣ Keyword confidence (resume vs JD)
     # -----------------------------
     confidence = keyword_confidence(
         jd_keywords_all,
         resume_text,
+        resume_tokens=resume_tokens,
     )
 
     # -----------------------------
@@ -1299,6 +1288,7 @@ async def compare_ats(
         resume_text,
         inferred_skills=inferred_skills,  # ✅ evidence-gated scoring
         parsed_resume_data=parsed_resume_data,  # Use parsed data for better scoring
+        resume_tokens=resume_tokens,
     )
 
     # -----------------------------
@@ -1422,27 +1412,16 @@ async def compare_ats(
     skill_gap = analyze_skill_gap(
         jd_keywords_all,
         resume_text,
-        inferred_skills
+        inferred_skills,
+        resume_tokens=resume_tokens,
     )
     
     # -----------------------------
     # 1️⃣7️⃣ Visual comparison (NEW)
     # -----------------------------
     from agents.diff_viewer import diff_resume_structured
-    from agents.resume_formatter import format_resume_text
-    
-    # Create structured resume objects for comparison
-    before_resume_structured = {
-        "summary": "",  # Original resume doesn't have structured format
-        "experience": [],  # Would need parsing, but for now use text
-        "skills": []
-    }
     
-    # For comparison, we'll use the formatted text versions
-    before_resume_text = resume_text
-    after_resume_text = format_resume_text(rewritten)
-    
-    # Create visual diff
+    # Create visual diff (formats both sides to text itself)
     visual_diff = diff_resume_structured(
         {"summary": "", "experience": [], "skills": []},  # Simplified before
         rewritten  # Structured after
@@ -1451,7 +1430,7 @@ async def compare_ats(
     # -----------------------------
     # ✅ Final response
     # -----------------------------
-    return {
+    response = {
         "role_detection": role_info,
         "before": before,
         "after": after,
@@ -1467,6 +1446,17 @@ async def compare_ats(
         "skill_gap_analysis": skill_gap,  # 🆕 Skill gap analysis
     }
 
+    # Don't pin a degraded comparison in the cache: failed JD analysis,
+    # a JD with no keywords, or a failed LLM rewrite
+    if (
+        not jd_data.get("error")
+        and any(jd_keywords_all.values())
+        and not rewritten.get("error")
+    ):
+        await set_cached_ats_compare_async(jd_text, resume_text, response)
+
+    return response
+
 @router.post("/ats/batch")
 async def batch_process_jds(
     resume: UploadFile = File(...),
@@ -2165,6 +2155,36 @@ def validate_resume_format(
         )
 
 
+def _temp_file_download(
+    export_fn,
+    resume: dict,
+    suffix: str,
+    filename: str,
+    media_type: Optional[str] = None,
+) -> FileResponse:
+    """
+    Run a path-writing exporter into a temp file and return it as a download.
+
+    The file is deleted after the response is sent, or right away if the
+    export fails.
+    """
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+        path = tmp.name
+
+    try:
+        export_fn(resume, path)
+    except Exception:
+        os.unlink(path)
+        raise
+
+    return FileResponse(
+        path,
+        media_type=media_type,
+        filename=filename,
+        background=BackgroundTask(os.unlink, path),
+    )
+
+
 @router.post("/ats/download")
 def download_resume(
     rewritten_resume: dict,  # Will validate with Pydantic if needed
@@ -2178,7 +2198,7 @@ def download_resume(
         format: Output format (docx, txt, or pdf)
     
     Returns:
-        StreamingResponse with the resume file
+        Response with the resume file
     """
     from api.schemas import RewrittenResumeRequest
     
@@ -2200,8 +2220,8 @@ def download_resume(
     resume_text = format_resume_text(rewritten_resume)
 
     if format == "txt":
-        return StreamingResponse(
-            iter([resume_text]),
+        return Response(
+            content=resume_text,
             media_type="text/plain",
             headers={
                 "Content-Disposition": "attachment; filename=resume.txt"
@@ -2212,8 +2232,8 @@ def download_resume(
         # Use resume_exporter for BytesIO streaming
         from agents.resume_exporter import export_pdf as export_pdf_stream
         buffer = export_pdf_stream(resume_text)
-        return StreamingResponse(
-            buffer,
+        return Response(
+            content=buffer.getvalue(),
             media_type="application/pdf",
             headers={
                 "Content-Disposition": "attachment; filename=resume.pdf"
@@ -2229,8 +2249,8 @@ def download_resume(
     # Note: This would require saving to temp file, validating, then streaming
     # For now, we'll skip validation on download to avoid performance impact
     
-    return StreamingResponse(
-        buffer,
+    return Response(
+        content=buffer.getvalue(),
         media_type=(
             "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
         ),
@@ -2425,6 +2445,8 @@ def download_pdf(
     Returns:
         PDF file download
     """
+    from agents.templates.pdf_renderer import render_pdf
+
     sections = format_resume_sections(rewritten_resume)
 
     buffer = render_pdf(
@@ -2434,8 +2456,8 @@ def download_pdf(
     )
 
     template_name = custom_template.get("name", template_id) if custom_template else template_id
-    return StreamingResponse(
-        buffer,
+    return Response(
+        content=buffer.getvalue(),
         media_type="application/pdf",
         headers={
             "Content-Disposition": (
@@ -2453,24 +2475,15 @@ def download_zip(
     """
     Download a ZIP bundle containing DOCX, PDF, and TXT versions.
     """
-    import tempfile
-    from fastapi.responses import FileResponse
     from agents.exporters.zip_exporter import export_zip
 
-    # Create a temporary zip file, export content, then stream it back
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".zip") as tmp:
-        zip_path = tmp.name
-
-    try:
-        export_zip(resume=rewritten_resume, zip_path=zip_path)
-        return FileResponse(
-            zip_path,
-            media_type="application/zip",
-            filename="resume_bundle.zip",
-        )
-    finally:
-        # Cleanup handled by FileResponse after streaming; if needed, the OS will reclaim
-        pass
+    return _temp_file_download(
+        export_zip,
+        rewritten_resume,
+        ".zip",
+        "resume_bundle.zip",
+        media_type="application/zip",
+    )
 
 # ============================================================
 # Resume Versioning UI Endpoints
@@ -2992,28 +3005,26 @@ def export_resume(
     if not resume:
         raise HTTPException(404, "Resume not approved yet")
 
-    tmp = tempfile.NamedTemporaryFile(delete=False)
+    if format == "txt":
+        # Plain text goes straight into the response, no temp file round-trip
+        return Response(
+            content=export_txt(resume),
+            media_type="text/plain",
+            headers={"Content-Disposition": 'attachment; filename="resume.txt"'},
+        )
 
     if format == "pdf":
         # Use exporters/pdf_exporter for file path writing
         from agents.exporters.pdf_exporter import export_pdf
-        export_pdf(resume, tmp.name)
-        return FileResponse(tmp.name, filename="resume.pdf")
+        return _temp_file_download(export_pdf, resume, ".pdf", "resume.pdf")
 
     if format == "docx":
         # Use exporters/docx_exporter for file path writing
         from agents.exporters.docx_exporter import export_docx
-        export_docx(resume, tmp.name)
-        return FileResponse(tmp.name, filename="resume.docx")
-
-    if format == "txt":
-        content = export_txt(resume)
-        with open(tmp.name, "w") as f:
-            f.write(content)
-        return FileResponse(tmp.name, filename="resume.txt")
+        return _temp_file_download(export_docx, resume, ".docx", "resume.docx")
 
     if format == "zip":
-        export_zip(resume, tmp.name)
-        return FileResponse(tmp.name, filename="resume.zip")
+        from agents.exporters.zip_exporter import export_zip
+        return _temp_file_download(export_zip, resume, ".zip", "resume.zip")
 
     raise HTTPException(400, "Invalid export format")
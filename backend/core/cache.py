@@ -4,6 +4,7 @@ import redis
 import os
 import logging
 from typing import Optional, Dict, Any
+from core import json_codec
 
 logger = logging.getLogger(__name__)
 
@@ -42,7 +43,7 @@ def _safe_get(key: str, redis_client_instance: Optional[redis.Redis] = None) ->
         return None
     try:
         data = client.get(key)
-        return json.loads(data) if data else None
+        return json_codec.loads(data) if data else None
     except Exception as e:
         logger.warning(f"Cache get failed for key {key}: {e}")
         return None
@@ -54,7 +55,7 @@ def _safe_set(key: str, value: Any, ttl: int = 3600, redis_client_instance: Opti
     if not _redis_available or not client:
         return False
     try:
-        client.setex(key, ttl, json.dumps(value))
+        client.setex(key, ttl, json_codec.dumps(value))
         return True
     except Exception as e:
         logger.warning(f"Cache set failed for key {key}: {e}")
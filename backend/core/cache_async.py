@@ -7,6 +7,7 @@ import hashlib
 import os
 import logging
 from typing import Optional, Dict, Any
+from core import json_codec
 import redis.asyncio as aioredis
 
 logger = logging.getLogger(__name__)
@@ -70,7 +71,7 @@ async def _safe_get(key: str, redis_client_instance: Optional[aioredis.Redis] =
         if not client:
             return None
         data = await client.get(key)
-        return json.loads(data) if data else None
+        return json_codec.loads(data) if data else None
     except (RuntimeError, asyncio.CancelledError) as e:
         # Event loop issues
         logger.warning(f"Async cache get failed for key {key} (event loop issue): {e}")
@@ -110,7 +111,7 @@ async def _safe_set(key: str, value: Any, ttl: int = 3600, redis_client_instance
         client = await get_redis_client(redis_client_instance)
         if not client:
             return False
-        await client.setex(key, ttl, json.dumps(value))
+        await client.setex(key, ttl, json_codec.dumps(value))
         return True
     except (RuntimeError, asyncio.CancelledError) as e:
         # Event loop issues
@@ -179,6 +180,30 @@ async def set_cached_ats_score_async(
     return await _safe_set(key, value, ttl)
 
 
+# =========================================================
+# ATS Compare Response Cache (Async)
+# =========================================================
+
+def _ats_compare_key(jd_text: str, resume_text: str) -> str:
+    # Hash each side separately so no JD/resume split can collide
+    return _get_cache_key("ats_compare", _hash(jd_text), _hash(resume_text))
+
+
+async def get_cached_ats_compare_async(jd_text: str, resume_text: str) -> Optional[Dict[str, Any]]:
+    """Get cached /ats/compare response."""
+    return await _safe_get(_ats_compare_key(jd_text, resume_text))
+
+
+async def set_cached_ats_compare_async(
+    jd_text: str,
+    resume_text: str,
+    value: dict,
+    ttl: int = 3600,
+) -> bool:
+    """Cache /ats/compare response."""
+    return await _safe_set(_ats_compare_key(jd_text, resume_text), value, ttl)
+
+
 # =========================================================
 # Resume Parse Cache (Async)
 # =========================================================
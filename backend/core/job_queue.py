@@ -28,7 +28,14 @@ def get_rq_redis_client():
     if _rq_redis_client is not None:
         return _rq_redis_client
     
-    from core.settings import REDIS_HOST, REDIS_PORT, REDIS_DB
+    from core.settings import (
+        REDIS_HOST,
+        REDIS_PORT,
+        REDIS_DB,
+        REDIS_MAX_CONNECTIONS,
+        REDIS_CONNECTION_TIMEOUT,
+        REDIS_SOCKET_TIMEOUT,
+    )
     import redis
     
     try:
@@ -37,8 +44,10 @@ def get_rq_redis_client():
             port=REDIS_PORT,
             db=REDIS_DB,
             decode_responses=False,  # RQ needs binary mode for pickled data
-            socket_connect_timeout=5,
-            socket_timeout=5,
+            socket_connect_timeout=REDIS_CONNECTION_TIMEOUT,
+            socket_timeout=REDIS_SOCKET_TIMEOUT,
+            socket_keepalive=True,
+            max_connections=REDIS_MAX_CONNECTIONS,
         )
         # Test connection
         _rq_redis_client.ping()
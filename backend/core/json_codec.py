@@ -0,0 +1,122 @@
+"""
+JSON encode/decode for Redis payloads and LLM responses.
+
+Uses orjson when installed (several times faster for the dict payloads we
+round-trip through Redis), falling back to the stdlib json module. dumps/loads
+keep stdlib semantics that callers rely on: ``dumps`` returns str
+(our Redis clients use decode_responses=True) and decode errors raise
+ValueError (json.JSONDecodeError and orjson.JSONDecodeError both subclass it).
+"""
+import json
+import re
+from typing import Any, Dict, Union
+
+_decoder = json.JSONDecoder()
+
+# Common LLM formatting errors fixed by parse_llm_object's repair pass
+_TRAILING_COMMA_OBJECT_RE = re.compile(r",\s*}")
+_TRAILING_COMMA_ARRAY_RE = re.compile(r",\s*]")
+
+# Try to import orjson, fallback to stdlib json if not available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(value: Any) -> str:
+    """Serialize value to a JSON string."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # Types orjson refuses (e.g. int subclasses, >64-bit ints): defer to stdlib
+            pass
+    return json.dumps(value)
+
+
+def dumps_bytes(value: Any) -> bytes:
+    """Serialize value to compact UTF-8 JSON bytes (HTTP response bodies)."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Deserialize a JSON string or bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def extract_object(text: str) -> Dict[str, Any]:
+    """
+    Decode the JSON object starting at the first "{" in text, ignoring any
+    prose before or after it (typical LLM output).
+
+    Parses exactly one balanced object with the C decoder instead of
+    matching first "{" to last "}" with a regex and re-parsing the slice.
+
+    Raises:
+        ValueError: No "{" in text or the object there is not valid JSON
+    """
+    start = text.find("{")
+    if start == -1:
+        raise ValueError("No JSON object found")
+    return _decoder.raw_decode(text, start)[0]
+
+
+def parse_llm_object(text: str) -> Dict[str, Any]:
+    """
+    Parse the JSON object in an LLM response, tolerating surrounding prose,
+    a wrapping list and trailing commas.
+
+    Tries, in order: the whole text as JSON, the first object embedded in
+    it (extract_object), and finally the span from the first "{" to the
+    last "}" with newlines and trailing commas repaired.
+
+    Raises:
+        ValueError: No usable JSON object in text
+    """
+    if not text or not isinstance(text, str):
+        raise ValueError("Empty or invalid LLM response")
+
+    # Fast path: well-formed JSON (the common case)
+    try:
+        data = loads(text)
+    except ValueError:
+        data = None
+
+    if not isinstance(data, (dict, list)):
+        # First JSON object embedded in surrounding prose
+        try:
+            data = extract_object(text)
+        except ValueError:
+            data = None
+
+    if data is None:
+        # Repair path: span from first "{" to last "}" with common LLM errors fixed
+        start = text.find("{")
+        end = text.rfind("}")
+        if start == -1 or end < start:
+            raise ValueError("No JSON object found in LLM output")
+
+        raw = text[start:end + 1].replace("\n", " ")
+        raw = _TRAILING_COMMA_OBJECT_RE.sub("}", raw)
+        raw = _TRAILING_COMMA_ARRAY_RE.sub("]", raw)
+
+        data = loads(raw)
+
+    if isinstance(data, list):
+        if not data:
+            raise ValueError("Empty JSON list returned")
+        data = data[0]
+
+    if not isinstance(data, dict):
+        raise ValueError("Parsed JSON is not an object")
+
+    return data
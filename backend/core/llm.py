@@ -63,18 +63,43 @@ class LLMClient:
         wait=wait_exponential(multiplier=1, min=2, max=8),
         reraise=True,
     )
-    def invoke(self, prompt: str) -> str:
+    def invoke(self, prompt: str, system: Optional[str] = None) -> str:
+        if system:
+            # Static instructions go in the system message so the provider can
+            # reuse its cached prefix across calls
+            return self._get_llm().invoke([("system", system), ("human", prompt)]).content
         return self._get_llm().invoke(prompt).content
 
 
+def warm_up_clients() -> None:
+    """
+    Create the global fast/smart clients ahead of the first call.
+
+    Pays the langchain_openai import (seconds) at app startup instead of on
+    the first request. Sends nothing to the provider.
+    """
+    global _fast_llm, _smart_llm
+    if _fast_llm is None:
+        _fast_llm = LLMClient("gpt-4o-mini")
+    if _smart_llm is None:
+        _smart_llm = LLMClient("gpt-4o")
+    _fast_llm._get_llm()
+    _smart_llm._get_llm()
+
+
 # Global functions (for backward compatibility - prefer dependency injection)
-def fast_llm_call(prompt: str, client: Optional[LLMClient] = None) -> str:
+def fast_llm_call(
+    prompt: str,
+    client: Optional[LLMClient] = None,
+    system: Optional[str] = None,
+) -> str:
     """
     Fast LLM call using gpt-4o-mini.
     
     Args:
         prompt: The prompt to send to the LLM
         client: Optional LLMClient instance (for dependency injection)
+        system: Optional system message sent ahead of the prompt
     
     Returns:
         LLM response string
@@ -82,22 +107,27 @@ def fast_llm_call(prompt: str, client: Optional[LLMClient] = None) -> str:
     Note: Prefer using dependency injection via api.dependencies.get_fast_llm_client()
     """
     if client:
-        return client.invoke(prompt)
+        return client.invoke(prompt, system=system)
     
     # Fallback to global state (backward compatibility)
     global _fast_llm
     if _fast_llm is None:
         _fast_llm = LLMClient("gpt-4o-mini")
-    return _fast_llm.invoke(prompt)
+    return _fast_llm.invoke(prompt, system=system)
 
 
-def smart_llm_call(prompt: str, client: Optional[LLMClient] = None) -> str:
+def smart_llm_call(
+    prompt: str,
+    client: Optional[LLMClient] = None,
+    system: Optional[str] = None,
+) -> str:
     """
     Smart LLM call using gpt-4o.
     
     Args:
         prompt: The prompt to send to the LLM
         client: Optional LLMClient instance (for dependency injection)
+        system: Optional system message sent ahead of the prompt
     
     Returns:
         LLM response string
@@ -105,10 +135,10 @@ def smart_llm_call(prompt: str, client: Optional[LLMClient] = None) -> str:
     Note: Prefer using dependency injection via api.dependencies.get_smart_llm_client()
     """
     if client:
-        return client.invoke(prompt)
+        return client.invoke(prompt, system=system)
     
     # Fallback to global state (backward compatibility)
     global _smart_llm
     if _smart_llm is None:
         _smart_llm = LLMClient("gpt-4o")
-    return _smart_llm.invoke(prompt)
+    return _smart_llm.invoke(prompt, system=system)
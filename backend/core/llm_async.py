@@ -44,9 +44,14 @@ class AsyncLLMClient:
             self.client = _create_async_llm(self.model_name)
         return self.client
     
-    async def invoke(self, prompt: str) -> str:
+    async def invoke(self, prompt: str, system: Optional[str] = None) -> str:
         """Invoke LLM asynchronously with retry logic."""
         client = self._get_client()
+        messages = [{"role": "user", "content": prompt}]
+        if system:
+            # Static instructions go in the system message so the provider can
+            # reuse its cached prefix across calls
+            messages.insert(0, {"role": "system", "content": system})
         
         async for attempt in AsyncRetrying(
             stop=stop_after_attempt(3),
@@ -61,27 +66,48 @@ class AsyncLLMClient:
                 if use_json_mode:
                     response = await client.chat.completions.create(
                         model=self.model_name,
-                        messages=[{"role": "user", "content": prompt}],
+                        messages=messages,
                         temperature=0.0,
                         response_format={"type": "json_object"},
                     )
                 else:
                     response = await client.chat.completions.create(
                         model=self.model_name,
-                        messages=[{"role": "user", "content": prompt}],
+                        messages=messages,
                         temperature=0.0,
                     )
                 return response.choices[0].message.content
 
 
+def warm_up_clients() -> None:
+    """
+    Create the global fast/smart async clients ahead of the first call.
+
+    Pays the openai import and HTTP client setup at app startup instead of on
+    the first request. Sends nothing to the provider.
+    """
+    global _fast_llm, _smart_llm
+    if _fast_llm is None:
+        _fast_llm = AsyncLLMClient("gpt-4o-mini")
+    if _smart_llm is None:
+        _smart_llm = AsyncLLMClient("gpt-4o")
+    _fast_llm._get_client()
+    _smart_llm._get_client()
+
+
 # Global functions (for backward compatibility - prefer dependency injection)
-async def fast_llm_call_async(prompt: str, client: Optional[AsyncLLMClient] = None) -> str:
+async def fast_llm_call_async(
+    prompt: str,
+    client: Optional[AsyncLLMClient] = None,
+    system: Optional[str] = None,
+) -> str:
     """
     Fast async LLM call using gpt-4o-mini.
     
     Args:
         prompt: The prompt to send to the LLM
         client: Optional AsyncLLMClient instance (for dependency injection)
+        system: Optional system message sent ahead of the prompt
     
     Returns:
         LLM response string
@@ -89,22 +115,27 @@ async def fast_llm_call_async(prompt: str, client: Optional[AsyncLLMClient] = No
     Note: Prefer using dependency injection via api.dependencies.get_fast_llm_client_async()
     """
     if client:
-        return await client.invoke(prompt)
+        return await client.invoke(prompt, system=system)
     
     # Fallback to global state (backward compatibility)
     global _fast_llm
     if _fast_llm is None:
         _fast_llm = AsyncLLMClient("gpt-4o-mini")
-    return await _fast_llm.invoke(prompt)
+    return await _fast_llm.invoke(prompt, system=system)
 
 
-async def smart_llm_call_async(prompt: str, client: Optional[AsyncLLMClient] = None) -> str:
+async def smart_llm_call_async(
+    prompt: str,
+    client: Optional[AsyncLLMClient] = None,
+    system: Optional[str] = None,
+) -> str:
     """
     Smart async LLM call using gpt-4o.
     
     Args:
         prompt: The prompt to send to the LLM
         client: Optional AsyncLLMClient instance (for dependency injection)
+        system: Optional system message sent ahead of the prompt
     
     Returns:
         LLM response string
@@ -112,11 +143,11 @@ async def smart_llm_call_async(prompt: str, client: Optional[AsyncLLMClient] = N
     Note: Prefer using dependency injection via api.dependencies.get_smart_llm_client_async()
     """
     if client:
-        return await client.invoke(prompt)
+        return await client.invoke(prompt, system=system)
     
     # Fallback to global state (backward compatibility)
     global _smart_llm
     if _smart_llm is None:
         _smart_llm = AsyncLLMClient("gpt-4o")
-    return await _smart_llm.invoke(prompt)
+    return await _smart_llm.invoke(prompt, system=system)
 
@@ -18,6 +18,7 @@ def safe_llm_call(
     fallback_value: Any = None,
     max_retries: int = 3,
     use_fast_model: bool = False,
+    system: Optional[str] = None,
 ) -> Any:
     """
     Safe LLM wrapper with validation and fallback.
@@ -28,6 +29,7 @@ def safe_llm_call(
         fallback_value: Value to return if validation fails or LLM errors
         max_retries: Number of retry attempts
         use_fast_model: Use fast_llm_call instead of smart_llm_call
+        system: Optional system message with static instructions (sent separately from prompt)
     
     Returns:
         Validated LLM output or fallback_value
@@ -50,7 +52,7 @@ def safe_llm_call(
     
     for attempt in range(max_retries):
         try:
-            response = llm_call(prompt)
+            response = llm_call(prompt, system=system)
             
             # If no validation function, return response as-is
             if validation_fn is None:
@@ -15,6 +15,7 @@ async def safe_llm_call_async(
     fallback_value: Any = None,
     max_retries: int = 3,
     use_fast_model: bool = False,
+    system: Optional[str] = None,
 ) -> Any:
     """
     Async safe LLM wrapper with validation and fallback.
@@ -25,6 +26,7 @@ async def safe_llm_call_async(
         fallback_value: Value to return if validation fails or LLM errors
         max_retries: Number of retry attempts
         use_fast_model: Use fast_llm_call_async instead of smart_llm_call_async
+        system: Optional system message with static instructions (sent separately from prompt)
     
     Returns:
         Validated LLM output or fallback_value
@@ -33,7 +35,7 @@ async def safe_llm_call_async(
     
     for attempt in range(max_retries):
         try:
-            response = await llm_call(prompt)
+            response = await llm_call(prompt, system=system)
             
             # If no validation function, return response as-is
             if validation_fn is None:
@@ -0,0 +1,47 @@
+# core/memory_cache.py
+"""
+Small in-process LRU cache used as a first tier in front of Redis.
+
+Repeat requests served by the same worker (undo/redo, retries, re-running
+the same JD) are answered without a Redis round trip or JSON decode. Values
+are deep-copied on the way in and out because callers mutate the dicts they
+get back.
+"""
+import copy
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class MemoryCache:
+    """Thread-safe LRU mapping of cache keys to JSON-like values."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return a copy of the cached value, or None if absent."""
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                return None
+            self._data.move_to_end(key)
+        return copy.deepcopy(value)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a copy of value, evicting the least recently used entries."""
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
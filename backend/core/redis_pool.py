@@ -8,6 +8,9 @@ to improve performance and handle concurrent requests efficiently.
 import logging
 import redis
 import redis.asyncio as aioredis
+from redis.backoff import ExponentialBackoff
+from redis.retry import Retry
+from redis.asyncio.retry import Retry as AsyncRetry
 from typing import Optional
 from core.settings import (
     REDIS_HOST,
@@ -17,6 +20,7 @@ from core.settings import (
     REDIS_CONNECTION_TIMEOUT,
     REDIS_SOCKET_TIMEOUT,
     REDIS_HEALTH_CHECK_INTERVAL,
+    REDIS_RETRY_ATTEMPTS,
 )
 
 logger = logging.getLogger(__name__)
@@ -47,7 +51,12 @@ def get_sync_pool() -> Optional[redis.ConnectionPool]:
             max_connections=REDIS_MAX_CONNECTIONS,
             socket_connect_timeout=REDIS_CONNECTION_TIMEOUT,
             socket_timeout=REDIS_SOCKET_TIMEOUT,
+            # OS-level keepalive so idle pooled connections aren't silently
+            # dropped by NAT/load balancers between health checks
+            socket_keepalive=True,
             retry_on_timeout=True,
+            # Back off and retry transient connection errors instead of failing the call
+            retry=Retry(ExponentialBackoff(), REDIS_RETRY_ATTEMPTS),
             health_check_interval=REDIS_HEALTH_CHECK_INTERVAL,
             decode_responses=True,
         )
@@ -97,7 +106,12 @@ async def get_async_pool() -> Optional[aioredis.ConnectionPool]:
             max_connections=REDIS_MAX_CONNECTIONS,
             socket_connect_timeout=REDIS_CONNECTION_TIMEOUT,
             socket_timeout=REDIS_SOCKET_TIMEOUT,
+            # OS-level keepalive so idle pooled connections aren't silently
+            # dropped by NAT/load balancers between health checks
+            socket_keepalive=True,
             retry_on_timeout=True,
+            # Back off and retry transient connection errors instead of failing the call
+            retry=AsyncRetry(ExponentialBackoff(), REDIS_RETRY_ATTEMPTS),
             health_check_interval=REDIS_HEALTH_CHECK_INTERVAL,
             decode_responses=True,
         )
@@ -7,6 +7,7 @@ REDIS_DB = int(os.getenv("REDIS_DB", "0"))
 
 JOB_TTL_SECONDS = int(os.getenv("JOB_TTL_SECONDS", "3600"))
 VERSION_TTL_SECONDS = int(os.getenv("VERSION_TTL_SECONDS", "86400"))  # 24 hours
+MAX_VERSIONS_PER_RESUME = int(os.getenv("MAX_VERSIONS_PER_RESUME", "100"))  # Oldest dropped beyond this
 
 # File upload limits
 MAX_FILE_SIZE_MB = int(os.getenv("MAX_FILE_SIZE_MB", "10"))
@@ -32,6 +33,7 @@ REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
 REDIS_CONNECTION_TIMEOUT = int(os.getenv("REDIS_CONNECTION_TIMEOUT", "5"))
 REDIS_SOCKET_TIMEOUT = int(os.getenv("REDIS_SOCKET_TIMEOUT", "5"))
 REDIS_HEALTH_CHECK_INTERVAL = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", "30"))
+REDIS_RETRY_ATTEMPTS = int(os.getenv("REDIS_RETRY_ATTEMPTS", "3"))
 
 # PostgreSQL settings
 DATABASE_URL = os.getenv(
@@ -0,0 +1,68 @@
+# core/singleflight.py
+"""
+In-flight call deduplication ("singleflight").
+
+When several requests need the same expensive result at the same time (e.g.
+the same JD submitted by many users at once), only the first caller runs the
+work; the others wait for and share its result instead of firing duplicate
+LLM calls. Nothing is kept once the call finishes - persistent caching is
+the job of core.cache.
+"""
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+_inflight: Dict[Hashable, Future] = {}
+_inflight_lock = threading.Lock()
+
+_inflight_async: Dict[Hashable, asyncio.Task] = {}
+
+
+def run_once(key: Hashable, fn: Callable[[], Any]) -> Any:
+    """
+    Run ``fn()`` unless a call for ``key`` is already running in another
+    thread, in which case wait for that call and return its result (or
+    re-raise its exception).
+    """
+    with _inflight_lock:
+        pending = _inflight.get(key)
+        is_leader = pending is None
+        if is_leader:
+            pending = _inflight[key] = Future()
+
+    if not is_leader:
+        return pending.result()
+
+    try:
+        result = fn()
+        pending.set_result(result)
+        return result
+    except BaseException as e:
+        pending.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+
+
+async def run_once_async(key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Async variant of run_once for callers on the same event loop.
+
+    Waiters are shielded, so one caller being cancelled does not cancel the
+    shared call for the others.
+    """
+    loop = asyncio.get_running_loop()
+    task = _inflight_async.get(key)
+    if task is None or task.get_loop() is not loop:
+        task = loop.create_task(fn())
+        _inflight_async[key] = task
+
+        def _forget(done: asyncio.Task) -> None:
+            if _inflight_async.get(key) is done:
+                del _inflight_async[key]
+
+        task.add_done_callback(_forget)
+
+    return await asyncio.shield(task)
@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+
+from agents.jd_analyzer import _empty_jd_analysis
+
+
+RESUME = "Senior backend engineer building Java services with Spring Boot on Kubernetes"
+JD = "Senior backend engineer: Java, Spring Boot, Kubernetes, Docker"
+
+
+def _run_compare(mocker, jd_data, rewritten):
+    from api.routes import compare_ats
+
+    mocker.patch("api.files.extract_text_async", return_value=RESUME)
+    mocker.patch("agents.resume_parser.parse_resume_async", return_value=None)
+    mocker.patch("agents.jd_analyzer.analyze_jd_async", return_value=jd_data)
+    mocker.patch("agents.resume_rewriter.rewrite_async", return_value=rewritten)
+    mocker.patch("core.cache_async.get_cached_ats_compare_async", return_value=None)
+    store = mocker.patch("core.cache_async.set_cached_ats_compare_async", return_value=True)
+
+    response = asyncio.run(compare_ats(
+        job_description=JD,
+        jd_file=None,
+        resume=object(),
+        force_refresh=False,
+    ))
+    return response, store
+
+
+REWRITE = {
+    "summary": "Backend engineer shipping Java and Spring Boot services",
+    "experience": [{"title": "Backend Engineer", "bullets": ["Deployed Java services on Kubernetes"]}],
+    "skills": ["Java"],
+}
+
+
+def test_compare_caches_complete_response(mocker):
+    jd_data = {"required_skills": ["Java", "Kubernetes"], "optional_skills": [], "tools": ["Docker"]}
+
+    response, store = _run_compare(mocker, jd_data, REWRITE)
+
+    store.assert_called_once_with(JD, RESUME, response)
+
+
+@pytest.mark.parametrize("jd_data", [
+    _empty_jd_analysis("LLM timeout"),
+    {"required_skills": [], "optional_skills": [], "tools": []},
+], ids=["jd_analysis_error", "no_jd_keywords"])
+def test_compare_does_not_cache_degraded_response(mocker, jd_data):
+    response, store = _run_compare(mocker, jd_data, REWRITE)
+
+    assert "before" in response
+    store.assert_not_called()
+
+
+def test_compare_cache_hit_skips_resume_parse(mocker):
+    from api.routes import compare_ats
+
+    cached = {"before": {"score": 70}}
+    mocker.patch("api.files.extract_text_async", return_value=RESUME)
+    mocker.patch("core.cache_async.get_cached_ats_compare_async", return_value=cached)
+    parse = mocker.patch("agents.resume_parser.parse_resume_async")
+
+    response = asyncio.run(compare_ats(
+        job_description=JD,
+        jd_file=None,
+        resume=object(),
+        force_refresh=False,
+    ))
+
+    assert response == cached
+    parse.assert_not_called()
@@ -1,4 +1,4 @@
-from agents.ats_scorer import score, _match_keyword, _tokenize
+from agents.ats_scorer import score, _match_keyword, _match_keywords, _tokenize
 
 
 def test_ats_score_full_match():
@@ -60,3 +60,55 @@ def test_normalization_variations():
     # Should match Node.js
     match = _match_keyword("Node.js", tokens)
     assert match in ["exact", "alias", "fuzzy"]
+
+
+def test_alias_context_and_composite_matching():
+    """Precomputed alias/context/composite tables resolve the same as before"""
+    tokens = _tokenize("Deployed containerized services on k8s with Spring")
+
+    assert _match_keyword("Kubernetes", tokens, enable_fuzzy=False) == "alias"
+    assert _match_keyword("Docker", tokens, enable_fuzzy=False) == "context"
+    assert _match_keyword("Java", tokens, enable_fuzzy=False) == "composite"
+    assert _match_keyword("GraphQL", tokens, enable_fuzzy=False) is None
+
+
+def test_match_keywords_agrees_with_single_keyword_matcher():
+    """Batch matcher returns the same match types as per-keyword matching"""
+    tokens = _tokenize(
+        "Senior engineer: Java, Spring, REST API design, dockerized microservice "
+        "deployments on AWS with caching and Postgres"
+    )
+    keywords = [
+        "Java", "Spring Boot", "Docker", "Redis", "Microservices", "PostgreSQL",
+        "Amazon Web Services", "JSON", "Kafka", "Relational Databases", "Java",
+    ]
+
+    assert _match_keywords(keywords, tokens) == [
+        _match_keyword(kw, tokens) for kw in keywords
+    ]
+
+
+def test_score_detailed_pins_mixed_match_type_scores(mocker):
+    """Match-type weights are added per keyword; summing them first changes rounding"""
+    from agents.ats_scorer import score_detailed
+
+    match_types = {
+        ("Java", "Kafka"): ["exact", None],
+        ("Docker",): ["composite"],
+        ("Redis", "AWS"): ["exact", "context"],
+    }
+    mocker.patch("agents.ats_scorer._match_keywords", side_effect=lambda kws, tokens: match_types[tuple(kws)])
+    mocker.patch("core.cache.get_cached_ats_score", return_value=None)
+    mocker.patch("core.cache.set_cached_ats_score", return_value=True)
+
+    result = score_detailed(
+        {"required_skills": ["Java", "Kafka"], "tools": ["Docker"], "optional_skills": ["Redis", "AWS"]},
+        "resume",
+    )
+
+    # (3*1.0 + 2*0.85 + 1*1.0 + 1*0.9) / 10 = 0.66; summing weights per category first gives 0.6599... -> 65
+    assert result["score"] == 66
+    assert result["matched_keywords"] == {
+        "required_skills": ["Java"], "tools": ["Docker"], "optional_skills": ["Redis", "AWS"],
+    }
+    assert result["missing_required"] == ["Kafka"]
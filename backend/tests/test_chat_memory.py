@@ -0,0 +1,44 @@
+import pytest
+
+from agents import chat_memory
+from agents.chat_memory import add_chat_message, clear_chat_memory, get_chat_memory
+
+
+@pytest.fixture(autouse=True)
+def empty_store(monkeypatch):
+    monkeypatch.setattr(chat_memory, "_chat_memory", type(chat_memory._chat_memory)())
+
+
+def test_history_keeps_last_max_messages(monkeypatch):
+    monkeypatch.setattr(chat_memory, "MAX_MESSAGES", 3)
+
+    for n in range(5):
+        add_chat_message("r1", "user", f"message {n}")
+
+    assert [m["content"] for m in get_chat_memory("r1")] == ["message 2", "message 3", "message 4"]
+
+
+def test_least_recently_used_session_is_evicted(monkeypatch):
+    monkeypatch.setattr(chat_memory, "MAX_CHAT_SESSIONS", 2)
+
+    add_chat_message("r1", "user", "hi")
+    add_chat_message("r2", "user", "hi")
+    get_chat_memory("r1")  # r1 is now more recent than r2
+    add_chat_message("r3", "user", "hi")
+
+    assert list(chat_memory._chat_memory) == ["r1", "r3"]
+    assert get_chat_memory("r2") == []
+
+
+def test_get_unknown_id_does_not_insert():
+    assert get_chat_memory("missing") == []
+    assert "missing" not in chat_memory._chat_memory
+
+
+def test_returned_history_is_a_copy_and_clear_drops_it():
+    add_chat_message("r1", "user", "hi")
+    get_chat_memory("r1").append({"role": "user", "content": "injected"})
+
+    assert len(get_chat_memory("r1")) == 1
+    clear_chat_memory("r1")
+    assert "r1" not in chat_memory._chat_memory
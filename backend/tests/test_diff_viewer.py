@@ -1,6 +1,8 @@
 """
 Tests for diff_viewer module - Resume Versioning UI
 """
+import random
+
 import pytest
 from agents.diff_viewer import (
     diff_resume_structured,
@@ -8,6 +10,7 @@ from agents.diff_viewer import (
     calculate_change_statistics,
     _diff_section,
     _diff_experience,
+    _diff_bullets,
     _diff_skills,
     _diff_education,
     _diff_certifications,
@@ -70,6 +73,12 @@ class TestDiffSkills:
         assert "Go" in result["removed"]
         assert len(result["added"]) == 0
     
+    def test_changes_keep_list_order(self):
+        """Test added/removed skills come back in list order"""
+        result = _diff_skills(["Rust", "Python", "Java"], ["Python", "Go", "Kafka", "Go", "Docker"])
+        assert result["added"] == ["Go", "Kafka", "Docker"]
+        assert result["removed"] == ["Rust", "Java"]
+    
     def test_mixed_changes(self):
         """Test both added and removed skills"""
         result = _diff_skills(["Python", "Java"], ["Python", "Go"])
@@ -115,7 +124,47 @@ class TestDiffExperience:
         assert len(result) == 1
         assert result[0]["action"] == "modified"
         assert "bullets_diff" in result[0]
-
+    
+    def test_bullet_edits_and_reorders(self):
+        """Test edited bullets stay added/removed and reordered ones are ignored"""
+        before = [{"title": "Engineer", "bullets": [
+            "Built APIs in Java", "Led team of 5", "Wrote docs",
+        ]}]
+        after = [{"title": "Engineer", "bullets": [
+            "Led team of 5", "Built APIs in Java and Go", "Mentored interns",
+        ]}]
+        bullets_diff = _diff_experience(before, after)[0]["bullets_diff"]
+        assert bullets_diff["added"] == ["Built APIs in Java and Go", "Mentored interns"]
+        assert bullets_diff["removed"] == ["Built APIs in Java", "Wrote docs"]
+        assert bullets_diff["modified"] == []
+    
+    def test_bullet_diff_matches_pairwise_comparison(self):
+        """Test the indexed bullet diff classifies exactly like comparing every pair"""
+        def pairwise(before, after):
+            added = [b for b in after if b not in before]
+            removed = [b for b in before if b not in after]
+            modified = []
+            for b_bullet in before:
+                if b_bullet not in removed:
+                    for a_bullet in after:
+                        if a_bullet not in added and b_bullet != a_bullet:
+                            if b_bullet.split()[0:3] == a_bullet.split()[0:3]:
+                                modified.append({"before": b_bullet, "after": a_bullet})
+                                break
+            return added, removed, modified
+        
+        pool = [
+            "Built APIs in Java", "Built APIs in Go", "Built APIs in Java and Go",
+            "Led team of 5", "Led team of 8", "Wrote docs", "Mentored interns",
+        ]
+        rng = random.Random(7)
+        for _ in range(500):
+            before = rng.choices(pool, k=rng.randint(0, 6))
+            after = rng.choices(pool, k=rng.randint(0, 6))
+            result = _diff_bullets(before, after)
+            assert (result["added"], result["removed"], result["modified"]) == (
+                pairwise(before, after) if before != after else ([], [], [])
+            )
 
 class TestDiffResumeStructured:
     """Test diff_resume_structured function"""
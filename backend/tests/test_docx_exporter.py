@@ -0,0 +1,36 @@
+import zipfile
+
+from agents.exporters.docx_exporter import export_docx, new_document
+
+
+RESUME = {
+    "summary": "Backend engineer",
+    "experience": [{"title": "Engineer", "bullets": ["Built APIs", "Ran Kafka"]}],
+    "skills": ["Java", "Python"],
+}
+
+
+def _parts(path):
+    with zipfile.ZipFile(path) as archive:
+        return {name: archive.read(name) for name in archive.namelist()}
+
+
+def test_consecutive_exports_are_identical(tmp_path):
+    first, second = tmp_path / "first.docx", tmp_path / "second.docx"
+
+    export_docx(RESUME, str(first))
+    export_docx(RESUME, str(second))
+
+    assert _parts(first) == _parts(second)
+
+
+def test_new_documents_do_not_share_state():
+    doc = new_document()
+    doc.add_paragraph("leaked")
+    doc.styles.add_style("Leaked", 1)
+    doc.sections[0].left_margin = 0
+
+    fresh = new_document()
+    assert fresh.paragraphs == []
+    assert "Leaked" not in [style.name for style in fresh.styles]
+    assert fresh.sections[0].left_margin != 0
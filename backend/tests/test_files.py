@@ -0,0 +1,66 @@
+import io
+from concurrent.futures import TimeoutError as PoolTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+import api.files as files
+
+
+def _multi_page_pdf(page_count: int) -> bytes:
+    from pypdf import PdfWriter
+    from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+    writer = PdfWriter()
+    font = writer._add_object(DictionaryObject({
+        NameObject("/Type"): NameObject("/Font"),
+        NameObject("/Subtype"): NameObject("/Type1"),
+        NameObject("/BaseFont"): NameObject("/Helvetica"),
+    }))
+    for number in range(page_count):
+        page = writer.add_blank_page(612, 792)
+        content = DecodedStreamObject()
+        content.set_data(f"BT /F1 12 Tf 72 720 Td (Resume page {number}) Tj ET".encode())
+        page[NameObject("/Contents")] = writer._add_object(content)
+        page[NameObject("/Resources")] = DictionaryObject({
+            NameObject("/Font"): DictionaryObject({NameObject("/F1"): font}),
+        })
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def parallel_pdf_pool(monkeypatch):
+    monkeypatch.setattr(files, "_PDF_PARALLEL_MIN_PAGES", 2)
+    monkeypatch.setattr(files, "_PDF_PROCESS_WORKERS", 2)
+    monkeypatch.setattr(files, "_pdf_process_pool", None)
+    yield
+    files.shutdown_pdf_process_pool()
+
+
+def test_parallel_pdf_extraction_keeps_page_order(parallel_pdf_pool, monkeypatch):
+    data = _multi_page_pdf(5)
+
+    parallel_pages = files._extract_pdf_pages_parallel(io.BytesIO(data), 5)
+    parallel_text = files._extract_pdf(io.BytesIO(data))
+    monkeypatch.setattr(files, "_PDF_PARALLEL_MIN_PAGES", 100)
+    serial_text = files._extract_pdf(io.BytesIO(data))
+
+    assert parallel_pages == [f"Resume page {n}" for n in range(5)]
+    assert parallel_text == serial_text
+
+
+@pytest.mark.parametrize("error", [BrokenProcessPool, PoolTimeoutError], ids=["broken", "timeout"])
+def test_failed_pdf_pool_is_rebuilt(parallel_pdf_pool, monkeypatch, error):
+    def failing_map(*args, **kwargs):
+        raise error("worker failed")
+
+    data = _multi_page_pdf(4)
+    failed = files._get_pdf_process_pool()
+    monkeypatch.setattr(failed, "map", failing_map)
+
+    assert files._extract_pdf_pages_parallel(io.BytesIO(data), 4) is None
+    assert files._pdf_process_pool is None
+    assert files._extract_pdf_pages_parallel(io.BytesIO(data), 4) == [f"Resume page {n}" for n in range(4)]
+    assert files._pdf_process_pool is not failed
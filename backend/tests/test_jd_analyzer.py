@@ -21,8 +21,85 @@ def test_jd_analyzer_handles_invalid_json(mocker):
         return_value="NOT JSON",
     )
 
-    result = analyze_jd("bad jd")
+    result = analyze_jd("Backend engineer, Python and Postgres")
 
     assert result["role"] == ""
     assert "error" in result
 
+
+def test_jd_analyzer_skips_llm_for_empty_jd(mocker):
+    spy = mocker.patch("agents.jd_analyzer._llm_call")
+
+    result = analyze_jd("  \n\t \n ok\n")
+
+    assert not spy.called
+    assert result["required_skills"] == []
+    assert "error" in result
+
+
+
+def test_jd_analyzer_reuses_analysis_for_reformatted_jd(mocker, mock_jd_llm_output):
+    spy = mocker.patch(
+        "agents.jd_analyzer._llm_call",
+        return_value=mock_jd_llm_output,
+    )
+
+    first = analyze_jd("Staff platform engineer\nGo and   Kubernetes on AWS")
+    first["required_skills"].append("Mutated")
+    second = analyze_jd("  staff platform engineer\n\ngo and kubernetes on aws  ")
+
+    assert spy.call_count == 1
+    assert "Mutated" not in second["required_skills"]
+    assert second["role"] == "Backend Engineer"
+
+
+def test_jd_analyzer_shares_concurrent_llm_calls(mocker, mock_jd_llm_output):
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    calls = []
+    release = threading.Event()
+
+    def slow_llm(prompt):
+        calls.append(prompt)
+        release.wait(timeout=5)
+        return mock_jd_llm_output
+
+    mocker.patch("agents.jd_analyzer._llm_call", side_effect=slow_llm)
+
+    jd = "Principal data engineer with Spark and Airflow"
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(analyze_jd, jd) for _ in range(4)]
+        time.sleep(0.2)
+        release.set()
+        results = [f.result() for f in futures]
+
+    assert len(calls) == 1
+    assert all(r["role"] == "Backend Engineer" for r in results)
+
+
+def test_safe_json_takes_first_object_from_prose():
+    from agents.jd_analyzer import _safe_json
+
+    text = 'Here you go: {"role": "SRE", "tools": ["{braces}"]} Note: {not json}'
+
+    assert _safe_json(text) == {"role": "SRE", "tools": ["{braces}"]}
+    assert _safe_json('{"role": "SRE", "tools": ["Go",],}') == {"role": "SRE", "tools": ["Go"]}
+
+
+def test_jd_analyzer_async_builds_keywords_from_string_fields(mocker):
+    import asyncio
+    from agents.jd_analyzer import analyze_jd_async
+
+    mocker.patch(
+        "agents.jd_analyzer._llm_call_async",
+        return_value='{"role": "Data Engineer", "required_skills": ["Python", "Spark"], '
+                     '"optional_skills": "Airflow", "tools": ["Spark", "dbt"]}',
+    )
+    mocker.patch("core.cache_async.get_cached_jd_async", return_value=None)
+    mocker.patch("core.cache_async.set_cached_jd_async", return_value=True)
+
+    result = asyncio.run(analyze_jd_async("Data engineer building Spark and Airflow pipelines in Python"))
+
+    assert result["ats_keywords"] == ["Python", "Spark", "Airflow", "dbt"]
@@ -0,0 +1,59 @@
+import pytest
+
+pytest.importorskip("reportlab")
+
+from pypdf import PdfReader
+
+from agents.templates.pdf_renderer import render_pdf
+
+
+LONG_TOKEN = "https://example.com/" + "portfolio" * 30
+
+
+def _resume():
+    return {
+        "contact": {"name": "Jane Doe", "email": "jane@example.com"},
+        "summary": "Engineer for R&D teams\nshipping latency < 10ms services",
+        "experience": [
+            {
+                "title": f"Backend Engineer {n}",
+                "company": "Smith & Sons",
+                "bullets": [f"Cut p99 latency to < {n}ms for A&B testing platform" for _ in range(6)],
+            }
+            for n in range(12)
+        ],
+        "skills": ["Python", "C++", "AT&T <internal> tooling"],
+        "projects": [{"name": "Portfolio", "description": LONG_TOKEN}],
+    }
+
+
+def test_multi_page_resume_text_survives():
+    reader = PdfReader(render_pdf(_resume(), template_id="classic"))
+    text = "\n".join(page.extract_text() for page in reader.pages)
+
+    assert len(reader.pages) > 1
+    assert "Smith & Sons" in text
+    assert "latency to < 11ms for A&B testing" in text
+    assert "AT&T <internal> tooling" in text
+    # Embedded newlines collapse to a space, as in a platypus Paragraph
+    assert "R&D teams shipping latency < 10ms services" in text
+    # Words wider than the frame are split across lines, not dropped
+    assert LONG_TOKEN in "".join(text.split())
+
+
+def test_wrapped_lines_use_fixed_leading():
+    from agents.templates.registry import get_template
+
+    summary = " ".join(["experienced"] * 60)
+    reader = PdfReader(render_pdf({"summary": summary}, template_id="executive"))
+    baselines = []
+    reader.pages[0].extract_text(
+        visitor_text=lambda text, cm, tm, font, size: (
+            baselines.append(tm[5] * cm[3] + cm[5]) if "experienced" in text else None
+        )
+    )
+
+    # ParagraphStyle's default 12pt leading, whatever the font size
+    assert get_template("executive")["body_size"] != 10
+    assert len(baselines) > 2
+    assert {round(a - b, 3) for a, b in zip(baselines, baselines[1:])} == {12}
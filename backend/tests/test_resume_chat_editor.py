@@ -0,0 +1,22 @@
+from agents.resume_chat_editor import apply_chat_edit, preview_chat_edit
+
+
+def test_chat_edits_do_not_mutate_original_resume(mocker):
+    mocker.patch(
+        "agents.resume_chat_editor._rewrite_text",
+        return_value="Rebuilt payment APIs in Java",
+    )
+    resume = {
+        "skills": ["Java", "SQL"],
+        "experience": [{"title": "Engineer", "bullets": ["Built payment APIs"]}],
+    }
+
+    preview = preview_chat_edit(resume, {"action": "add_skill", "skill": "Kafka"})
+    edited = apply_chat_edit(resume, {"action": "rewrite_bullet", "index": 0, "exp_index": 0})
+
+    assert preview["resume_preview"]["skills"] == ["Java", "SQL", "Kafka"]
+    assert edited["experience"][0]["bullets"] == ["Rebuilt payment APIs in Java"]
+    assert resume == {
+        "skills": ["Java", "SQL"],
+        "experience": [{"title": "Engineer", "bullets": ["Built payment APIs"]}],
+    }
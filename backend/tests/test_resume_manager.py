@@ -0,0 +1,171 @@
+import pytest
+from redis.exceptions import WatchError
+
+from agents import resume_manager
+from agents.resume_manager import (
+    create_application,
+    create_resume,
+    get_dashboard_stats,
+    get_resume,
+    update_resume,
+)
+from core import json_codec
+
+
+class _FakeRedis:
+    """In-memory stand-in for the commands resume_manager uses, with WATCH support."""
+
+    def __init__(self):
+        self.data = {}
+        self.versions = {}  # bumped on every write, checked by WATCH
+        self.executed = []  # command names of each successful MULTI/EXEC
+
+    def _touch(self, key):
+        self.versions[key] = self.versions.get(key, 0) + 1
+
+    # -- commands --
+    def get(self, key):
+        return self.data.get(key)
+
+    def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+        self._touch(key)
+
+    def sadd(self, key, member):
+        self.data.setdefault(key, set()).add(member)
+        self._touch(key)
+
+    def smembers(self, key):
+        return set(self.data.get(key, set()))
+
+    def expire(self, key, ttl):
+        pass
+
+    def delete(self, key):
+        if self.data.pop(key, None) is not None:
+            self._touch(key)
+
+    def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        self._touch(key)
+        return int(self.data[key])
+
+    # -- transactions --
+    def transaction(self, func, *watches):
+        while True:
+            pipe = _FakePipeline(self, watches)
+            try:
+                func(pipe)
+                return pipe.execute()
+            except WatchError:
+                continue
+
+
+class _FakePipeline:
+    def __init__(self, client, watches):
+        self.client = client
+        self.watched = {key: client.versions.get(key, 0) for key in watches}
+        self.queued = None  # None until multi(): commands run immediately
+
+    def multi(self):
+        self.queued = []
+
+    def execute(self):
+        if any(self.client.versions.get(key, 0) != version for key, version in self.watched.items()):
+            raise WatchError("watched key changed")
+        results = [getattr(self.client, name)(*args) for name, args in self.queued]
+        self.client.executed.append([(name, args[0]) for name, args in self.queued])
+        return results
+
+    def __getattr__(self, name):
+        command = getattr(self.client, name)
+
+        def call(*args):
+            if self.queued is None:
+                return command(*args)
+            self.queued.append((name, args))
+            return self
+
+        return call
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    fake = _FakeRedis()
+    monkeypatch.setattr(resume_manager, "redis_client", fake)
+    return fake
+
+
+def test_dashboard_stats_are_cached_until_a_write(fake_redis, monkeypatch):
+    create_resume({}, title="First")
+    assert get_dashboard_stats()["total_resumes"] == 1
+
+    list_resumes = resume_manager.list_resumes
+    monkeypatch.setattr(resume_manager, "list_resumes", lambda *a: pytest.fail("cache not used"))
+    assert get_dashboard_stats()["total_resumes"] == 1
+
+    monkeypatch.setattr(resume_manager, "list_resumes", list_resumes)
+    create_resume({}, title="Second")
+    assert get_dashboard_stats()["total_resumes"] == 2
+
+
+def test_write_during_dashboard_compute_is_not_cached_stale(fake_redis, monkeypatch):
+    resume_id = create_resume({}, title="Before")
+    list_resumes = resume_manager.list_resumes
+
+    def list_then_rename(*args):
+        resumes = list_resumes(*args)
+        update_resume(resume_id, title="After")  # invalidates after the read
+        return resumes
+
+    monkeypatch.setattr(resume_manager, "list_resumes", list_then_rename)
+    assert get_dashboard_stats()["resumes"][0]["title"] == "Before"
+
+    monkeypatch.setattr(resume_manager, "list_resumes", list_resumes)
+    assert get_dashboard_stats()["resumes"][0]["title"] == "After"
+
+
+def test_create_application_retries_when_resume_changes(fake_redis, monkeypatch):
+    resume_id = create_resume({}, title="Before")
+    attempts = []
+    get = fake_redis.get
+
+    def get_with_concurrent_rename(key):
+        value = get(key)
+        if key == resume_manager._resume_key(resume_id) and len(attempts) < 2:
+            attempts.append(key)
+            if len(attempts) == 1:
+                update_resume(resume_id, title="After")  # lands between WATCH and EXEC
+        return value
+
+    monkeypatch.setattr(fake_redis, "get", get_with_concurrent_rename)
+    application_id = create_application(resume_id, "JD text", ats_score=80, status="interview")
+
+    assert len(attempts) == 2  # first EXEC hit WatchError, second succeeded
+    resume = get_resume(resume_id)
+    assert resume["title"] == "After"  # concurrent write not overwritten
+    assert resume["application_count"] == 1
+    assert resume["stats"]["interviews"] == 1
+    assert json_codec.loads(fake_redis.data[resume_manager._application_key(application_id)])["ats_score"] == 80
+
+
+def test_create_application_invalidates_dashboard_inside_transaction(fake_redis):
+    resume_id = create_resume({}, title="Resume")
+    assert get_dashboard_stats()["total_applications"] == 0
+
+    application_id = create_application(resume_id, "JD text")
+
+    # One MULTI/EXEC batch, with the dashboard invalidation inside it
+    assert fake_redis.executed == [[
+        ("setex", resume_manager._application_key(application_id)),
+        ("sadd", resume_manager._application_list_key(resume_id)),
+        ("expire", resume_manager._application_list_key(resume_id)),
+        ("setex", resume_manager._resume_key(resume_id)),
+        ("incr", resume_manager._dashboard_generation_key()),
+        ("expire", resume_manager._dashboard_generation_key()),
+        ("delete", resume_manager._dashboard_key()),
+    ]]
+    assert get_dashboard_stats()["total_applications"] == 1
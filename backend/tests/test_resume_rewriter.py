@@ -25,3 +25,123 @@ def test_resume_rewriter_failure(mocker):
 
     assert result["experience"] == []
     assert "error" in result
+
+
+def test_validate_rewrite_keeps_text_with_grounded_keywords():
+    from agents.resume_rewriter import validate_rewrite
+
+    original = "Built services in Java and Kafka"
+    rewritten = {
+        "summary": "Seasoned engineer focused on distributed Kafka pipelines",
+        "experience": [{
+            "title": "Engineer",
+            "bullets": ["Drove platform adoption using Java tooling", "Shipped Rust prototypes"],
+        }],
+    }
+    allowed = {"explicit": ["Kafka", "Rust"], "derived": []}
+
+    result = validate_rewrite(rewritten, original, allowed, {"core": ["java"]})
+
+    assert result["summary"] == rewritten["summary"]
+    assert result["experience"][0]["bullets"] == ["Drove platform adoption using Java tooling"]
+
+
+def test_coerce_rewrite_drops_malformed_items():
+    from agents.resume_rewriter import _coerce_rewrite
+
+    data = {
+        "summary": None,
+        "experience": ["Engineer at Acme", {"title": "Engineer", "bullets": ["Built APIs", 3]}],
+        "skills": ["Java", {"name": "Go"}],
+    }
+
+    assert _coerce_rewrite(data) == {
+        "summary": "",
+        "experience": [{"title": "Engineer", "bullets": ["Built APIs"]}],
+        "skills": ["Java"],
+    }
+
+
+def test_resume_rewriter_shares_concurrent_llm_calls(mocker, mock_resume_llm_output):
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    calls = []
+    release = threading.Event()
+
+    def slow_llm(prompt):
+        calls.append(prompt)
+        release.wait(timeout=5)
+        return mock_resume_llm_output
+
+    mocker.patch("agents.resume_rewriter._llm_call", side_effect=slow_llm)
+
+    jd_keywords = {"explicit": ["Java", "Kubernetes"], "derived": []}
+    resume = "Java developer deploying services on Kubernetes with Spring Boot"
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futures = [pool.submit(rewrite, jd_keywords, resume) for _ in range(3)]
+        time.sleep(0.2)
+        release.set()
+        results = [f.result() for f in futures]
+
+    assert len(calls) == 1
+    assert all(len(r["experience"]) == 1 for r in results)
+
+
+def test_resume_rewriter_reuses_rewrite_for_respaced_resume(mocker, mock_resume_llm_output):
+    spy = mocker.patch(
+        "agents.resume_rewriter._llm_call",
+        return_value=mock_resume_llm_output,
+    )
+
+    jd_keywords = {"explicit": ["Java", "Spring Boot"], "derived": []}
+    first = rewrite(jd_keywords, "Java engineer building Spring Boot services on Kubernetes")
+    first["experience"].clear()
+    second = rewrite(jd_keywords, "Java engineer building  Spring Boot services\non Kubernetes ")
+
+    assert spy.call_count == 1
+    assert len(second["experience"]) == 1
+
+
+def test_rewrite_many_async_runs_rewrites_concurrently(mocker, mock_resume_llm_output):
+    import asyncio
+    from agents.resume_rewriter import rewrite_many_async
+
+    in_flight = []
+    peak = []
+
+    async def slow_llm(prompt):
+        in_flight.append(prompt)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.05)
+        in_flight.remove(prompt)
+        return mock_resume_llm_output
+
+    mocker.patch("agents.resume_rewriter._llm_call_async", side_effect=slow_llm)
+
+    items = [
+        {"jd_keywords": {"explicit": ["Java"], "derived": []}, "resume": f"Java engineer on team {i}"}
+        for i in range(3)
+    ]
+    results = asyncio.run(rewrite_many_async(items, max_concurrent=2))
+
+    assert max(peak) == 2
+    assert [len(r["experience"]) for r in results] == [1, 1, 1]
+
+
+def test_resume_rewriter_does_not_cache_failed_llm_calls(mocker):
+    from agents.resume_rewriter import _REWRITE_FALLBACK_JSON
+
+    spy = mocker.patch(
+        "agents.resume_rewriter._llm_call",
+        return_value=_REWRITE_FALLBACK_JSON,
+    )
+
+    jd_keywords = {"explicit": ["Go"], "derived": []}
+    resume = "Go engineer maintaining payment services"
+    first = rewrite(jd_keywords, resume)
+    second = rewrite(jd_keywords, resume)
+
+    assert "error" in first and "error" in second
+    assert spy.call_count == 2
@@ -0,0 +1,132 @@
+import pytest
+
+from agents import resume_versions
+from agents.resume_versions import (
+    get_current_version,
+    redo_version,
+    save_new_version,
+    undo_version,
+)
+
+
+class _FakeRedis:
+    """In-memory stand-in for the string/list commands resume_versions uses."""
+
+    def __init__(self):
+        self.data = {}
+
+    # -- commands --
+    def get(self, key):
+        return self.data.get(key)
+
+    def setex(self, key, ttl, value):
+        self.data[key] = str(value)
+
+    def expire(self, key, ttl):
+        pass
+
+    def llen(self, key):
+        return len(self.data.get(key, []))
+
+    def lindex(self, key, index):
+        items = self.data.get(key, [])
+        return items[index] if -len(items) <= index < len(items) else None
+
+    def rpush(self, key, value):
+        self.data.setdefault(key, []).append(value)
+
+    def ltrim(self, key, start, stop):
+        items = self.data.get(key, [])
+        n = len(items)
+        start = max(start + n if start < 0 else start, 0)
+        stop = stop + n if stop < 0 else stop
+        self.data[key] = items[start:stop + 1]
+
+    # -- pipelines --
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+    def transaction(self, func, *watches):
+        pipe = _FakePipeline(self, immediate=True)
+        func(pipe)
+        return pipe.execute()
+
+
+class _FakePipeline:
+    def __init__(self, client, immediate=False):
+        self.client = client
+        self.immediate = immediate
+        self.queued = []
+
+    def multi(self):
+        self.immediate = False
+
+    def execute(self):
+        results = [getattr(self.client, name)(*args) for name, args in self.queued]
+        self.queued = []
+        return results
+
+    def __getattr__(self, name):
+        command = getattr(self.client, name)
+
+        def call(*args):
+            if self.immediate:
+                return command(*args)
+            self.queued.append((name, args))
+            return self
+
+        return call
+
+
+@pytest.fixture
+def store(monkeypatch):
+    fake = _FakeRedis()
+    monkeypatch.setattr(resume_versions, "redis_client", fake)
+    monkeypatch.setattr(resume_versions, "MAX_VERSIONS_PER_RESUME", 3)
+    return fake
+
+
+def _save(n):
+    return save_new_version("r1", parent=None, resume={"n": n}, change_summary=f"edit {n}")
+
+
+def _state(fake):
+    versions = fake.data[resume_versions._versions_list_key("r1")]
+    pointer = int(fake.data[resume_versions._pointer_key("r1")])
+    return len(versions), pointer, get_current_version("r1")["resume"]["n"]
+
+
+def test_saves_beyond_cap_keep_latest_versions(store):
+    for n in range(1, 6):
+        _save(n)
+
+    assert _state(store) == (3, 2, 5)
+    assert redo_version("r1") is None
+
+
+def test_undo_after_cap_moves_within_capped_history(store):
+    for n in range(1, 6):
+        _save(n)
+
+    assert undo_version("r1")["resume"]["n"] == 4
+    assert _state(store) == (3, 1, 4)
+    assert undo_version("r1")["resume"]["n"] == 3
+    assert undo_version("r1") is None  # v1/v2 were dropped by the cap
+    assert _state(store) == (3, 0, 3)
+
+
+def test_save_after_undo_drops_redo_history(store):
+    for n in range(1, 6):
+        _save(n)
+    undo_version("r1")  # back to v4; v5 is redo history
+
+    _save(6)
+    assert _state(store) == (3, 2, 6)
+    assert redo_version("r1") is None
+    assert undo_version("r1")["resume"]["n"] == 4
+
+    _save(7)  # at the cap again after dropping v6 as redo history
+    assert _state(store) == (3, 2, 7)
+    assert undo_version("r1")["resume"]["n"] == 4
+    assert undo_version("r1")["resume"]["n"] == 3
+    assert undo_version("r1") is None
@@ -24,3 +24,10 @@ def test_fullstack_role():
     result = detect_role(jd, resume)
 
     assert result["role"] == "fullstack"
+
+
+def test_multi_word_keywords_count_as_signals():
+    result = detect_role("Spring Boot services", "Owned CI/CD and data structures work")
+
+    assert result["signals"]["backend"] == 3
+    assert result["signals"]["infra"] == 1